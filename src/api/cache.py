@@ -0,0 +1,46 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from rest_framework.request import Request
+
+EVENTS_VERSION_KEY: str = "events:version"
+
+
+def get_version(key: str) -> int:
+    """
+    Returns the current value of a shared version counter.
+    A missing counter (never set or evicted) is initialized with a time-based value,
+    so that responses cached under the previous versions are never reused.
+    """
+    version: int | None = cache.get(key)
+    if version is not None:
+        return version
+    cache.add(key, time.time_ns(), timeout=None)
+    return cache.get(key)
+
+
+def bump_version(key: str) -> None:
+    """Increments a shared version counter, invalidating everything cached under it."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def make_response_cache_key(request: Request, prefix: str, version: int) -> str:
+    """
+    Builds a cache key from the request URL with normalized (sorted) query
+    parameters and the version of the cached data.
+    """
+    query_params: list[tuple[str, str]] = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+    )
+    url: str = (
+        f"{request.scheme}://{request.get_host()}{request.path}?"
+        f"{urlencode(query_params)}"
+    )
+    return f"{prefix}:{version}:{hashlib.md5(url.encode()).hexdigest()}"
@@ -1,8 +1,11 @@
 from django.db.models import BooleanField, ExpressionWrapper, Q
 from django.utils import timezone
 from django_filters import rest_framework as rf_filters
+from rest_framework.filters import OrderingFilter
 
+from .services.reference_cache import reference_cache
 from events.models import Event
+from events.search import search_events
 
 
 class CharFilterInFilter(rf_filters.BaseInFilter, rf_filters.CharFilter):
@@ -11,11 +14,28 @@ class CharFilterInFilter(rf_filters.BaseInFilter, rf_filters.CharFilter):
     pass
 
 
+class ReferenceSlugInFilter(CharFilterInFilter):
+    """
+    Filter by comma-separated slugs of a reference, resolved to the primary keys
+    from the in-process reference cache: the events are filtered by the foreign
+    key without joining the reference table.
+    """
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        model = qs.model._meta.get_field(self.field_name).related_model
+        ids: list[int] = reference_cache.get_ids_by_slugs(model, value)
+        return qs.filter(**{f"{self.field_name}__in": ids})
+
+
 class EventsFilter(rf_filters.FilterSet):
     """
     Class for filtering events.
 
     The filter for the 'name' field works on case-insensitive partial occurrence.
+    The 'search' filter performs full-text search by name, description, speaker
+    names and companies, the most relevant events go first.
     The 'is_deleted' filter takes boolean values - True/False.
     The 'is_featured' filter takes True, False, 0 and 1 as value, otherwise
     returns all the events.
@@ -32,11 +52,12 @@ class EventsFilter(rf_filters.FilterSet):
     """
 
     name = rf_filters.CharFilter(method="istartswith_icontains_union_method")
+    search = rf_filters.CharFilter(method="full_text_search_method")
     status = CharFilterInFilter()
     format = CharFilterInFilter()
-    event_type = CharFilterInFilter(field_name="event_type__slug")
-    specializations = CharFilterInFilter(field_name="specializations__slug")
-    city = CharFilterInFilter(field_name="city__slug")
+    event_type = ReferenceSlugInFilter(field_name="event_type")
+    specializations = ReferenceSlugInFilter(field_name="specializations")
+    city = ReferenceSlugInFilter(field_name="city")
     start_date = rf_filters.DateTimeFilter(field_name="start_time", lookup_expr="gte")
     end_date = rf_filters.DateTimeFilter(field_name="start_time", lookup_expr="lte")
     is_registrated = rf_filters.NumberFilter(
@@ -48,6 +69,7 @@ class EventsFilter(rf_filters.FilterSet):
         model = Event
         fields = [
             "name",
+            "search",
             "is_deleted",
             "is_featured",
             "is_registrated",
@@ -79,6 +101,15 @@ class EventsFilter(rf_filters.FilterSet):
             .order_by("-is_start")
         )
 
+    def full_text_search_method(self, queryset, name, value):
+        """
+        Searches events by name, description, speaker names and companies using
+        the full-text search index of the database, ordering them by relevance.
+        """
+        if not value.strip():
+            return queryset
+        return search_events(queryset, value)
+
     def is_registrated_to_event_boolean_method(self, queryset, name, value):
         """
         Shows the authorized user whether this user has registered for the event.
@@ -89,10 +120,9 @@ class EventsFilter(rf_filters.FilterSet):
         user = self.request.user
         if user.is_anonymous:
             return queryset
-        event_ids = [obj.pk for obj in queryset if obj.is_registrated == value]
-        if event_ids:
-            return queryset.filter(pk__in=event_ids)
-        return queryset.none()
+        if "is_registrated" not in queryset.query.annotations:
+            queryset = queryset.with_registration_status(user)
+        return queryset.filter(is_registrated=bool(value))
 
     def event_not_started(self, queryset, name, value):
         """
@@ -105,3 +135,21 @@ class EventsFilter(rf_filters.FilterSet):
                 return queryset.filter(start_time__gt=now)
             return queryset.filter(start_time__lte=now)
         return queryset
+
+
+class EventsOrderingFilter(OrderingFilter):
+    """
+    Ordering filter keeping the ordering set by the filters (e.g. by search
+    relevance) when no valid ordering query parameter is passed.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if params:
+            fields = [param.strip() for param in params.split(",")]
+            ordering = self.remove_invalid_fields(queryset, fields, view, request)
+            if ordering:
+                return ordering
+        if queryset.query.order_by:
+            return [*queryset.query.order_by, "pk"]
+        return self.get_default_ordering(view)
@@ -0,0 +1,280 @@
+import json
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from threading import Thread
+from typing import Any
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import (
+    ThreadedWSGIServer,
+    WSGIRequestHandler,
+    get_internal_wsgi_application,
+)
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from api.loggers import logger
+from api.services.load_testing import (
+    AUTHENTICATED_SCENARIOS,
+    DEFAULT_MIX,
+    LOAD_DATA_EMAIL_DOMAIN,
+    LOAD_DATA_PASSWORD,
+    SCENARIOS,
+    WRITE_SCENARIOS,
+    run_load_test,
+    send_request,
+)
+from config import celery_app
+from events.models import Event
+from users.models import User
+
+LOCAL_HOST: str = "127.0.0.1"
+DEFAULT_DURATION: float = 10.0
+DEFAULT_CONCURRENCY: int = 8
+POOL_THREAD: str = "thread"
+POOL_PROCESS: str = "process"
+# Число мероприятий, среди которых выбираются просматриваемые
+BROWSED_EVENTS_LIMIT: int = 100
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    """Request handler of the in-process server without the access log."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_in_process() -> Iterator[str]:
+    """
+    Serves the WSGI application on a free local port in a background thread
+    and yields the root URL of the API. The server has no broker and mail
+    server: the tasks run eagerly and the mails stay in memory. Silk is
+    disabled like in the benchmarks, it records every request.
+    """
+    task_always_eager: bool = celery_app.conf.task_always_eager
+    celery_app.conf.task_always_eager = True
+    with override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, LOCAL_HOST],
+        MIDDLEWARE=[
+            middleware
+            for middleware in settings.MIDDLEWARE
+            if not middleware.startswith("silk.")
+        ],
+        EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    ):
+        server = ThreadedWSGIServer((LOCAL_HOST, 0), QuietWSGIRequestHandler)
+        server.set_app(get_internal_wsgi_application())
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f"http://{LOCAL_HOST}:{server.server_port}{reverse('api:api-root')}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            celery_app.conf.task_always_eager = task_always_eager
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Parses the weights of the scenarios: anonymous_browse=6,..."""
+    mix: dict[str, int] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in SCENARIOS or not weight.strip().isdigit():
+            raise CommandError(
+                f"Invalid scenario weight {item!r}, expected name=weight with "
+                f"a name from {', '.join(SCENARIOS)}."
+            )
+        mix[name.strip()] = int(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def get_json(
+    base_url: str, method: str, path: str, body: dict[str, Any] | None = None
+) -> Any:
+    """Sends a request of the test preparation, which must succeed."""
+    status, content, _ = send_request(base_url, method, path, body=body)
+    if not 200 <= status < 300:
+        raise CommandError(
+            f"{method} {base_url}{path} failed with status {status}: "
+            f"{content[:500].decode(errors='replace')}"
+        )
+    return json.loads(content)
+
+
+def get_event_ids(base_url: str, **filters: str) -> list[int]:
+    """Returns the ids of the upcoming active events matching the filters."""
+    query: str = urlencode(
+        {
+            "not_started": "true",
+            "is_deleted": "false",
+            "limit": BROWSED_EVENTS_LIMIT,
+            **filters,
+        }
+    )
+    page: dict[str, Any] = get_json(base_url, "GET", f"events/?{query}")
+    return [event["id"] for event in page["results"]]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the throughput of the main API flows: replays weighted mixes "
+        "of scenarios in a pool of workers against the WSGI application served "
+        "in-process or against a running server, and reports the latency "
+        "percentiles, RPS and error rates as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            help=(
+                "Root URL of the API of a running server, e.g. "
+                "https://example.com/api/v1/. By default the application is "
+                "served in-process on a free local port."
+            ),
+        )
+        parser.add_argument(
+            "--mix",
+            default=",".join(
+                f"{name}={weight}" for name, weight in DEFAULT_MIX.items()
+            ),
+            help=f"Weights of the scenarios: {', '.join(SCENARIOS)}.",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=DEFAULT_DURATION,
+            help="Duration of the test in seconds.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help="Number of scenarios run by each worker instead of the duration.",
+        )
+        parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+        parser.add_argument(
+            "--pool",
+            choices=[POOL_THREAD, POOL_PROCESS],
+            default=POOL_THREAD,
+            help=(
+                "Pool of the workers; processes do not share the GIL with each "
+                "other and with the in-process server."
+            ),
+        )
+        parser.add_argument(
+            "--email",
+            help=(
+                "Email of the user of the authenticated scenarios, by default "
+                "the first user created by generate_load_data in-process."
+            ),
+        )
+        parser.add_argument("--password", default=LOAD_DATA_PASSWORD)
+        parser.add_argument(
+            "--allow-writes",
+            action="store_true",
+            help=(
+                "Run the scenarios creating data on the server "
+                f"({', '.join(sorted(WRITE_SCENARIOS))}): the applications are "
+                f"not removed, their emails end with @{LOAD_DATA_EMAIL_DOMAIN}."
+            ),
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="File of the report instead of stdout.")
+
+    def get_token(self, base_url: str, email: str | None, password: str) -> str | None:
+        """Returns the access token of the user of the authenticated scenarios."""
+        if email is None:
+            return None
+        return get_json(
+            base_url, "POST", "auth/jwt/create/", {"email": email, "password": password}
+        )["access"]
+
+    def prepare(
+        self, base_url: str, mix: dict[str, int], options: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Returns the plan of the workers: the browsed events, the event of the
+        registration stampede and the token of the authenticated scenarios.
+        The scenarios without the data they need and the writing scenarios
+        without --allow-writes are excluded with a warning.
+        """
+        if not options["allow_writes"]:
+            for name in WRITE_SCENARIOS:
+                if mix.pop(name, None):
+                    logger.warning(
+                        f"The {name} scenario is excluded: it creates data on "
+                        "the server, pass --allow-writes to run it."
+                    )
+        events: list[int] = get_event_ids(base_url)
+        if not events:
+            raise CommandError(
+                "There are no upcoming events to browse, create them with "
+                "generate_load_data."
+            )
+        hot_events: list[int] = get_event_ids(base_url, status=Event.STATUS_OPEN)
+        token: str | None = self.get_token(
+            base_url, options["email"], options["password"]
+        )
+        unavailable: dict[str, bool] = {
+            "registration_stampede": not hot_events,
+            **{name: token is None for name in AUTHENTICATED_SCENARIOS},
+        }
+        for name, is_unavailable in unavailable.items():
+            if is_unavailable and mix.pop(name, None):
+                logger.warning(f"The {name} scenario is excluded: no data for it.")
+        if not mix:
+            raise CommandError("No scenario of the mix can be run.")
+        return {
+            "base_url": base_url,
+            "mix": mix,
+            "iterations": options["iterations"],
+            "events": events,
+            "hot_event": hot_events[0] if hot_events else None,
+            "token": token,
+            "seed": options["seed"],
+            "run": uuid.uuid4().hex,
+        }
+
+    def handle(self, *args, **options):
+        mix: dict[str, int] = parse_mix(options["mix"])
+        if options["concurrency"] < 1:
+            raise CommandError("The concurrency must be positive.")
+        with (
+            serve_in_process()
+            if options["base_url"] is None
+            else nullcontext(options["base_url"].rstrip("/") + "/")
+        ) as base_url:
+            if options["base_url"] is None and options["email"] is None:
+                user: User | None = (
+                    User.objects.filter(email__endswith=f"@{LOAD_DATA_EMAIL_DOMAIN}")
+                    .order_by("pk")
+                    .first()
+                )
+                options["email"] = user.email if user is not None else None
+            plan: dict[str, Any] = self.prepare(base_url, mix, options)
+            logger.info(
+                f"Load test of {base_url}: {options['concurrency']} "
+                f"{options['pool']} workers, mix {plan['mix']}."
+            )
+            report: dict[str, Any] = run_load_test(
+                plan,
+                options["concurrency"],
+                options["pool"] == POOL_PROCESS,
+                options["duration"],
+            )
+        report = {
+            "base_url": options["base_url"] or "in-process",
+            "pool": options["pool"],
+            "concurrency": options["concurrency"],
+            "mix": plan["mix"],
+            **report,
+        }
+        output: str = json.dumps(report, indent=2)
+        if options["output"] is None:
+            self.stdout.write(output)
+            return
+        with open(options["output"], "w", encoding="utf-8") as f:
+            f.write(output)
+        logger.info(f"The load test report is written to {options['output']}.")
@@ -1,8 +1,19 @@
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Count, Max
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 from rest_framework import response, status
+from rest_framework.exceptions import ValidationError
 
+from .services.reference_cache import reference_cache
 from applications.serializers import DestroyObjectSuccessSerializer
 
 MESSAGE_ON_DELETE = "Объект успешно удален"
+MESSAGE_UNKNOWN_FIELDS = "Неизвестные поля: {fields}."
 
 
 class DestroyWithPayloadMixin(object):
@@ -14,3 +25,163 @@ class DestroyWithPayloadMixin(object):
             DestroyObjectSuccessSerializer({"message": MESSAGE_ON_DELETE}).data,
             status=status.HTTP_200_OK,
         )
+
+
+class ConditionalGetMixin(object):
+    """
+    Mixin to provide ETag and Last-Modified headers for list and retrieve actions
+    and to answer matching conditional requests with 304 Not Modified.
+    The validators are computed from the database state, without serialization.
+    The conditional actions answer with get_not_modified_response themselves:
+    the mixin does not define the actions, so that the router does not route
+    the ones the view does not implement.
+    """
+
+    conditional_actions: tuple[str] = ("list", "retrieve")
+    last_modified_field: str = "updated"
+
+    def get_data_state(self) -> dict[str, Any]:
+        """
+        Returns the number of rows and the time of the last change of the data
+        included in the response, computed once per request.
+        """
+        if not hasattr(self, "_data_state"):
+            self._data_state = (
+                self.get_queryset()
+                .order_by()
+                .aggregate(
+                    count=Count("pk"),
+                    last_pk=Max("pk"),
+                    last_modified=Max(self.last_modified_field),
+                )
+            )
+        return self._data_state
+
+    def get_etag_fingerprint(self) -> Any:
+        """Returns the data identifying the state of the response content."""
+        return self.get_data_state()
+
+    def get_last_modified(self) -> datetime | None:
+        """Returns the time of the last change of the response content."""
+        return self.get_data_state()["last_modified"]
+
+    def get_conditional_validators(self) -> tuple[str, datetime | None] | None:
+        """
+        Returns the strong ETag and the Last-Modified time of the response, computed
+        once per request, or None if the request is not a conditional GET.
+        """
+        if self.request.method not in ("GET", "HEAD"):
+            return None
+        if self.action not in self.conditional_actions:
+            return None
+        if not hasattr(self, "_conditional_validators"):
+            request = self.request
+            state: tuple = (
+                request.path,
+                sorted(request.query_params.lists()),
+                request.accepted_renderer.format,
+                self.get_etag_fingerprint(),
+            )
+            etag: str = quote_etag(hashlib.md5(repr(state).encode()).hexdigest())
+            self._conditional_validators = (etag, self.get_last_modified())
+        return self._conditional_validators
+
+    def get_not_modified_response(self, request) -> HttpResponseBase | None:
+        """Returns 304 Not Modified if the client's copy of the response is fresh."""
+        validators = self.get_conditional_validators()
+        if validators is None:
+            return None
+        etag, last_modified = validators
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp()),
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code not in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            return response
+        validators = self.get_conditional_validators()
+        if validators is not None:
+            etag, last_modified = validators
+            response.headers["ETag"] = etag
+            if last_modified is not None:
+                response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class ReferenceCacheMixin(ConditionalGetMixin):
+    """
+    Mixin to list a reference table from the in-process reference cache and
+    to compute its conditional GET validators from it, without queries.
+    """
+
+    def get_data_state(self) -> dict[str, Any]:
+        return reference_cache.get_state(self.queryset.model, self.last_modified_field)
+
+    def list(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        instances = reference_cache.all(self.queryset.model)
+        return response.Response(self.get_serializer(instances, many=True).data)
+
+
+class SparseFieldsetMixin(object):
+    """
+    Mixin to limit the fields of the responses with the fields and omit query
+    parameters (comma-separated field names): ?fields=id,name or ?omit=description.
+    The requested fields are passed to the serializer as the fields argument,
+    the always included fields are returned regardless of the parameters.
+    """
+
+    sparse_fieldset_actions: tuple[str] = ("list", "retrieve")
+    fields_query_param: str = "fields"
+    omit_query_param: str = "omit"
+    always_included_fields: tuple[str] = ("id",)
+
+    def get_requested_fields(self, available: list[str]) -> list[str] | None:
+        """
+        Returns the requested fields in the order of the available ones,
+        or None if all the fields are needed.
+        """
+        if self.action not in self.sparse_fieldset_actions:
+            return None
+        params = self.request.query_params
+        if (
+            self.fields_query_param not in params
+            and self.omit_query_param not in params
+        ):
+            return None
+        requested: set[str] = set(
+            self._parse_fields(self.fields_query_param, available) or available
+        )
+        requested -= set(self._parse_fields(self.omit_query_param, available))
+        requested |= set(self.always_included_fields)
+        return [field for field in available if field in requested]
+
+    def _parse_fields(self, param: str, available: list[str]) -> list[str]:
+        """Returns the field names of the query parameter, checking they exist."""
+        fields: list[str] = [
+            field.strip()
+            for field in self.request.query_params.get(param, "").split(",")
+            if field.strip()
+        ]
+        unknown: list[str] = [field for field in fields if field not in available]
+        if unknown:
+            raise ValidationError(
+                {param: MESSAGE_UNKNOWN_FIELDS.format(fields=", ".join(unknown))}
+            )
+        return fields
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action in self.sparse_fieldset_actions:
+            kwargs.setdefault(
+                "fields",
+                self.get_requested_fields(self.get_serializer_class().Meta.fields),
+            )
+        return super().get_serializer(*args, **kwargs)
@@ -1,8 +1,197 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over the ordering of the queryset.
+
+    The ordering fields are completed with the pk as a tiebreaker and each page
+    continues strictly after (or before) the boundary row of the previous one,
+    so neither OFFSET nor COUNT(*) queries are needed. The cursor is an opaque
+    base64 encoded position; it is only valid for the ordering it was built for.
+    """
+
+    invalid_cursor_message = CursorPagination.invalid_cursor_message
+
+    def __init__(self, page_size: int, cursor_query_param: str) -> None:
+        self.page_size = page_size
+        self.cursor_query_param = cursor_query_param
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None):
+        self.request = request
+        self.pk_name: str = queryset.model._meta.pk.attname
+        self.ordering: list[str] = self.get_ordering(queryset)
+        fields: list[Field] = [
+            self.get_ordering_field(queryset, name.lstrip("-"))
+            for name in self.ordering
+        ]
+        cursor: dict[str, Any] | None = self.decode_cursor(request)
+        self.is_reversed: bool = bool(cursor and cursor.get("reverse"))
+        ordering: list[str] = (
+            [self.invert(name) for name in self.ordering]
+            if self.is_reversed
+            else self.ordering
+        )
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            try:
+                position: list = [
+                    field.to_python(value)
+                    for field, value in zip(fields, cursor["position"], strict=True)
+                ]
+            except (ValidationError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(self.get_position_filter(ordering, position))
+
+        rows: list[Model | dict] = list(queryset[: self.page_size + 1])
+        has_more: bool = len(rows) > self.page_size
+        self.page: list[Model | dict] = rows[: self.page_size]
+        if self.is_reversed:
+            self.page.reverse()
+        self.has_next: bool = self.is_reversed or has_more
+        self.has_previous: bool = has_more if self.is_reversed else cursor is not None
+        return self.page
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> str | None:
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    @staticmethod
+    def invert(name: str) -> str:
+        """Inverts the direction of an ordering field name."""
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    @staticmethod
+    def get_ordering(queryset: QuerySet) -> list[str]:
+        """Returns the ordering of the queryset completed with the pk tiebreaker."""
+        ordering: list[str] = [
+            name for name in queryset.query.order_by if isinstance(name, str)
+        ]
+        if not ordering or ordering[-1].lstrip("-") not in ("pk", "id"):
+            descending: bool = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+        return ordering
+
+    @staticmethod
+    def get_ordering_field(queryset: QuerySet, name: str) -> Field:
+        """Returns the model field or the annotation output field of the ordering."""
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        if name == "pk":
+            return queryset.model._meta.pk
+        try:
+            return queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise NotFound(KeysetPagination.invalid_cursor_message)
+
+    @staticmethod
+    def get_position_filter(ordering: list[str], position: list) -> Q:
+        """
+        Builds the condition selecting the rows that go strictly after the position
+        in the given ordering: (a > x) OR (a = x AND b > y) OR ...
+        """
+        condition = Q()
+        equal_prefix = Q()
+        for name, value in zip(ordering, position):
+            field: str = name.lstrip("-")
+            lookup: str = "lt" if name.startswith("-") else "gt"
+            condition |= equal_prefix & Q(**{f"{field}__{lookup}": value})
+            equal_prefix &= Q(**{field: value})
+        return condition
+
+    def decode_cursor(self, request: Request) -> dict[str, Any] | None:
+        """Returns the position encoded in the cursor, None for the first page."""
+        encoded: str = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None
+        try:
+            cursor: dict[str, Any] = json.loads(
+                urlsafe_b64decode(encoded.encode("ascii"))
+            )
+        except (BinasciiError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(cursor, dict) or cursor.get("ordering") != self.ordering:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(cursor.get("position"), list):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def get_value(self, row: Model | dict, name: str) -> Any:
+        """Returns the value of the ordering field of a model instance or a dict."""
+        if not isinstance(row, dict):
+            return getattr(row, name)
+        return row[self.pk_name if name == "pk" else name]
+
+    def encode_cursor(self, row: Model | dict, reverse: bool) -> str:
+        """Returns the URL of the page starting after (or before) the row."""
+        cursor: dict[str, Any] = {
+            "ordering": self.ordering,
+            "position": [
+                self.get_value(row, name.lstrip("-")) for name in self.ordering
+            ],
+            "reverse": reverse,
+        }
+        encoded: str = urlsafe_b64encode(
+            json.dumps(cursor, default=str).encode()
+        ).decode("ascii")
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
 
 
 class CustomPageNumberPagination(PageNumberPagination):
-    """Custom pagination class having page_size_query_param."""
+    """
+    Custom pagination class having page_size_query_param.
+    Passing the cursor query parameter (empty for the first page) switches to the
+    keyset pagination without the count of objects.
+    """
 
     page_size_query_param = "limit"
     page_size = 6
+    cursor_query_param = "cursor"
+
+    keyset: KeysetPagination | None = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+        self.keyset = KeysetPagination(
+            page_size=self.get_page_size(request),
+            cursor_query_param=self.cursor_query_param,
+        )
+        return self.keyset.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,69 @@
+import re
+from typing import Any
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import DataAndFiles, JSONParser, MultiPartParser
+
+FIELD_PATH_REGEX: str = r"\[([^\[\]]+)\]"
+MESSAGE_REQUEST_TOO_BIG = "Размер запроса не должен превышать {max_size} МБ."
+
+
+class NestedMultiPartParser(MultiPartParser):
+    """
+    Multipart parser building nested data from the bracket notation of the field
+    names: event_parts[0][speaker][photo]. Objects with numeric keys become lists.
+    Files are placed into the data next to the other fields, so that nested
+    serializers receive them and large images are uploaded without base64.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parsed = super().parse(stream, media_type, parser_context)
+        data: dict[str, Any] = {}
+        for values in (parsed.data, parsed.files):
+            for key, key_values in values.lists():
+                self.set_value(
+                    data, key, key_values[0] if len(key_values) == 1 else key_values
+                )
+        return DataAndFiles(self.make_lists(data), {})
+
+    @staticmethod
+    def set_value(data: dict[str, Any], key: str, value: Any) -> None:
+        """Sets the value at the path of the bracket notation key."""
+        name, _, rest = key.partition("[")
+        path: list[str] = [name, *re.findall(FIELD_PATH_REGEX, f"[{rest}")]
+        for step in path[:-1]:
+            if not isinstance(data.get(step), dict):
+                data[step] = {}
+            data = data[step]
+        data[path[-1]] = value
+
+    @classmethod
+    def make_lists(cls, value: Any) -> Any:
+        """Converts the objects with numeric keys into lists ordered by the keys."""
+        if not isinstance(value, dict):
+            return value
+        if value and all(key.isdigit() for key in value):
+            return [cls.make_lists(value[key]) for key in sorted(value, key=int)]
+        return {key: cls.make_lists(item) for key, item in value.items()}
+
+
+class ImageJSONParser(JSONParser):
+    """
+    JSON parser of the endpoints taking base64 images: rejects the bodies larger
+    than IMAGE_REQUEST_MAX_SIZE by their Content-Length before reading them.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        meta = parser_context["request"].META
+        try:
+            content_length = int(meta.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > settings.IMAGE_REQUEST_MAX_SIZE:
+            raise ParseError(
+                MESSAGE_REQUEST_TOO_BIG.format(
+                    max_size=settings.IMAGE_REQUEST_MAX_SIZE // 1024**2
+                )
+            )
+        return super().parse(stream, media_type, parser_context)
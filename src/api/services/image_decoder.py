@@ -1,15 +1,146 @@
 import base64
+import binascii
+from io import BytesIO
+from typing import Any
 
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from PIL import Image, UnidentifiedImageError
 from rest_framework import serializers
 
+# Длина части строки base64, декодируемой за раз (кратна 4)
+BASE64_CHUNK_SIZE: int = 64 * 1024
+# Пробельные символы, которыми может быть разбита на строки длинная base64
+BASE64_WHITESPACE: str = " \t\r\n"
+# Ключ контекста сериализатора со временными файлами декодированных изображений
+DECODED_FILES_CONTEXT_KEY: str = "decoded_image_files"
+# Сигнатуры начала файлов распространённых форматов, проверяются до декодирования
+IMAGE_SIGNATURES: dict[str, tuple[bytes]] = {
+    "png": (b"\x89PNG\r\n\x1a\n",),
+    "jpeg": (b"\xff\xd8\xff",),
+    "jpg": (b"\xff\xd8\xff",),
+    "gif": (b"GIF87a", b"GIF89a"),
+    "webp": (b"RIFF",),
+}
+
+
+def close_decoded_files(context: dict[str, Any]) -> None:
+    """
+    Closes the temporary files of the base64 images decoded with the serializer
+    context. The storage moves a saved file, so the file must be closed after
+    the save rather than by the garbage collector.
+    """
+    for file in context.pop(DECODED_FILES_CONTEXT_KEY, []):
+        file.close()
+
 
 class Base64ImageField(serializers.ImageField):
-    """Additional class for image processing during serialization."""
+    """
+    Additional class for image processing during serialization: takes an image
+    as a base64 data URL or as a file of a multipart request.
+    The base64 image is decoded chunk by chunk into a temporary file, the size,
+    format and dimensions are checked before the image is decoded completely.
+    """
+
+    default_error_messages = {
+        "invalid_base64": "Изображение должно быть в формате data:image/<тип>;base64.",
+        "max_size": "Размер изображения не должен превышать {max_size} МБ.",
+        "max_pixels": "Изображение не должно быть больше {max_pixels} мегапикселей.",
+        "signature": "Содержимое не соответствует формату изображения {format}.",
+    }
 
     def to_internal_value(self, data):
         if isinstance(data, str) and data.startswith("data:image"):
-            format, imgstr = data.split(";base64,")
-            ext = format.split("/")[-1]
-            data = ContentFile(base64.b64decode(imgstr), name="temp." + ext)
+            data = self.decode_base64(data)
+        elif getattr(data, "size", 0) > settings.IMAGE_UPLOAD_MAX_SIZE:
+            self.fail_max_size()
+        elif hasattr(data, "read"):
+            self.check_dimensions(data)
+            data.seek(0)
         return super().to_internal_value(data)
+
+    def fail_max_size(self):
+        self.fail("max_size", max_size=settings.IMAGE_UPLOAD_MAX_SIZE // 1024**2)
+
+    def decode_base64(self, data: str) -> TemporaryUploadedFile:
+        """
+        Decodes the base64 data URL into a temporary file on disk, which
+        the image validation opens by its path instead of reading it into
+        memory again. The file is registered in the serializer context
+        to be closed by close_decoded_files after the save.
+        """
+        # Строка base64 не копируется: части декодируются срезами самой строки
+        separator: int = data.find(";base64,")
+        if separator == -1:
+            self.fail("invalid_base64")
+        image_format: str = data[:separator].removeprefix("data:image/").lower()
+        offset: int = separator + len(";base64,")
+        encoded_size: int = len(data) - offset
+        encoded_size -= sum(data.count(char, offset) for char in BASE64_WHITESPACE)
+        padding: int = "".join(data[-8:].split())[-2:].count("=")
+        if encoded_size * 3 // 4 - padding > settings.IMAGE_UPLOAD_MAX_SIZE:
+            self.fail_max_size()
+
+        file = TemporaryUploadedFile(
+            name=f"temp.{image_format}",
+            content_type=f"image/{image_format}",
+            size=0,
+            charset=None,
+        )
+        try:
+            has_dimensions: bool = self.write_base64(data, offset, image_format, file)
+            file.size = file.tell()
+            if not has_dimensions:
+                file.seek(0)
+                self.check_dimensions(file)
+        except binascii.Error:
+            file.close()
+            self.fail("invalid_base64")
+        except serializers.ValidationError:
+            file.close()
+            raise
+        file.seek(0)
+        self.context.setdefault(DECODED_FILES_CONTEXT_KEY, []).append(file)
+        return file
+
+    def write_base64(self, data: str, offset: int, image_format: str, file) -> bool:
+        """
+        Decodes the base64 string from the offset into the file chunk by chunk,
+        skipping the line breaks and other whitespace. Checks the signature and
+        the dimensions by the first chunk, returns whether they were read.
+        """
+        has_dimensions: bool = False
+        rest: str = ""
+        for start in range(offset, len(data), BASE64_CHUNK_SIZE):
+            end: int = start + BASE64_CHUNK_SIZE
+            encoded: str = rest + "".join(data[start:end].split())
+            # Декодируется целое число четвёрок символов, остаток переносится
+            length: int = len(encoded) - len(encoded) % 4
+            encoded, rest = encoded[:length], encoded[length:]
+            chunk: bytes = base64.b64decode(encoded, validate=True)
+            if start == offset:
+                signatures = IMAGE_SIGNATURES.get(image_format)
+                if signatures and not chunk.startswith(signatures):
+                    self.fail("signature", format=image_format)
+                has_dimensions = self.check_dimensions(BytesIO(chunk))
+            file.write(chunk)
+        if rest:
+            raise binascii.Error("Incorrect padding")
+        return has_dimensions
+
+    def check_dimensions(self, file) -> bool:
+        """
+        Rejects images with too many pixels by the dimensions in the header,
+        before the image is decoded. Returns whether the header was read:
+        the beginning of a file may lack it (e.g. a JPEG with large metadata).
+        """
+        max_pixels: int = settings.IMAGE_UPLOAD_MAX_PIXELS
+        try:
+            width, height = Image.open(file).size
+        except Image.DecompressionBombError:
+            self.fail("max_pixels", max_pixels=max_pixels // 10**6)
+        except (UnidentifiedImageError, OSError, SyntaxError):
+            return False
+        if width * height > max_pixels:
+            self.fail("max_pixels", max_pixels=max_pixels // 10**6)
+        return True
@@ -0,0 +1,111 @@
+import os
+from io import BytesIO
+from typing import Any
+
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+# Размеры рамок, в которые вписываются варианты изображения, без увеличения
+IMAGE_VARIANT_SIZES: dict[str, tuple[int, int]] = {
+    "thumbnail": (320, 320),
+    "card": (800, 800),
+    "full": (1920, 1920),
+}
+IMAGE_VARIANTS_DIR: str = "variants"
+WEBP_QUALITY: int = 80
+JPEG_QUALITY: int = 85
+
+
+def get_variants_field_name(field_name: str) -> str:
+    """Returns the name of the model field storing the variants of the image."""
+    return f"{field_name}_variants"
+
+
+def _encode(image: Image.Image, image_format: str) -> bytes:
+    """Recompresses the image into the format."""
+    buffer = BytesIO()
+    if image_format == "WEBP":
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+    elif image_format == "PNG":
+        image.save(buffer, "PNG", optimize=True)
+    else:
+        image.convert("RGB").save(
+            buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True
+        )
+    return buffer.getvalue()
+
+
+def generate_image_variants(field_file: FieldFile) -> dict[str, Any]:
+    """
+    Saves the resized and recompressed variants of the image next to it, each
+    as WebP and as a fallback for browsers without WebP support: PNG for
+    images with transparency, JPEG for the others.
+    Returns the variants to store in the <field>_variants model field.
+    """
+    with field_file.open("rb") as source_file:
+        source = ImageOps.exif_transpose(Image.open(source_file))
+        source.load()
+    has_alpha: bool = source.mode in ("RGBA", "LA", "PA") or (
+        source.mode == "P" and "transparency" in source.info
+    )
+    source = source.convert("RGBA" if has_alpha else "RGB")
+    fallback_format: str = "PNG" if has_alpha else "JPEG"
+
+    storage = field_file.storage
+    directory, file_name = os.path.split(field_file.name)
+    stem: str = os.path.splitext(file_name)[0]
+    variants: dict[str, dict[str, Any]] = {}
+    for name, size in IMAGE_VARIANT_SIZES.items():
+        image = source.copy()
+        image.thumbnail(size, Image.LANCZOS)
+        variant: dict[str, Any] = {"width": image.width, "height": image.height}
+        for key, image_format in (("webp", "WEBP"), ("fallback", fallback_format)):
+            path: str = os.path.join(
+                directory,
+                IMAGE_VARIANTS_DIR,
+                f"{stem}_{name}.{image_format.lower().replace('jpeg', 'jpg')}",
+            )
+            if storage.exists(path):
+                storage.delete(path)
+            variant[key] = storage.save(path, ContentFile(_encode(image, image_format)))
+        variants[name] = variant
+    return {"source": field_file.name, "variants": variants}
+
+
+def get_variant_urls(
+    variants: dict[str, Any] | None, storage, request=None
+) -> dict[str, dict[str, Any]]:
+    """
+    Returns the URLs of the stored variants of the image by variant name,
+    absolute if the request is given, like serializers.ImageField does.
+    """
+    urls: dict[str, dict[str, Any]] = {}
+    for name, variant in ((variants or {}).get("variants") or {}).items():
+        urls[name] = {
+            "width": variant["width"],
+            "height": variant["height"],
+            "webp": storage.url(variant["webp"]),
+            "fallback": storage.url(variant["fallback"]),
+        }
+        if request is not None:
+            for key in ("webp", "fallback"):
+                urls[name][key] = request.build_absolute_uri(urls[name][key])
+    return urls
+
+
+class ImageVariantsField(serializers.ReadOnlyField):
+    """
+    Read-only field showing the URLs of the resized variants of the image
+    (thumbnail, card, full) in WebP and fallback formats with their sizes,
+    for srcset; empty until the variants are generated.
+    """
+
+    def __init__(self, image_field: str, **kwargs):
+        self.image_field = image_field
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        storage = self.parent.Meta.model._meta.get_field(self.image_field).storage
+        return get_variant_urls(value, storage, self.context.get("request"))
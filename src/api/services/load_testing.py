@@ -0,0 +1,221 @@
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from math import ceil
+from random import Random
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+from uuid import UUID
+
+REQUEST_TIMEOUT: float = 30.0
+# Шаги сценариев: название, метод и путь относительно корня API
+SCENARIOS: dict[str, list[tuple[str, str, str]]] = {
+    "anonymous_browse": [
+        ("events", "GET", "events/"),
+        ("event", "GET", "events/{event}/"),
+        ("recommended", "GET", "events/three-recommended-events/"),
+    ],
+    "authenticated_browse": [
+        ("me", "GET", "users/me/"),
+        ("events", "GET", "events/"),
+        ("event", "GET", "events/{event}/"),
+        ("recommended", "GET", "events/three-recommended-events/"),
+    ],
+    "registration_stampede": [
+        ("event", "GET", "events/{hot_event}/"),
+        ("application", "POST", "applications/"),
+    ],
+}
+AUTHENTICATED_SCENARIOS: set[str] = {"authenticated_browse"}
+# Сценарии, создающие данные на сервере, запускаются только по явному разрешению
+WRITE_SCENARIOS: set[str] = {"registration_stampede"}
+DEFAULT_MIX: dict[str, int] = {
+    "anonymous_browse": 6,
+    "authenticated_browse": 3,
+    "registration_stampede": 1,
+}
+PERCENTILES: tuple[int] = (50, 95, 99)
+# Домен почты и пароль пользователей, созданных generate_load_data,
+# load_test входит под ними и создает заявки с адресами того же домена
+LOAD_DATA_EMAIL_DOMAIN: str = "load.example.com"
+LOAD_DATA_PASSWORD: str = "load-data-password"
+# Результат запроса: сценарий, шаг, код ответа (0 без ответа), длительность в с
+Result = tuple[str, str, int, float]
+
+
+def send_request(
+    base_url: str,
+    method: str,
+    path: str,
+    token: str | None = None,
+    body: dict[str, Any] | None = None,
+) -> tuple[int, bytes, float]:
+    """
+    Sends the request to the API and reads the whole response.
+    Returns the status code (0 if the request failed without a response),
+    the response body and the duration in seconds.
+    """
+    headers: dict[str, str] = {"Accept": "application/json"}
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+    data: bytes | None = None
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+        data = json.dumps(body).encode()
+    request = Request(base_url + path, data=data, headers=headers, method=method)
+    started: float = time.perf_counter()
+    try:
+        with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            status, content = response.status, response.read()
+    except HTTPError as error:
+        status, content = error.code, error.read()
+    except (URLError, OSError):
+        status, content = 0, b""
+    return status, content, time.perf_counter() - started
+
+
+def get_application(plan: dict[str, Any], counter: int) -> dict[str, Any]:
+    """
+    Returns an anonymous application to the hot event with the contacts unique
+    for the run (a UUID), the worker and the counter of its requests.
+    """
+    # В номере телефона только 10 цифр: номера запросов всех обработчиков
+    # чередуются, поэтому в пределах запуска номера не повторяются,
+    # а сдвиг от UUID разводит номера разных запусков
+    number: int = counter * plan["workers"] + plan["worker"]
+    phone: int = (UUID(plan["run"]).int + number) % 10**10
+    return {
+        "event": plan["hot_event"],
+        "format": "online",
+        "first_name": "Нагрузочный",
+        "last_name": "Тест",
+        "email": (
+            f"load-test-{plan['run']}-{plan['worker']}-{counter}"
+            f"@{LOAD_DATA_EMAIL_DOMAIN}"
+        ),
+        "phone": f"8{phone:010d}",
+        "activity": "studying",
+    }
+
+
+def run_worker(plan: dict[str, Any]) -> list[Result]:
+    """
+    Replays the scenarios picked by weight one after another until the
+    deadline, or the given number of iterations.
+    A top-level function of stdlib objects only, for the process pool.
+    """
+    random = Random(plan["seed"])
+    names: list[str] = list(plan["mix"])
+    weights: list[int] = list(plan["mix"].values())
+    results: list[Result] = []
+    counter: int = 0
+    iteration: int = 0
+    while (
+        iteration < plan["iterations"]
+        if plan["iterations"] is not None
+        else time.time() < plan["deadline"]
+    ):
+        iteration += 1
+        scenario: str = random.choices(names, weights)[0]
+        token: str | None = (
+            plan["token"] if scenario in AUTHENTICATED_SCENARIOS else None
+        )
+        for step, method, path in SCENARIOS[scenario]:
+            body: dict[str, Any] | None = None
+            if method == "POST":
+                counter += 1
+                body = get_application(plan, counter)
+            path = path.format(
+                event=random.choice(plan["events"]), hot_event=plan["hot_event"]
+            )
+            status, _, elapsed = send_request(
+                plan["base_url"], method, path, token, body
+            )
+            results.append((scenario, step, status, elapsed))
+    return results
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Returns the nearest-rank percentile of the sorted values."""
+    return values[max(ceil(len(values) * percent / 100) - 1, 0)]
+
+
+def summarize(results: list[Result], elapsed: float) -> dict[str, Any]:
+    """
+    Returns the number of requests, RPS, error rate, latency percentiles and
+    status codes of all the requests. Responses with the status 4xx and 5xx and
+    requests without a response are errors.
+    """
+    latencies: list[float] = sorted(result[3] for result in results)
+    statuses: dict[str, int] = {}
+    for _, _, status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors: int = sum(1 for result in results if not 0 < result[2] < 400)
+    return {
+        "requests": len(results),
+        "rps": round(len(results) / max(elapsed, 1e-6), 2),
+        "errors": errors,
+        "error_rate": round(errors / len(results), 4) if results else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+        "latency_ms": (
+            {
+                **{
+                    f"p{percent}": round(percentile(latencies, percent) * 1000, 2)
+                    for percent in PERCENTILES
+                },
+                "mean": round(sum(latencies) / len(latencies) * 1000, 2),
+                "max": round(latencies[-1] * 1000, 2),
+            }
+            if latencies
+            else {}
+        ),
+    }
+
+
+def run_load_test(
+    plan: dict[str, Any], concurrency: int, use_processes: bool, duration: float
+) -> dict[str, Any]:
+    """
+    Runs the plan in concurrency workers of a thread or process pool.
+    Returns the summary of all requests, of each scenario and of each step.
+    """
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    started: float = time.perf_counter()
+    deadline: float = time.time() + duration
+    with executor_class(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                run_worker,
+                {
+                    **plan,
+                    "worker": worker,
+                    "workers": concurrency,
+                    "seed": plan["seed"] + worker,
+                    "deadline": deadline,
+                },
+            )
+            for worker in range(concurrency)
+        ]
+        results: list[Result] = [
+            result for future in futures for result in future.result()
+        ]
+    elapsed: float = time.perf_counter() - started
+    groups: dict[str, list[Result]] = {}
+    for result in results:
+        groups.setdefault(result[0], []).append(result)
+        groups.setdefault(f"{result[0]}.{result[1]}", []).append(result)
+    return {
+        "duration_s": round(elapsed, 3),
+        "total": summarize(results, elapsed),
+        "scenarios": {
+            name: summarize(group, elapsed)
+            for name, group in sorted(groups.items())
+            if "." not in name
+        },
+        "steps": {
+            name: summarize(group, elapsed)
+            for name, group in sorted(groups.items())
+            if "." in name
+        },
+    }
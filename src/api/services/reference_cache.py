@@ -0,0 +1,150 @@
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from rest_framework import serializers
+
+from api.cache import bump_version, get_version
+
+REFERENCES_VERSION_KEY: str = "references:version"
+# Маленькие и почти неизменяемые справочники, которые хранятся в памяти процесса
+REFERENCE_MODELS: tuple[str] = (
+    "events.City",
+    "events.EventType",
+    "users.Specialization",
+    "applications.Source",
+)
+
+
+class ReferenceCache:
+    """
+    Per-process cache of the reference tables. All rows of a table are loaded
+    with one query on first use and kept in memory while the shared version
+    (bumped on any change of the references in any process) is the same.
+    The cached instances are shared, they must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._version: int | None = None
+        self._tables: dict[type[Model], dict[int, Model]] = {}
+        self._computed: dict[str, Any] = {}
+
+    def check_version(self) -> None:
+        """Drops the cached data if the references were changed since loading."""
+        version: int = get_version(REFERENCES_VERSION_KEY)
+        if version != self._version:
+            self._tables = {}
+            self._computed = {}
+            self._version = version
+
+    def get_table(self, model: type[Model]) -> dict[int, Model]:
+        """Returns the instances of the reference by the primary key."""
+        self.check_version()
+        table: dict[int, Model] | None = self._tables.get(model)
+        if table is None:
+            table = {instance.pk: instance for instance in model.objects.all()}
+            self._tables[model] = table
+        return table
+
+    def all(self, model: type[Model]) -> list[Model]:
+        """Returns the instances of the reference in the default ordering."""
+        return list(self.get_table(model).values())
+
+    def get(self, model: type[Model], pk: int) -> Model | None:
+        """Returns the instance of the reference with the primary key."""
+        return self.get_table(model).get(pk)
+
+    def get_state(
+        self, model: type[Model], last_modified_field: str = "updated"
+    ) -> dict[str, Any]:
+        """
+        Returns the number of rows, the last primary key and the time of the last
+        change of the reference, for the conditional GET validators.
+        """
+        instances: list[Model] = self.all(model)
+        return {
+            "count": len(instances),
+            "last_pk": max((instance.pk for instance in instances), default=None),
+            "last_modified": max(
+                (
+                    getattr(instance, last_modified_field)
+                    for instance in instances
+                    if hasattr(instance, last_modified_field)
+                ),
+                default=None,
+            ),
+        }
+
+    def get_computed(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the value computed from the references, computing it once per
+        version of the references.
+        """
+        self.check_version()
+        if key not in self._computed:
+            self._computed[key] = compute()
+        return self._computed[key]
+
+    def get_ids_by_slugs(self, model: type[Model], slugs: list[str]) -> list[int]:
+        """Returns the primary keys of the reference instances with the slugs."""
+        return [
+            instance.pk
+            for instance in self.get_table(model).values()
+            if instance.slug in slugs
+        ]
+
+
+reference_cache = ReferenceCache()
+
+
+def is_reference(model: type[Model]) -> bool:
+    """Checks whether the model is kept in the reference cache."""
+    return model._meta.label in REFERENCE_MODELS
+
+
+def invalidate_reference_cache(sender, **kwargs) -> None:
+    """
+    Invalidates the reference cache of all processes when a reference changes.
+    The version is bumped again after the commit: a process could reload the
+    old rows before the transaction becomes visible to it.
+    """
+    bump_version(REFERENCES_VERSION_KEY)
+    transaction.on_commit(partial(bump_version, REFERENCES_VERSION_KEY))
+
+
+def connect_reference_signals() -> None:
+    """Connects the invalidation of the reference cache to the reference models."""
+    for label in REFERENCE_MODELS:
+        model: type[Model] = apps.get_model(label)
+        for action, signal in (("save", post_save), ("delete", post_delete)):
+            signal.connect(
+                invalidate_reference_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_reference_cache_on_{action}_{label}",
+            )
+
+
+class ReferencePrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key related field resolving the references from the reference cache
+    without queries, other related models are resolved as usual.
+    """
+
+    def to_internal_value(self, data):
+        model: type[Model] = self.get_queryset().model
+        if not is_reference(model):
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        instance: Model | None = reference_cache.get(model, pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=data)
+        return instance
@@ -6,6 +6,7 @@ from rest_framework.routers import DefaultRouter
 
 from applications.views import ApplicationViewSet, NotificationSettingsViewSet
 from events.views import (
+    BootstrapViewSet,
     CityViewSet,
     EventTypeViewSet,
     EventViewSet,
@@ -23,6 +24,7 @@ router.register("event_types", EventTypeViewSet)
 router.register("specializations", SpecializationViewSet)
 router.register("applications", ApplicationViewSet)
 router.register("notification-settings", NotificationSettingsViewSet)
+router.register("bootstrap", BootstrapViewSet, "bootstrap")
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -54,9 +54,8 @@ class EventClosureController:
         ):
             event.status = Event.STATUS_CLOSED
 
-        event.save()
-
         if event.status != previous_event_status:
+            event.save(update_fields=["status", "updated"])
             logger.debug(f"The status of event {event} was changed to {event.status}")
 
     @staticmethod
@@ -179,9 +178,8 @@ class EventReopeningController:
         ):
             event.status = Event.STATUS_ONLINE_CLOSED
 
-        event.save()
-
         if event.status != previous_event_status:
+            event.save(update_fields=["status", "updated"])
             logger.debug(f"The status of event {event} was changed to {event.status}")
 
     @staticmethod
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.4 on 2026-10-18 03:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0004_alter_application_activity"),
+        ("events", "0008_alter_eventpart_presentation_type"),
+        ("users", "0003_alter_user_activity"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["user", "event"], name="application_user_event_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0005_application_user_event_idx"),
+        ("events", "0010_event_search_document"),
+        ("users", "0004_specialization_updated"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["event", "format"], name="application_event_format_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["event", "email"], name="application_event_email_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["event", "phone"], name="application_event_phone_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["event", "telegram"], name="application_event_telegram_idx"
+            ),
+        ),
+    ]
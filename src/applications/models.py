@@ -140,6 +140,17 @@ class Application(models.Model):
     class Meta:
         verbose_name = "Заявка"
         verbose_name_plural = "Заявки"
+        indexes = [
+            models.Index(fields=["user", "event"], name="application_user_event_idx"),
+            models.Index(
+                fields=["event", "format"], name="application_event_format_idx"
+            ),
+            models.Index(fields=["event", "email"], name="application_event_email_idx"),
+            models.Index(fields=["event", "phone"], name="application_event_phone_idx"),
+            models.Index(
+                fields=["event", "telegram"], name="application_event_telegram_idx"
+            ),
+        ]
         constraints = [
             CheckConstraint(
                 check=Q(user__isnull=False)
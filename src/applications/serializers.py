@@ -7,7 +7,7 @@ from django.utils.functional import SimpleLazyObject
 from rest_framework import serializers
 from rest_framework.serializers import ValidationError
 
-from .models import Application, Notification, NotificationSettings
+from .models import Application, Notification, NotificationSettings, Source
 from .tasks import remind_participant_about_upcoming_event
 from .utils import (
     APPLICATION_ACTIVITY_ANONYMOUS_ERROR,
@@ -26,14 +26,35 @@ from .utils import (
     check_another_user_telegram,
 )
 from api.loggers import logger
+from api.services.reference_cache import ReferencePrimaryKeyRelatedField
 from events.models import Event
 from users.models import User
 from users.utils import PHONE_NUMBER_ERROR, PHONE_NUMBER_REGEX, check_birth_date
 
 
+class SourceSerializer(serializers.ModelSerializer):
+    """Serializer for handling sources of information about events."""
+
+    source_name = serializers.CharField(
+        source="name",
+        label=Source._meta.get_field("name").verbose_name,
+        max_length=Source._meta.get_field("name").max_length,
+    )
+    source_slug = serializers.SlugField(
+        source="slug",
+        label=Source._meta.get_field("slug").verbose_name,
+        max_length=Source._meta.get_field("slug").max_length,
+    )
+
+    class Meta:
+        model = Source
+        fields = ["id", "source_name", "source_slug"]
+
+
 class ApplicationCreateAuthorizedSerializer(serializers.ModelSerializer):
     """Serializer to create applications on behalf of authorized site visitors."""
 
+    serializer_related_field = ReferencePrimaryKeyRelatedField
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     notification_settings_id = serializers.SerializerMethodField(
         label=NOTIFICATION_SETTINGS_ID_FIELD_LABEL
@@ -52,6 +52,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Project's own apps
     "users.apps.UsersConfig",
     "events.apps.EventsConfig",
@@ -124,6 +125,29 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+if DOCKER == "yes":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CACHE_LOCATION", default="redis://redis:6379/1"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Lifetime of cached event responses, they are also invalidated on any change
+EVENTS_CACHE_TIMEOUT = int(os.getenv("EVENTS_CACHE_TIMEOUT", default=60 * 60))
+# Seconds the clients may reuse the reference data before revalidating it
+BOOTSTRAP_CACHE_MAX_AGE = int(os.getenv("BOOTSTRAP_CACHE_MAX_AGE", default=5 * 60))
+
+
 # User settings
 AUTH_USER_MODEL = "users.User"
 
@@ -169,6 +193,15 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Uploaded images
+
+IMAGE_UPLOAD_MAX_SIZE = int(os.getenv("IMAGE_UPLOAD_MAX_SIZE", default=10 * 1024**2))
+IMAGE_UPLOAD_MAX_PIXELS = int(os.getenv("IMAGE_UPLOAD_MAX_PIXELS", default=40_000_000))
+# A base64 image is a third larger than the image itself: JSON request bodies of
+# the endpoints taking images must fit it, the other requests keep the default
+# DATA_UPLOAD_MAX_MEMORY_SIZE; files of multipart requests count towards neither
+IMAGE_REQUEST_MAX_SIZE = IMAGE_UPLOAD_MAX_SIZE * 4 // 3 + 1024**2
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -69,12 +69,12 @@ class EventAdmin(admin.ModelAdmin):
         queryset = super().get_queryset(request)
         return queryset.select_related(
             "city", "event_type", "specializations"
-        ).prefetch_related("applications")
+        ).with_application_counts()
 
-    @admin.display(description="Заявки")
+    @admin.display(description="Заявки", ordering="submitted_applications")
     def submitted_applications(self, obj):
         """Shows the number of applications submitted to participate in the event."""
-        return obj.applications.count()
+        return obj.submitted_applications
 
 
 @admin.register(EventPart)
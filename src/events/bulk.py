@@ -0,0 +1,83 @@
+from collections import Counter
+from typing import Any
+
+from drf_standardized_errors.settings import package_settings
+from rest_framework.exceptions import ValidationError
+
+from .models import Event
+from .serializers import EventBulkItemSerializer, EventCreateSerializer
+from .utils import EVENTS_BULK_NAME_DUPLICATE_ERROR, EVENTS_BULK_NAME_EXISTS_ERROR
+from api.services.image_decoder import close_decoded_files
+
+
+def format_errors(errors: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+    """
+    Formats the validation errors of an event like the error responses of the
+    API: {"type": "validation_error", "errors": [{"code", "detail", "attr"}]}.
+    """
+    exc = ValidationError(errors)
+    return package_settings.EXCEPTION_FORMATTER_CLASS(exc, context, exc).run()
+
+
+def validate_events(
+    items: list[Any], context: dict[str, Any]
+) -> list[tuple[dict[str, Any] | None, dict[str, Any] | None]]:
+    """
+    Validates the events of the batch, returns the validated data or the
+    standardized errors of every event. The names must be unique among the
+    existing events and within the batch, they are checked with one query.
+    """
+    serializers: list[EventBulkItemSerializer] = [
+        EventBulkItemSerializer(data=item, context=context) for item in items
+    ]
+    for serializer in serializers:
+        serializer.is_valid()
+    names: Counter = Counter(
+        serializer.validated_data["name"]
+        for serializer in serializers
+        if "name" in serializer.validated_data
+    )
+    existing_names: set[str] = set(
+        Event.objects.filter(name__in=names).values_list("name", flat=True)
+    )
+
+    validated: list[tuple[dict[str, Any] | None, dict[str, Any] | None]] = []
+    for serializer in serializers:
+        errors: dict[str, Any] = dict(serializer.errors)
+        name: str | None = serializer.validated_data.get("name")
+        if name in existing_names:
+            errors["name"] = [EVENTS_BULK_NAME_EXISTS_ERROR]
+        elif names[name] > 1:
+            errors["name"] = [EVENTS_BULK_NAME_DUPLICATE_ERROR]
+        if errors:
+            validated.append((None, format_errors(errors, context)))
+        else:
+            validated.append((serializer.validated_data, None))
+    return validated
+
+
+def import_events(
+    items: list[Any], context: dict[str, Any], atomic: bool = True
+) -> list[dict[str, Any]]:
+    """
+    Validates the batch and creates its valid events in one transaction with
+    bulk inserts: all or none of them if atomic, otherwise the valid ones.
+    Returns the id or the errors of every event of the batch.
+    """
+    validated = validate_events(items, context)
+    valid: list[tuple[int, dict[str, Any]]] = [
+        (index, data) for index, (data, _) in enumerate(validated) if data is not None
+    ]
+    ids: dict[int, int] = {}
+    try:
+        if valid and (not atomic or len(valid) == len(validated)):
+            events: list[Event] = EventCreateSerializer(context=context).bulk_create(
+                [data for _, data in valid]
+            )
+            ids = {index: event.pk for (index, _), event in zip(valid, events)}
+    finally:
+        close_decoded_files(context)
+    return [
+        {"index": index, "id": ids.get(index), "errors": errors}
+        for index, (_, errors) in enumerate(validated)
+    ]
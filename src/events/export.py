@@ -0,0 +1,98 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from rest_framework.serializers import ListSerializer, Serializer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Event
+from .serializers import EventDetailSerializer
+
+# Число мероприятий, читаемых из курсора базы данных и подгружаемых за раз
+EXPORT_CHUNK_SIZE: int = 500
+EXPORT_CONTENT_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class Echo:
+    """File-like object returning the written value, for streaming csv.writer."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_events(queryset) -> Iterator[Event]:
+    """
+    Iterates the events with a server-side cursor, loading the agendas and
+    speakers chunk by chunk, so memory does not depend on the number of events.
+    """
+    return queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def stream_ndjson(queryset, context: dict[str, Any]) -> Iterator[str]:
+    """
+    Yields the events with agendas and speakers, one JSON object per line.
+    The serializer is built once: its fields are reused for every event.
+    """
+    serializer = EventDetailSerializer(context=context)
+    for event in iter_events(queryset):
+        data = serializer.to_representation(event)
+        yield json.dumps(data, cls=JSONEncoder, ensure_ascii=False) + "\n"
+
+
+def get_csv_columns(fields: dict, prefix: str = "") -> Iterator[str]:
+    """
+    Yields the CSV column names of the serializer fields, the fields of nested
+    serializers are named with the dotted path: city.city_name.
+    """
+    for name, field in fields.items():
+        if isinstance(field, ListSerializer):
+            field = field.child
+        if isinstance(field, Serializer):
+            yield from get_csv_columns(field.fields, prefix=f"{prefix}{name}.")
+        else:
+            yield f"{prefix}{name}"
+
+
+def flatten(
+    data: dict[str, Any] | None, columns: set[str], prefix: str = ""
+) -> dict[str, Any]:
+    """
+    Flattens the nested representation into the dotted CSV columns, the dict
+    values of single columns (image variants) are written as JSON.
+    """
+    row: dict[str, Any] = {}
+    for name, value in (data or {}).items():
+        column: str = f"{prefix}{name}"
+        if isinstance(value, dict) and column not in columns:
+            row.update(flatten(value, columns, prefix=f"{column}."))
+        elif isinstance(value, dict):
+            row[column] = json.dumps(value, cls=JSONEncoder, ensure_ascii=False)
+        else:
+            row[column] = value
+    return row
+
+
+def stream_csv(queryset, context: dict[str, Any]) -> Iterator[str]:
+    """
+    Yields the CSV header and the rows of the events, one row per event part
+    with the event columns repeated; events without agenda take one row.
+    """
+    serializer = EventDetailSerializer(context=context)
+    columns: list[str] = list(get_csv_columns(serializer.fields))
+    column_set: set[str] = set(columns)
+    # Пустые вложенные объекты (city: null) дают лишний ключ без столбца,
+    # их столбцы остаются пустыми
+    writer = csv.DictWriter(Echo(), fieldnames=columns, extrasaction="ignore")
+    yield writer.writeheader()
+    for event in iter_events(queryset):
+        data = serializer.to_representation(event)
+        parts: Iterable[dict | None] = data.pop("event_parts") or [None]
+        event_row: dict[str, Any] = flatten(data, column_set)
+        for part in parts:
+            yield writer.writerow(
+                {**event_row, **flatten(part, column_set, prefix="event_parts.")}
+            )
@@ -0,0 +1,62 @@
+from typing import Any
+
+from django.db.models import Count, QuerySet
+from django_filters import rest_framework as rf_filters
+from django_filters.utils import translate_validation
+
+from .models import Event
+from api.services.reference_cache import reference_cache
+
+# Параметры фильтров, по значениям которых считаются мероприятия, и их поля
+EVENT_FACETS: dict[str, str] = {
+    "city": "city",
+    "event_type": "event_type",
+    "specializations": "specializations",
+    "format": "format",
+    "status": "status",
+}
+
+
+def get_facet_values(field_name: str) -> dict[Any, str]:
+    """
+    Returns the filter values of the facet (the slugs of the reference or the
+    choices of the field) by the value stored in the field.
+    """
+    field = Event._meta.get_field(field_name)
+    if field.related_model is not None:
+        return {
+            instance.pk: instance.slug
+            for instance in reference_cache.all(field.related_model)
+        }
+    return {value: value for value, _ in field.choices}
+
+
+def count_facets(
+    filterset_class: type[rf_filters.FilterSet], data, queryset: QuerySet, request
+) -> dict[str, dict[str, int]]:
+    """
+    Counts the events matching the filters by every value of every facet with
+    one grouped query per facet. The filter of the facet itself is not applied
+    to its counts, so they show how many events its other values would add.
+    """
+    filterset = filterset_class(data=data, queryset=queryset, request=request)
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+    counts: dict[str, dict[str, int]] = {}
+    for facet, field_name in EVENT_FACETS.items():
+        facet_data = data.copy()
+        facet_data.pop(facet, None)
+        facet_queryset = filterset_class(
+            data=facet_data, queryset=queryset, request=request
+        ).qs
+        values: dict[Any, str] = get_facet_values(field_name)
+        counts[facet] = dict.fromkeys(values.values(), 0)
+        for value, count in (
+            facet_queryset.order_by()
+            .values(field_name)
+            .annotate(count=Count("pk"))
+            .values_list(field_name, "count")
+        ):
+            if value in values:
+                counts[facet][values[value]] = count
+    return counts
@@ -0,0 +1,146 @@
+import re
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from applications.models import Application
+from events.models import City, Event, EventType
+from events.views import EventViewSet
+from users.models import Specialization
+
+# Частичные индексы содержат только подходящие строки, их просмотр не полный
+PARTIAL_INDEXES: str = "|".join(
+    index.name for index in Event._meta.indexes if index.condition is not None
+)
+# Признаки просмотра всей таблицы мероприятий в планах PostgreSQL и SQLite
+FULL_SCAN_PATTERNS: tuple[str] = (
+    r"Seq Scan on events_event\b",
+    rf"SCAN events_event\b(?! USING (?:COVERING )?INDEX (?:{PARTIAL_INDEXES})\b)",
+)
+# Параметры, не сужающие выборку: без фильтров просмотр всей таблицы ожидаем
+NON_FILTER_PARAMS: set[str] = {"ordering", "cursor"}
+
+
+def get_list_filter_combinations() -> dict[str, dict[str, str]]:
+    """
+    Returns the query parameters of the event list requests to explain.
+    The combinations with the reference tables are skipped if they are empty.
+    """
+    now = timezone.now()
+    combinations: dict[str, dict[str, str]] = {
+        "default": {},
+        "ordering=start_time": {"ordering": "start_time"},
+        "cursor ordering=start_time": {"cursor": "", "ordering": "start_time"},
+        "not_started": {"not_started": "true", "ordering": "start_time"},
+        "upcoming active": {
+            "is_deleted": "false",
+            "not_started": "true",
+            "ordering": "start_time",
+        },
+        "is_featured": {"is_featured": "true", "ordering": "start_time"},
+        "status": {"status": Event.STATUS_OPEN, "ordering": "start_time"},
+        "format": {"format": Event.FORMAT_ONLINE, "ordering": "start_time"},
+        "start_date/end_date": {
+            "start_date": now.isoformat(),
+            "end_date": (now + timedelta(days=30)).isoformat(),
+        },
+        "search": {"search": "конференция"},
+    }
+    for param, model in (
+        ("specializations", Specialization),
+        ("event_type", EventType),
+        ("city", City),
+    ):
+        reference = model.objects.first()
+        if reference is not None:
+            combinations[param] = {param: reference.slug, "ordering": "start_time"}
+    return combinations
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs EXPLAIN for the queries of the event list filter combinations "
+        "and of the application checks, reports full scans of the events table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help=(
+                "Executes the queries and reports their duration, on PostgreSQL "
+                "runs EXPLAIN ANALYZE."
+            ),
+        )
+        parser.add_argument(
+            "--fail-on-full-scan",
+            action="store_true",
+            help="Exits with an error if a filtered query scans the whole table.",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Prints the whole query plans, not only the summary.",
+        )
+
+    def handle(self, *args, **options):
+        explain_options: dict[str, bool] = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options["analyze"] = True
+        full_scans: list[str] = []
+        for name, queryset, is_filtered, is_count in self.get_querysets():
+            plan: str = queryset.explain(**explain_options)
+            is_full_scan: bool = any(
+                re.search(pattern, plan) for pattern in FULL_SCAN_PATTERNS
+            )
+            summary: str = "index"
+            if is_full_scan:
+                summary = "FULL SCAN" if is_filtered else "full scan (no filters)"
+            if options["analyze"]:
+                started: float = time.perf_counter()
+                queryset.count() if is_count else list(queryset)
+                summary += f", {(time.perf_counter() - started) * 1000:.1f} ms"
+            self.stdout.write(f"{name}: {summary}")
+            if options["verbose_plans"]:
+                self.stdout.write(plan + "\n")
+            if is_full_scan and is_filtered:
+                full_scans.append(name)
+        if full_scans and options["fail_on_full_scan"]:
+            raise CommandError(
+                f"Filtered queries scanning the whole events table: "
+                f"{', '.join(full_scans)}"
+            )
+
+    def get_querysets(self):
+        """
+        Yields the names and querysets of event list pages, their counts and
+        application checks, whether the query is filtered and is a count.
+        """
+        factory = APIRequestFactory()
+        for name, params in get_list_filter_combinations().items():
+            view = EventViewSet(action="list", format_kwarg=None)
+            view.request = Request(factory.get("/api/v1/events/", params))
+            view.request.user = AnonymousUser()
+            queryset = view.filter_queryset(view.get_queryset())
+            page_size: int = view.paginator.get_page_size(view.request)
+            is_filtered: bool = bool(set(params) - NON_FILTER_PARAMS)
+            yield f"list [{name}]", queryset[:page_size], is_filtered, False
+            if "cursor" not in params:
+                count_queryset = queryset.order_by().values("pk")
+                yield f"count [{name}]", count_queryset, is_filtered, True
+
+        event_id: int = Event.objects.values_list("pk", flat=True).first() or 0
+        applications = Application.objects.filter(event_id=event_id)
+        yield "application format count", applications.filter(
+            format=Event.FORMAT_ONLINE
+        ), True, True
+        for field in ("email", "phone", "telegram"):
+            yield f"application duplicate {field}", applications.filter(
+                **{field: "check"}
+            ), True, False
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from api.services.image_variants import get_variants_field_name
+from events.signals import IMAGE_VARIANT_FIELDS
+from events.tasks import create_image_variants
+
+
+class Command(BaseCommand):
+    help = (
+        "Queues the generation of the resized variants of the event posters "
+        "and speaker photos uploaded before the variants existed or changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Generates the variants in this process instead of Celery.",
+        )
+
+    def handle(self, *args, **options):
+        for model, field_name in IMAGE_VARIANT_FIELDS.items():
+            variants_field: str = get_variants_field_name(field_name)
+            queued: int = 0
+            for pk, name, variants in (
+                model.objects.exclude(**{field_name: ""})
+                .values_list("pk", field_name, variants_field)
+                .iterator()
+            ):
+                if variants.get("source") == name:
+                    continue
+                arguments: tuple = (model._meta.label, pk, field_name)
+                if options["sync"]:
+                    create_image_variants(*arguments)
+                else:
+                    create_image_variants.delay(*arguments)
+                queued += 1
+            self.stdout.write(f"{model._meta.label}.{field_name}: {queued}")
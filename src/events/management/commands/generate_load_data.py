@@ -0,0 +1,549 @@
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from random import Random
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import DateField, DateTimeField, Field, Max, Model
+from django.utils import timezone
+
+from .load_csv import DEFAULT_BATCH_SIZE, refresh_loaded_events, reset_sequences
+from api.loggers import logger
+from api.services.load_testing import LOAD_DATA_EMAIL_DOMAIN, LOAD_DATA_PASSWORD
+from applications.models import Application, NotificationSettings, Source
+from events.models import City, Event, EventPart, EventType, Speaker
+from users.models import Specialization, User
+
+DEFAULT_EVENTS: int = 1000
+DEFAULT_USERS: int = 1000
+DEFAULT_APPLICATIONS_PER_EVENT: int = 10
+DEFAULT_PARTS_PER_EVENT: int = 3
+DEFAULT_SEED: int = 0
+# Число создаваемых строк каждого справочника и названия строк
+REFERENCES_COUNT: int = 10
+REFERENCE_NAMES: dict[type[Model], str] = {
+    City: "Город",
+    EventType: "Тип мероприятия",
+    Specialization: "Направление",
+    Source: "Источник",
+}
+# Доля заявок зарегистрированных пользователей, остальные заявки анонимные
+USER_APPLICATIONS_SHARE: float = 0.7
+# Число частей программы на одного спикера
+PARTS_PER_SPEAKER: int = 10
+
+# fmt: off
+FIRST_NAMES: tuple[str] = (
+    "Анна", "Иван", "Мария", "Петр", "Елена", "Сергей", "Ольга", "Дмитрий",
+    "Наталья", "Алексей", "Татьяна", "Андрей", "Ирина", "Михаил", "Светлана",
+)
+LAST_NAMES: tuple[str] = (
+    "Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов",
+    "Михайлов", "Новиков", "Федоров", "Морозов", "Волков", "Алексеев", "Лебедев",
+)
+COMPANIES: tuple[str] = (
+    "Яндекс", "Сбер", "Тинькофф", "VK", "Озон", "Авито", "Касперский", "МТС",
+)
+POSITIONS: tuple[str] = (
+    "разработчик", "старший разработчик", "тимлид", "аналитик", "тестировщик",
+    "дизайнер", "менеджер проектов", "архитектор",
+)
+WORDS: tuple[str] = (
+    "данные", "бэкенд", "фронтенд", "машинное", "обучение", "архитектура",
+    "микросервисы", "нагрузка", "тестирование", "продукт", "дизайн", "облако",
+    "безопасность", "мобильная", "разработка", "аналитика", "платформа", "опыт",
+)
+# fmt: on
+# Поля заявки, заполняемые данными зарегистрированного пользователя
+APPLICATION_USER_FIELDS: tuple[str] = (
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "telegram",
+    "birth_date",
+    "city",
+    "activity",
+    "company",
+    "position",
+    "experience_years",
+)
+NOTIFY_CHOICES: list[str | None] = [
+    choice for choice, _ in NotificationSettings.NOTIFY_CHOISES
+] + [None]
+
+
+def get_next_pk(model: type[Model]) -> int:
+    """Returns the primary key following the largest one of the table."""
+    return (model.objects.aggregate(last_pk=Max("pk"))["last_pk"] or 0) + 1
+
+
+def get_text(random: Random, words: int) -> str:
+    return " ".join(random.choices(WORDS, k=words)).capitalize()
+
+
+def get_adapter(field: Field) -> Callable[[Any], Any] | None:
+    """Returns the conversion of the field values for the database driver."""
+    if isinstance(field, DateTimeField):
+        return connection.ops.adapt_datetimefield_value
+    if isinstance(field, DateField):
+        return connection.ops.adapt_datefield_value
+    return None
+
+
+def insert_rows(
+    model: type[Model], rows: Iterable[dict[str, Any]], batch_size: int
+) -> int:
+    """
+    Inserts the rows (values by field attname, the same fields in every row)
+    with multi-row INSERT queries, without model instances: bulk_create spends
+    most of the time preparing the values of the instances.
+    The fields missing in the rows take the model defaults.
+    Returns the number of inserted rows.
+    """
+    rows = iter(rows)
+    first: dict[str, Any] | None = next(rows, None)
+    if first is None:
+        return 0
+    instance: Model = model()
+    fields: list[Field] = [
+        field for field in model._meta.concrete_fields if field.attname in first
+    ]
+    defaults: list[tuple[Field, Any]] = [
+        (field, field.get_db_prep_save(field.pre_save(instance, add=True), connection))
+        for field in model._meta.concrete_fields
+        if field.attname not in first and not field.primary_key
+    ]
+    adapters: list[Callable[[Any], Any] | None] = list(map(get_adapter, fields))
+    default_values: list[Any] = [value for _, value in defaults]
+    columns: list[str] = [field.column for field in fields] + [
+        field.column for field, _ in defaults
+    ]
+    # SQLite ограничивает число параметров одного запроса
+    size: int = min(
+        batch_size,
+        connection.ops.bulk_batch_size(
+            fields + [field for field, _ in defaults], range(batch_size)
+        ),
+    )
+    query: str = (
+        f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} "
+        f"({', '.join(map(connection.ops.quote_name, columns))}) VALUES "
+    )
+    placeholders: str = f"({', '.join(['%s'] * len(columns))})"
+    rows = chain([first], rows)
+    count: int = 0
+    with connection.cursor() as cursor:
+        while chunk := list(islice(rows, size)):
+            params: list[Any] = []
+            for row in chunk:
+                params += [
+                    row[field.attname] if adapt is None else adapt(row[field.attname])
+                    for field, adapt in zip(fields, adapters)
+                ]
+                params += default_values
+            cursor.execute(query + ", ".join([placeholders] * len(chunk)), params)
+            count += len(chunk)
+    return count
+
+
+def create_references(batch_size: int) -> dict[type[Model], list[int]]:
+    """
+    Creates the generated rows of the references, keeping the existing ones.
+    Returns the primary keys of all rows of the references in order.
+    """
+    for model, name in REFERENCE_NAMES.items():
+        model.objects.bulk_create(
+            [
+                model(
+                    name=f"{name} {number}",
+                    slug=f"load-{model._meta.model_name}-{number}",
+                )
+                for number in range(1, REFERENCES_COUNT + 1)
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+    return {
+        model: list(model.objects.order_by("pk").values_list("pk", flat=True))
+        for model in REFERENCE_NAMES
+    }
+
+
+class LoadDataGenerator:
+    """
+    Builds the rows of the load testing data as values by field attname.
+    The values depend only on the seed and the primary keys, the times are
+    counted from the current day, so the data of a seed is the same in an
+    empty database. The applications of the users repeat their data, so the
+    users are rebuilt from the primary keys instead of kept in memory.
+    """
+
+    def __init__(
+        self, seed: int, references: dict[type[Model], list[int]], origin: datetime
+    ) -> None:
+        self.seed = seed
+        self.random = Random(seed)
+        self.references = references
+        self.city_names: list[str] = list(
+            City.objects.order_by("pk").values_list("name", flat=True)
+        )
+        self.origin = origin
+        # Пароль всех созданных пользователей хешируется один раз
+        self.password: str = make_password(LOAD_DATA_PASSWORD)
+
+    def get_random(self, kind: str, pk: int) -> Random:
+        """Returns the random generator of the row, independent of the others."""
+        return Random(f"{self.seed}:{kind}:{pk}")
+
+    def get_specializations(self, random: Random) -> list[int]:
+        return random.sample(
+            self.references[Specialization],
+            k=min(random.randint(1, 3), len(self.references[Specialization])),
+        )
+
+    def get_notification_settings(self, random: Random, **kwargs) -> dict[str, Any]:
+        return {
+            "email_notifications": random.choice(NOTIFY_CHOICES),
+            "sms_notifications": random.choice(NOTIFY_CHOICES),
+            "telegram_notifications": random.choice(NOTIFY_CHOICES),
+            "phone_call_notifications": random.choice(NOTIFY_CHOICES),
+            **kwargs,
+        }
+
+    def build_speaker(self, pk: int) -> dict[str, Any]:
+        random: Random = self.get_random("speaker", pk)
+        return {
+            "id": pk,
+            "name": f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)} #{pk}",
+            "company": random.choice(COMPANIES),
+            "position": random.choice(POSITIONS),
+            "description": get_text(random, 12),
+        }
+
+    def build_user(self, pk: int) -> tuple[dict[str, Any], list[int]]:
+        """Returns the user with the primary keys of its specializations."""
+        random: Random = self.get_random("user", pk)
+        user: dict[str, Any] = {
+            "id": pk,
+            "email": f"user{pk}@{LOAD_DATA_EMAIL_DOMAIN}",
+            "password": self.password,
+            "first_name": random.choice(FIRST_NAMES),
+            "last_name": random.choice(LAST_NAMES),
+            "phone": f"7{pk:010d}",
+            "telegram": f"@user_{pk:05d}",
+            "birth_date": (
+                self.origin - timedelta(days=random.randint(6570, 21900))
+            ).date(),
+            "city": random.choice(self.city_names),
+            "activity": random.choice(User.ACTIVITY_CHOISES)[0],
+            "company": random.choice(COMPANIES),
+            "position": random.choice(POSITIONS),
+            "experience_years": random.randint(0, 30),
+            "date_joined": self.origin - timedelta(days=random.randint(1, 1000)),
+        }
+        return user, self.get_specializations(random)
+
+    def build_event(
+        self, pk: int, speakers: range, parts: int
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Returns the event with its agenda."""
+        random: Random = self.random
+        event_format: str = random.choice(Event.FORMAT_CHOISES)[0]
+        start_time: datetime = self.origin + timedelta(
+            days=random.randint(-60, 180), hours=random.randint(9, 18)
+        )
+        event: dict[str, Any] = {
+            "id": pk,
+            "name": f"{get_text(random, 3)} #{pk}",
+            "description": get_text(random, 40),
+            "is_deleted": random.random() < 0.05,
+            "status": random.choices(
+                [status for status, _ in Event.STATUS_CHOISES],
+                weights=[80, 5, 5, 10],
+            )[0],
+            "format": event_format,
+            "start_time": start_time,
+            "end_time": start_time + timedelta(hours=parts),
+            "cost": random.choice([0, 0, 0, 500, 1000, 3000]),
+            "city_id": (
+                None
+                if event_format == Event.FORMAT_ONLINE
+                else random.choice(self.references[City])
+            ),
+            "place": (
+                "" if event_format == Event.FORMAT_ONLINE else get_text(random, 2)
+            ),
+            "event_type_id": random.choice(self.references[EventType]),
+            "specializations_id": random.choice(self.references[Specialization]),
+            "participant_offline_limit": random.choice([None, 50, 100, 500]),
+            "participant_online_limit": random.choice([None, 500, 1000, 5000]),
+            "registration_deadline": start_time - timedelta(days=1),
+            "livestream_link": (
+                None
+                if event_format == Event.FORMAT_OFFLINE
+                else f"https://{LOAD_DATA_EMAIL_DOMAIN}/live/{pk}"
+            ),
+            "is_featured": random.random() < 0.1,
+        }
+        return event, [
+            {
+                "event_id": pk,
+                "name": get_text(random, 4),
+                "description": get_text(random, 15),
+                "speaker_id": random.choice(speakers) if speakers else None,
+                "start_time": start_time + timedelta(hours=number),
+                "presentation_type": random.choice(["лекция", "воркшоп", "дискуссия"]),
+            }
+            for number in range(parts)
+        ]
+
+    def build_applications(
+        self, event: dict[str, Any], users: range, count: int, first_pk: int
+    ) -> Iterator[tuple[dict[str, Any], list[int], dict[str, Any] | None]]:
+        """
+        Yields the applications of the event with the primary keys of their
+        specializations and the notification settings of the anonymous ones.
+        The users apply once per event with their data, the contacts of the
+        anonymous applications are unique.
+        """
+        random: Random = self.random
+        user_count: int = min(round(count * USER_APPLICATIONS_SHARE), len(users))
+        applicants: list[int | None] = random.sample(users, user_count)
+        applicants += [None] * (count - user_count)
+        for number, user_pk in enumerate(applicants):
+            pk: int = first_pk + number
+            application: dict[str, Any] = {
+                "id": pk,
+                "event_id": event["id"],
+                "user_id": user_pk,
+                "status": random.choices(
+                    [status for status, _ in Application.STATUS_CHOISES],
+                    weights=[50, 20, 25, 5],
+                )[0],
+                "created": event["start_time"] - timedelta(days=random.randint(2, 60)),
+                "format": (
+                    random.choice(Application.FORMAT_CHOISES)[0]
+                    if event["format"] == Event.FORMAT_HYBRID
+                    else event["format"]
+                ),
+                "source_id": random.choice(self.references[Source] + [None]),
+            }
+            if user_pk is not None:
+                user, specializations = self.build_user(user_pk)
+                application.update(
+                    {name: user[name] for name in APPLICATION_USER_FIELDS}
+                )
+                yield application, specializations, None
+                continue
+            application.update(
+                {
+                    "first_name": random.choice(FIRST_NAMES),
+                    "last_name": random.choice(LAST_NAMES),
+                    "email": f"guest{pk}@{LOAD_DATA_EMAIL_DOMAIN}",
+                    "phone": f"8{pk:010d}",
+                    "telegram": None,
+                    "birth_date": None,
+                    "city": None,
+                    "activity": random.choice(User.ACTIVITY_CHOISES)[0],
+                    "company": None,
+                    "position": None,
+                    "experience_years": None,
+                }
+            )
+            yield application, self.get_specializations(
+                random
+            ), self.get_notification_settings(random, application_id=pk)
+
+
+def create_users(generator: LoadDataGenerator, users: range, batch_size: int) -> None:
+    """Creates the users with their specializations and notification settings."""
+    pks: Iterator[int] = iter(users)
+    while chunk := list(islice(pks, batch_size)):
+        rows: list[tuple[dict[str, Any], list[int]]] = list(
+            map(generator.build_user, chunk)
+        )
+        insert_rows(User, (user for user, _ in rows), batch_size)
+        insert_rows(
+            User.specializations.through,
+            (
+                {"user_id": user["id"], "specialization_id": pk}
+                for user, specializations in rows
+                for pk in specializations
+            ),
+            batch_size,
+        )
+        insert_rows(
+            NotificationSettings,
+            (
+                generator.get_notification_settings(
+                    generator.get_random("notifications", pk), user_id=pk
+                )
+                for pk in chunk
+            ),
+            batch_size,
+        )
+
+
+def create_events(
+    generator: LoadDataGenerator,
+    events: range,
+    speakers: range,
+    parts: int,
+    users: range,
+    applications: int,
+    batch_size: int,
+) -> tuple[int, int]:
+    """
+    Creates the events with their agendas and applications, about batch_size
+    applications at a time. Returns the number of the parts and applications.
+    """
+    next_application_pk: int = get_next_pk(Application)
+    part_count: int = 0
+    application_count: int = 0
+    pks: Iterator[int] = iter(events)
+    while chunk := list(islice(pks, max(batch_size // max(applications, 1), 1))):
+        created: list[tuple[dict[str, Any], list[dict[str, Any]]]] = [
+            generator.build_event(pk, speakers, parts) for pk in chunk
+        ]
+        insert_rows(Event, (event for event, _ in created), batch_size)
+        part_count += insert_rows(
+            EventPart,
+            (part for _, event_parts in created for part in event_parts),
+            batch_size,
+        )
+        rows: list[tuple[dict[str, Any], list[int], dict[str, Any] | None]] = []
+        for event, _ in created:
+            rows += generator.build_applications(
+                event, users, applications, next_application_pk
+            )
+            next_application_pk += applications
+        application_count += insert_rows(
+            Application, (application for application, *_ in rows), batch_size
+        )
+        insert_rows(
+            Application.specializations.through,
+            (
+                {"application_id": application["id"], "specialization_id": pk}
+                for application, specializations, _ in rows
+                for pk in specializations
+            ),
+            batch_size,
+        )
+        insert_rows(
+            NotificationSettings,
+            (settings for *_, settings in rows if settings is not None),
+            batch_size,
+        )
+    return part_count, application_count
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a consistent graph of events with agendas, speakers, "
+        "users and applications for load testing with batched inserts. "
+        "The data is the same for the same seed in an empty database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+        parser.add_argument("--users", type=int, default=DEFAULT_USERS)
+        parser.add_argument(
+            "--applications-per-event",
+            type=int,
+            default=DEFAULT_APPLICATIONS_PER_EVENT,
+            help=(
+                f"{USER_APPLICATIONS_SHARE:.0%} of the applications are "
+                "submitted by the users, the others are anonymous."
+            ),
+        )
+        parser.add_argument(
+            "--parts-per-event", type=int, default=DEFAULT_PARTS_PER_EVENT
+        )
+        parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of rows inserted with one query.",
+        )
+
+    def log_step(self, name: str, count: int, started: float) -> None:
+        elapsed: float = time.perf_counter() - started
+        logger.info(
+            f"{name}: {count} rows in {elapsed:.2f} s, "
+            f"{count / max(elapsed, 1e-6):.0f} rows/s."
+        )
+
+    def handle(self, *args, **options):
+        numbers: tuple[str] = (
+            "events",
+            "users",
+            "applications_per_event",
+            "parts_per_event",
+        )
+        if any(options[name] < 0 for name in numbers):
+            raise CommandError("The numbers of rows must not be negative.")
+        batch_size: int = options["batch_size"]
+        started: float = time.perf_counter()
+        origin: datetime = timezone.localtime().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        with transaction.atomic():
+            step_started: float = time.perf_counter()
+            references = create_references(batch_size)
+            generator = LoadDataGenerator(options["seed"], references, origin)
+            self.log_step("References", REFERENCES_COUNT, step_started)
+
+            step_started = time.perf_counter()
+            first_speaker: int = get_next_pk(Speaker)
+            speakers: range = range(
+                first_speaker,
+                first_speaker
+                + options["events"] * options["parts_per_event"] // PARTS_PER_SPEAKER
+                + 1,
+            )
+            count: int = insert_rows(
+                Speaker, map(generator.build_speaker, speakers), batch_size
+            )
+            self.log_step("Speakers", count, step_started)
+
+            step_started = time.perf_counter()
+            first_user: int = get_next_pk(User)
+            users: range = range(first_user, first_user + options["users"])
+            create_users(generator, users, batch_size)
+            self.log_step("Users", len(users), step_started)
+
+            step_started = time.perf_counter()
+            first_event: int = get_next_pk(Event)
+            events: range = range(first_event, first_event + options["events"])
+            part_count, application_count = create_events(
+                generator,
+                events,
+                speakers,
+                options["parts_per_event"],
+                users,
+                options["applications_per_event"],
+                batch_size,
+            )
+            self.log_step(
+                "Events with agendas and applications",
+                len(events) + part_count + application_count,
+                step_started,
+            )
+            reset_sequences(
+                [Speaker, User, Event, EventPart, Application, NotificationSettings]
+            )
+
+        step_started = time.perf_counter()
+        refresh_loaded_events(events, batch_size)
+        self.log_step("Search documents", len(events), step_started)
+        self.log_step(
+            "Load data is generated",
+            len(speakers) + len(users) + len(events) + part_count + application_count,
+            started,
+        )
@@ -1,160 +1,288 @@
 import csv
 import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Model
 
+from api.cache import EVENTS_VERSION_KEY, bump_version
 from api.loggers import logger
+from api.services.reference_cache import REFERENCES_VERSION_KEY
 from config import settings
 from events.models import City, Event, EventPart, EventType, Speaker
+from events.search import refresh_search_documents
 from users.models import Specialization
 
 DATA_DIR = os.path.join(settings.BASE_DIR, "data")
+DEFAULT_BATCH_SIZE: int = 1000
+MODE_UPSERT: str = "upsert"
+MODE_REPLACE: str = "replace"
+# Поля, которые не загружаются из csv и не перезаписываются при обновлении
+NOT_LOADED_FIELDS: tuple[str] = (
+    "created",
+    "search_document",
+    "image_variants",
+    "photo_variants",
+)
+
+# Поля загружаемых строк с мероприятием, поисковый документ которого их включает
+SEARCH_DOCUMENT_EVENT_FIELDS: dict[type[Model], str] = {
+    Event: "pk",
+    EventPart: "event_id",
+}
+# Соответствие id из csv-файлов первичным ключам загруженных строк по моделям
+IdMaps = dict[type[Model], dict[str, int]]
+
+
+def read_rows(file_name: str) -> Iterator[dict[str, str]]:
+    """Streams the rows of a csv file from the data directory."""
+    with open(os.path.join(DATA_DIR, file_name), "r", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def is_true(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def get_pk(id_maps: IdMaps, model: type[Model], value: str) -> int:
+    """Returns the primary key of the row with the csv id, which must exist."""
+    try:
+        return id_maps[model][value]
+    except KeyError:
+        raise CommandError(f"{model.__name__} with id {value} does not exist.")
 
 
 # Begin readers list
-@transaction.atomic
-def read_cities() -> None:
-    """Reading from csv into City table."""
-    City.objects.all().delete()
-    with open(os.path.join(DATA_DIR, "City.csv"), "r", encoding="utf-8") as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            city: City = City(
-                id=row["id"],
-                name=row["name"],
-                slug=row["slug"],
-            )
-            city.save()
+def read_reference(model: type[Model]) -> Callable[..., Model]:
+    """
+    Returns the reader of a reference table (City, EventType, Specialization).
+    The references are upserted by slug, so their csv ids are not kept.
+    """
 
+    def read(row: dict[str, str], id_maps: IdMaps, upsert: bool) -> Model:
+        return model(
+            id=None if upsert else int(row["id"]),
+            name=row["name"],
+            slug=row["slug"],
+        )
 
-@transaction.atomic
-def read_event_types() -> None:
-    """Reading from csv into EventType table."""
-    EventType.objects.all().delete()
-    with open(os.path.join(DATA_DIR, "EventType.csv"), "r", encoding="utf-8") as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            event_type: EventType = EventType(
-                id=row["id"],
-                name=row["name"],
-                slug=row["slug"],
-            )
-            event_type.save()
+    read.__name__ = f"read_{model._meta.model_name}"
+    return read
 
 
-@transaction.atomic
-def read_specializations():
-    """Reading from csv into Specialization table."""
-    Specialization.objects.all().delete()
-    with open(
-        os.path.join(DATA_DIR, "Specialization.csv"),
-        "r",
-        encoding="utf-8",
-    ) as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            specialization: Specialization = Specialization(
-                id=row["id"],
-                name=row["name"],
-                slug=row["slug"],
-            )
-            specialization.save()
+def read_event(row: dict[str, str], id_maps: IdMaps, upsert: bool) -> Event:
+    """Reading a csv row of the Event table."""
+    return Event(
+        id=int(row["id"]),
+        name=row["name"],
+        organization=row["organization"],
+        description=row["description"],
+        is_deleted=is_true(row["is_deleted"]),
+        status=row["status"],
+        format=row["format"],
+        start_time=row["start_time"],
+        end_time=row["end_time"],
+        cost=row["cost"],
+        city_id=id_maps[City].get(row["city"]),
+        place=row["place"],
+        event_type_id=get_pk(id_maps, EventType, row["event_type"]),
+        specializations_id=get_pk(id_maps, Specialization, row["specialization"]),
+        participant_offline_limit=row["participant_offline_limit"],
+        participant_online_limit=row["participant_online_limit"],
+        registration_deadline=row["registration_deadline"],
+        livestream_link=row["livestream_link"],
+        additional_materials_link=row["additional_materials_link"],
+        image=row["image"],
+        is_featured=is_true(row["is_featured"]),
+        is_featured_on_yandex_afisha=is_true(row["is_featured_on_yandex_afisha"]),
+    )
 
 
-@transaction.atomic
-def read_events():
-    """Reading from csv into Event table."""
-    Event.objects.all().delete()
-    with open(os.path.join(DATA_DIR, "Events.csv"), "r", encoding="utf-8") as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            event: Event = Event(
-                id=row["id"],
-                name=row["name"],
-                organization=row["organization"],
-                description=row["description"],
-                is_deleted=(row["is_deleted"].lower() == "true"),
-                status=row["status"],
-                format=row["format"],
-                # created=row["created"],
-                start_time=row["start_time"],
-                end_time=row["end_time"],
-                cost=row["cost"],
-                city=City.objects.filter(pk=row["city"]).first(),
-                place=row["place"],
-                event_type=EventType.objects.get(pk=row["event_type"]),
-                specializations=Specialization.objects.get(pk=row["specialization"]),
-                participant_offline_limit=row["participant_offline_limit"],
-                participant_online_limit=row["participant_online_limit"],
-                registration_deadline=row["registration_deadline"],
-                livestream_link=row["livestream_link"],
-                additional_materials_link=row["additional_materials_link"],
-                image=row["image"],
-                is_featured=(row["is_featured"].lower() == "true"),
-                is_featured_on_yandex_afisha=(
-                    row["is_featured_on_yandex_afisha"].lower() == "true"
-                ),
-            )
-            event.save()
+def read_speaker(row: dict[str, str], id_maps: IdMaps, upsert: bool) -> Speaker:
+    """Reading a csv row of the Speaker table."""
+    return Speaker(
+        id=int(row["id"]),
+        name=row["name"],
+        company=row["company"],
+        position=row["position"],
+        description=row["description"],
+        photo=row["photo"],
+    )
 
 
-@transaction.atomic
-def read_speakers():
-    """Reading from csv into Speaker table."""
-    Speaker.objects.all().delete()
-    with open(os.path.join(DATA_DIR, "Speakers.csv"), "r", encoding="utf-8") as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            speaker: Speaker = Speaker(
-                id=row["id"],
-                name=row["name"],
-                company=row["company"],
-                position=row["position"],
-                description=row["description"],
-                photo=row["photo"],
-            )
-            speaker.save()
+def read_event_part(row: dict[str, str], id_maps: IdMaps, upsert: bool) -> EventPart:
+    """Reading a csv row of the EventPart table."""
+    return EventPart(
+        id=int(row["id"]),
+        event_id=get_pk(id_maps, Event, row["event"]),
+        name=row["name"],
+        description=row["description"],
+        speaker_id=id_maps[Speaker].get(row["speaker"]),
+        start_time=row["start_time"],
+        presentation_type=row["presentation_type"],
+    )
+
+
+# End readers list
+
+# Таблицы в порядке загрузки: модель, файл, читатель строк, поля для upsert
+TABLES: list[tuple[type[Model], str, Callable[..., Model], list[str]]] = [
+    (City, "City.csv", read_reference(City), ["slug"]),
+    (EventType, "EventType.csv", read_reference(EventType), ["slug"]),
+    (Specialization, "Specialization.csv", read_reference(Specialization), ["slug"]),
+    (Event, "Events.csv", read_event, ["id"]),
+    (Speaker, "Speakers.csv", read_speaker, ["id"]),
+    (EventPart, "EventPart.csv", read_event_part, ["id"]),
+]
+
+
+def preload_id_maps() -> IdMaps:
+    """
+    Loads the primary keys of the existing rows of the tables loaded by id, so
+    the rows of the files can reference them without a query per row.
+    """
+    return {
+        model: (
+            {}
+            if unique_fields != ["id"]
+            else {str(pk): pk for pk in model.objects.values_list("pk", flat=True)}
+        )
+        for model, _, _, unique_fields in TABLES
+    }
 
 
 @transaction.atomic
-def read_event_parts():
-    """Reading from csv into EventPart table."""
-    EventPart.objects.all().delete()
-    with open(os.path.join(DATA_DIR, "EventPart.csv"), "r", encoding="utf-8") as f:
-        reader: csv.DictReader = csv.DictReader(f)
-        for row in reader:
-            event_part: EventPart = EventPart(
-                id=row["id"],
-                event=Event.objects.get(pk=row["event"]),
-                name=row["name"],
-                description=row["description"],
-                speaker=Speaker.objects.filter(pk=row["speaker"]).first(),
-                start_time=row["start_time"],
-                presentation_type=row["presentation_type"],
+def load_table(
+    model: type[Model],
+    rows: Iterable[dict[str, str]],
+    reader: Callable[..., Model],
+    unique_fields: list[str],
+    id_maps: IdMaps,
+    batch_size: int,
+    upsert: bool,
+    loaded_events: set[int],
+) -> int:
+    """
+    Inserts the rows into the table with bulk_create in chunks of batch_size,
+    updating the existing rows with the same unique fields if upsert; without
+    upsert the table is emptied first. Collects the events whose search
+    documents include the loaded rows. Returns the number of loaded rows.
+    """
+    event_field: str | None = SEARCH_DOCUMENT_EVENT_FIELDS.get(model)
+    update_fields: list[str] = [
+        field.name
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+        and field.name not in unique_fields
+        and field.name not in NOT_LOADED_FIELDS
+    ]
+    if not upsert:
+        model.objects.all().delete()
+        id_maps[model] = {}
+    rows = iter(rows)
+    count: int = 0
+    while chunk := list(islice(rows, batch_size)):
+        instances: list[Model] = [reader(row, id_maps, upsert) for row in chunk]
+        if upsert:
+            model.objects.bulk_create(
+                instances,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
             )
-            event_part.save()
+        else:
+            model.objects.bulk_create(instances)
+        for row, instance in zip(chunk, instances):
+            id_maps[model][row["id"]] = instance.pk
+            if event_field is not None:
+                loaded_events.add(getattr(instance, event_field))
+        count += len(chunk)
+    return count
 
 
-# End readers list
+def reset_sequences(models: list[type[Model]]) -> None:
+    """Moves the primary key sequences past the ids loaded from the files."""
+    statements: list[str] = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def refresh_loaded_events(event_ids: Iterable[int], batch_size: int) -> None:
+    """
+    Rebuilds the search documents of the loaded events in chunks and
+    invalidates the caches, the bulk inserts do not send signals.
+    """
+    event_ids = iter(event_ids)
+    while chunk := list(islice(event_ids, batch_size)):
+        refresh_search_documents(chunk)
+    bump_version(EVENTS_VERSION_KEY)
+    bump_version(REFERENCES_VERSION_KEY)
 
 
 class Command(BaseCommand):
+    help = (
+        "Loads the events, their agendas, speakers and references from the csv "
+        "files of the data directory with bulk inserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=[MODE_UPSERT, MODE_REPLACE],
+            default=MODE_UPSERT,
+            help=(
+                "upsert (default) updates the existing rows with the same id "
+                "(slug for the references) and inserts the others, replace "
+                "deletes the existing rows of each table first."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of rows inserted with one query.",
+        )
+
     def handle(self, *args, **options):
-        for func in (
-            read_cities,
-            read_event_types,
-            read_specializations,
-            read_events,
-            read_speakers,
-            read_event_parts,
-        ):
-            logger.info(f"Begin {func.__name__}...")
+        upsert: bool = options["mode"] == MODE_UPSERT
+        batch_size: int = options["batch_size"]
+        id_maps: IdMaps = preload_id_maps()
+        loaded_events: set[int] = set()
+        started: float = time.perf_counter()
+        total: int = 0
+        for model, file_name, reader, unique_fields in TABLES:
+            logger.info(f"Begin {reader.__name__}...")
+            table_started: float = time.perf_counter()
             try:
-                func()
-                logger.info(f"{func.__name__} successfully executed.")
+                count: int = load_table(
+                    model,
+                    read_rows(file_name),
+                    reader,
+                    unique_fields,
+                    id_maps,
+                    batch_size,
+                    upsert,
+                    loaded_events,
+                )
             except Exception as e:
-                logger.error(f"{func.__name__} failed.\n{e}")
+                logger.error(f"{reader.__name__} failed.\n{e}")
                 break
+            elapsed: float = time.perf_counter() - table_started
+            total += count
+            logger.info(
+                f"{reader.__name__} successfully executed: {count} rows in "
+                f"{elapsed:.2f} s, {count / max(elapsed, 1e-6):.0f} rows/s."
+            )
+        reset_sequences([model for model, *_ in TABLES])
+        refresh_loaded_events(sorted(loaded_events), batch_size)
 
-        logger.info("Loading data from csv is completed.")
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Loading data from csv is completed: {total} rows in {elapsed:.2f} s, "
+            f"{total / max(elapsed, 1e-6):.0f} rows/s."
+        )
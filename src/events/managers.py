@@ -0,0 +1,92 @@
+from django.db.models import Count, Exists, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+FIRST_SPEAKER_FIELDS: tuple[str] = (
+    "id",
+    "name",
+    "company",
+    "position",
+    "description",
+    "photo",
+    "photo_variants",
+)
+
+
+class EventQuerySet(QuerySet):
+    """Custom queryset for the Event model."""
+
+    def _applications(self):
+        """Returns the queryset of applications related to events."""
+        return self.model._meta.get_field("applications").related_model.objects
+
+    def _applications_count(self, **filters) -> Coalesce:
+        """Builds a subquery counting applications to the outer event."""
+        return Coalesce(
+            Subquery(
+                self._applications()
+                .filter(event=OuterRef("pk"), **filters)
+                .order_by()
+                .values("event")
+                .annotate(count=Count("pk"))
+                .values("count")
+            ),
+            0,
+        )
+
+    def with_application_counts(self, *fields: str) -> "EventQuerySet":
+        """
+        Annotates events with the number of submitted applications (in total and
+        per participation format), counted on the database side. The names of the
+        needed counts may be passed to skip the other subqueries.
+        """
+        filters: dict[str, dict] = {
+            "submitted_applications": {},
+            "submitted_applications_offline": {"format": self.model.FORMAT_OFFLINE},
+            "submitted_applications_online": {"format": self.model.FORMAT_ONLINE},
+        }
+        return self.annotate(
+            **{
+                field: self._applications_count(**field_filters)
+                for field, field_filters in filters.items()
+                if not fields or field in fields
+            }
+        )
+
+    def with_registration_status(self, user) -> "EventQuerySet":
+        """
+        Annotates events with the is_registrated flag showing whether the user
+        has submitted an application to participate in the event.
+        """
+        return self.annotate(
+            is_registrated=Exists(
+                self._applications().filter(user=user, event=OuterRef("pk"))
+            )
+        )
+
+    def recommended_for(self, user) -> "EventQuerySet":
+        """
+        Returns future events in the order they should be recommended to the user:
+        events of the user's specializations go first, then the soonest ones.
+        """
+        queryset = self.filter(start_time__gt=timezone.now())
+        if user.is_anonymous:
+            return queryset.order_by("start_time", "pk")
+        return queryset.annotate(
+            matches_specializations=Exists(
+                user.specializations.filter(pk=OuterRef("specializations"))
+            )
+        ).order_by("-matches_specializations", "start_time", "pk")
+
+    def with_first_speaker(self) -> "EventQuerySet":
+        """
+        Annotates events with the id of the speaker of the earliest event part
+        having a speaker, as first_speaker_id, with one subquery; the speakers
+        themselves are loaded for all the events at once.
+        """
+        parts = (
+            self.model._meta.get_field("parts")
+            .related_model.objects.filter(event=OuterRef("pk"), speaker__isnull=False)
+            .order_by("start_time", "pk")
+        )
+        return self.annotate(first_speaker_id=Subquery(parts.values("speaker")[:1]))
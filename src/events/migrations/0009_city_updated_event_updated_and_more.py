@@ -0,0 +1,48 @@
+# Generated by Django 5.0.4 on 2026-10-18 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0008_alter_eventpart_presentation_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="city",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventpart",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventtype",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+        migrations.AddField(
+            model_name="speaker",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:03
+
+from collections import defaultdict
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+SEARCH_CONFIG = "russian"
+SEARCH_FTS_TABLE = "events_event_fts"
+
+
+def fill_search_documents(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    EventPart = apps.get_model("events", "EventPart")
+    speakers = defaultdict(list)
+    for event_id, name, company in (
+        EventPart.objects.filter(speaker__isnull=False)
+        .order_by("start_time", "pk")
+        .values_list("event_id", "speaker__name", "speaker__company")
+    ):
+        speakers[event_id] += [name, company]
+    events = list(Event.objects.only("pk", "description"))
+    for event in events:
+        event.search_document = "\n".join([event.description, *speakers[event.pk]])
+    Event.objects.bulk_update(events, ["search_document"], batch_size=1000)
+
+
+def create_search_index(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.add_index(Event, search_vector_index())
+        schema_editor.add_index(Event, search_trigram_index())
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5("
+            "name, search_document, tokenize='unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, name, search_document) "
+            "SELECT id, name, search_document FROM events_event"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.remove_index(Event, search_vector_index())
+        schema_editor.remove_index(Event, search_trigram_index())
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE {SEARCH_FTS_TABLE}")
+
+
+def search_vector_index():
+    return GinIndex(
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("search_document", weight="B", config=SEARCH_CONFIG),
+        name="event_search_vector_idx",
+    )
+
+
+def search_trigram_index():
+    return GinIndex(
+        fields=["name", "search_document"],
+        opclasses=["gin_trgm_ops", "gin_trgm_ops"],
+        name="event_search_trigram_idx",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0009_city_updated_event_updated_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="search_document",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Описание мероприятия, имена и места работы спикеров для поиска",
+                verbose_name="Поисковый документ",
+            ),
+        ),
+        migrations.RunPython(fill_search_documents, migrations.RunPython.noop),
+        TrigramExtension(),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0010_event_search_document"),
+        ("users", "0004_specialization_updated"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["start_time", "id"], name="event_start_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["start_time", "id"],
+                name="event_active_start_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_featured", True)),
+                fields=["start_time"],
+                name="event_featured_start_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["status", "start_time"], name="event_status_start_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["format", "start_time"], name="event_format_start_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["specializations", "start_time"],
+                name="event_spec_start_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["event_type", "start_time"], name="event_type_start_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["city", "start_time"], name="event_city_start_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventpart",
+            index=models.Index(
+                fields=["event", "start_time"], name="eventpart_event_start_time_idx"
+            ),
+        ),
+    ]
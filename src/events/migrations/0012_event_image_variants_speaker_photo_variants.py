@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0011_event_event_start_time_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Уменьшенные копии афиши, создаются в фоне после загрузки",
+                verbose_name="Варианты афиши",
+            ),
+        ),
+        migrations.AddField(
+            model_name="speaker",
+            name="photo_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Уменьшенные копии фото, создаются в фоне после загрузки",
+                verbose_name="Варианты фото",
+            ),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from .managers import EventQuerySet
 from .utils import EVENT_ENDTIME_ERROR, EVENT_PART_STARTTIME_ERROR
 from users.models import Specialization
 
@@ -12,6 +13,7 @@ class EventType(models.Model):
 
     name = models.CharField("Название", max_length=40, unique=True)
     slug = models.SlugField("Слаг", max_length=40, unique=True)
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Тип мероприятия"
@@ -26,6 +28,7 @@ class City(models.Model):
 
     name = models.CharField("Название", max_length=40, unique=True)
     slug = models.SlugField("Слаг", max_length=40, unique=True)
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Город"
@@ -43,6 +46,14 @@ class Speaker(models.Model):
     position = models.CharField("Должность", max_length=100)
     description = models.TextField("Регалии", blank=True)
     photo = models.ImageField("Фото", upload_to="speakers/", blank=True)
+    photo_variants = models.JSONField(
+        "Варианты фото",
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Уменьшенные копии фото, создаются в фоне после загрузки",
+    )
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Спикер"
@@ -92,6 +103,7 @@ class Event(models.Model):
         "Формат", max_length=7, choices=FORMAT_CHOISES, default=FORMAT_HYBRID
     )
     created = models.DateTimeField("Создано", default=timezone.now)
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
     start_time = models.DateTimeField("Время начала")
     end_time = models.DateTimeField("Время окончания", blank=True, null=True)
     cost = models.FloatField("Стоимость", default=0, validators=[MinValueValidator(0)])
@@ -136,14 +148,58 @@ class Event(models.Model):
         "Дополнительные материалы", blank=True, null=True
     )
     image = models.ImageField("Афиша", upload_to="events/", blank=True)
+    image_variants = models.JSONField(
+        "Варианты афиши",
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Уменьшенные копии афиши, создаются в фоне после загрузки",
+    )
     is_featured = models.BooleanField("Продвигать на Главной", default=False)
     is_featured_on_yandex_afisha = models.BooleanField(
         "Продвигать на Яндекс Афише", default=False
     )
+    search_document = models.TextField(
+        "Поисковый документ",
+        blank=True,
+        editable=False,
+        help_text="Описание мероприятия, имена и места работы спикеров для поиска",
+    )
+
+    objects = EventQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Мероприятие"
         verbose_name_plural = "Мероприятия"
+        indexes = [
+            models.Index(fields=["start_time", "id"], name="event_start_time_idx"),
+            models.Index(
+                fields=["start_time", "id"],
+                name="event_active_start_time_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["start_time"],
+                name="event_featured_start_time_idx",
+                condition=models.Q(is_featured=True),
+            ),
+            models.Index(
+                fields=["status", "start_time"], name="event_status_start_time_idx"
+            ),
+            models.Index(
+                fields=["format", "start_time"], name="event_format_start_time_idx"
+            ),
+            models.Index(
+                fields=["specializations", "start_time"],
+                name="event_spec_start_time_idx",
+            ),
+            models.Index(
+                fields=["event_type", "start_time"], name="event_type_start_time_idx"
+            ),
+            models.Index(
+                fields=["city", "start_time"], name="event_city_start_time_idx"
+            ),
+        ]
 
     def clean(self):
         """Checks that start_time is not later than end_time."""
@@ -174,12 +230,18 @@ class EventPart(models.Model):
         null=True,
     )
     created = models.DateTimeField("Создано", default=timezone.now)
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
     start_time = models.DateTimeField("Время начала")
     presentation_type = models.CharField("Тип", max_length=100, blank=True, null=True)
 
     class Meta:
         verbose_name = "Часть мероприятия"
         verbose_name_plural = "Части мероприятий"
+        indexes = [
+            models.Index(
+                fields=["event", "start_time"], name="eventpart_event_start_time_idx"
+            ),
+        ]
 
     def clean_fields(self, exclude=None):
         """Checks that start_time is not earlier than the event start time."""
@@ -6,6 +6,27 @@ EVENT_LIST_DESCRIPTION: str = (
     "Endpoint to get list of events, accessible to both authorized and unauthorized "
     "visitors, events can be filtered and sorted (ordered)."
 )
+EVENT_FIELDSET_PARAMS = [
+    openapi.Parameter(
+        "fields",
+        openapi.IN_QUERY,
+        description=(
+            "comma-separated names of the fields to return, the id is always "
+            "returned; the data needed only by the other fields is not loaded. "
+            "Input example: ?fields=name,start_time,image"
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "omit",
+        openapi.IN_QUERY,
+        description=(
+            "comma-separated names of the fields not to return, input example: "
+            "?omit=description,submitted_applications"
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+]
 EVENT_LIST_FILTERS = [
     openapi.Parameter(
         "name",
@@ -16,6 +37,16 @@ EVENT_LIST_FILTERS = [
         ),
         type=openapi.TYPE_STRING,
     ),
+    openapi.Parameter(
+        "search",
+        openapi.IN_QUERY,
+        description=(
+            "full-text search by name, description, speaker names and companies, "
+            "case-insensitive, matches word beginnings, the most relevant events "
+            "go first unless the ordering parameter is passed"
+        ),
+        type=openapi.TYPE_STRING,
+    ),
     openapi.Parameter(
         "is_deleted",
         openapi.IN_QUERY,
@@ -152,4 +183,26 @@ EVENT_LIST_FILTERS = [
         ),
         type=openapi.TYPE_STRING,
     ),
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description=(
+            "Switches the list to cursor pagination without the count of events, "
+            "for infinite scroll. Pass an empty value for the first page, then "
+            "follow the next and previous links. The cursor is only valid for the "
+            "ordering it was received with. Input example: ?cursor=&ordering=name"
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+    *EVENT_FIELDSET_PARAMS,
+]
+# Экспорт выгружает все мероприятия целиком: без пагинации и выбора полей
+EVENT_EXPORT_FILTERS = [
+    parameter
+    for parameter in EVENT_LIST_FILTERS
+    if parameter.name not in ("cursor", "fields", "omit")
+]
+# Счетчики считаются по фильтрам списка, порядок и поля ответа не нужны
+EVENT_FACETS_FILTERS = [
+    parameter for parameter in EVENT_EXPORT_FILTERS if parameter.name != "ordering"
 ]
@@ -0,0 +1,157 @@
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import Case, FloatField, Q, QuerySet, Value, When
+from django.db.models.expressions import RawSQL
+
+from .models import Event, EventPart
+
+SEARCH_CONFIG: str = "russian"
+SEARCH_FTS_TABLE: str = "events_event_fts"
+# Во сколько раз совпадение в названии весомее совпадения в остальном тексте
+SEARCH_NAME_WEIGHT: float = 10.0
+SEARCH_TOKEN_REGEX: str = r"\w+"
+
+
+def build_search_documents(event_ids: Iterable[int]) -> dict[int, str]:
+    """Builds the search documents of the events from descriptions and agendas."""
+    event_ids = list(event_ids)
+    speakers: dict[int, list[str]] = defaultdict(list)
+    for event_id, name, company in (
+        EventPart.objects.filter(event_id__in=event_ids, speaker__isnull=False)
+        .order_by("start_time", "pk")
+        .values_list("event_id", "speaker__name", "speaker__company")
+    ):
+        speakers[event_id] += [name, company]
+    return {
+        event_id: "\n".join([description, *speakers[event_id]])
+        for event_id, description in Event.objects.filter(pk__in=event_ids).values_list(
+            "pk", "description"
+        )
+    }
+
+
+def refresh_search_documents(event_ids: Iterable[int]) -> None:
+    """
+    Rebuilds the search documents of the events and updates the search index.
+    Signals call it on every change of events, their agendas and speakers,
+    writes bypassing signals (bulk operations) must call it explicitly.
+    """
+    documents: dict[int, str] = build_search_documents(event_ids)
+    events: list[Event] = [
+        Event(pk=event_id, search_document=document)
+        for event_id, document in documents.items()
+    ]
+    Event.objects.bulk_update(events, ["search_document"], batch_size=1000)
+    if connection.vendor != "sqlite" or not documents:
+        return
+    names: dict[int, str] = dict(
+        Event.objects.filter(pk__in=documents).values_list("pk", "name")
+    )
+    delete_search_documents(documents)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, name, search_document) "
+            "VALUES (%s, %s, %s)",
+            [
+                (event_id, names[event_id], document)
+                for event_id, document in documents.items()
+            ],
+        )
+
+
+def delete_search_documents(event_ids: Iterable[int]) -> None:
+    """Removes the events from the search index."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid = %s",
+            [(event_id,) for event_id in event_ids],
+        )
+
+
+def search_events(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filters the events matching the search query by name, description, speaker
+    names and companies and annotates them with the search_rank relevance,
+    the most relevant events go first. PostgreSQL uses the tsvector and trigram
+    GIN indexes, SQLite uses the SEARCH_FTS_TABLE FTS5 table.
+    """
+    if connection.vendor == "postgresql":
+        queryset = _search_postgresql(queryset, query)
+    elif connection.vendor == "sqlite":
+        queryset = _search_sqlite(queryset, query)
+    else:
+        queryset = _search_icontains(queryset, query)
+    return queryset.order_by("-search_rank")
+
+
+def _search_postgresql(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Searches with the tsvector index (stemmed words, websearch syntax) and ranks
+    the matches by ts_rank plus the trigram word similarity to the name,
+    which also finds names with typos and incomplete words.
+    """
+    vector = SearchVector("name", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "search_document", weight="B", config=SEARCH_CONFIG
+    )
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.alias(search_vector=vector)
+        .annotate(
+            search_rank=SearchRank(vector, search_query)
+            + TrigramWordSimilarity(query, "name")
+        )
+        .filter(
+            Q(search_vector=search_query)
+            | Q(name__trigram_word_similar=query)
+            | Q(search_document__trigram_word_similar=query)
+        )
+    )
+
+
+def _search_sqlite(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Searches the FTS5 table for all the words of the query as prefixes
+    and ranks the matches by bm25 with the name column weighted higher.
+    """
+    tokens: list[str] = re.findall(SEARCH_TOKEN_REGEX, query)
+    if not tokens:
+        return queryset.none().annotate(search_rank=Value(0.0))
+    match: str = " ".join(f'"{token}"*' for token in tokens)
+    table: str = queryset.model._meta.db_table
+    return queryset.filter(
+        pk__in=RawSQL(
+            f"SELECT rowid FROM {SEARCH_FTS_TABLE} WHERE {SEARCH_FTS_TABLE} MATCH %s",
+            (match,),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT -bm25({SEARCH_FTS_TABLE}, %s, 1.0) FROM {SEARCH_FTS_TABLE} "
+            f'WHERE {SEARCH_FTS_TABLE} MATCH %s AND rowid = "{table}"."id"',
+            (SEARCH_NAME_WEIGHT, match),
+            output_field=FloatField(),
+        )
+    )
+
+
+def _search_icontains(queryset: QuerySet, query: str) -> QuerySet:
+    """Unindexed fallback for other databases: matches in the name go first."""
+    return queryset.filter(
+        Q(name__icontains=query) | Q(search_document__icontains=query)
+    ).annotate(
+        search_rank=Case(
+            When(name__icontains=query, then=Value(SEARCH_NAME_WEIGHT)),
+            default=Value(1.0),
+            output_field=FloatField(),
+        )
+    )
@@ -1,25 +1,65 @@
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from functools import partial
+from operator import itemgetter
 from typing import Any
 
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Prefetch
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils import timezone
 from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
+from .managers import FIRST_SPEAKER_FIELDS
 from .models import City, Event, EventPart, EventType, Speaker
+from .search import refresh_search_documents
+from .signals import schedule_image_variants
 from .utils import (
     EVENT_CITY_REQUIRED_ERROR,
     EVENT_PART_NO_NAME_ERROR,
     EVENT_PART_NO_START_TIME_ERROR,
+    EVENT_PART_NOT_FOUND_ERROR,
     EVENT_PART_STARTTIME_ERROR,
     EVENT_PLACE_REQUIRED_ERROR,
+    RECOMMENDED_EVENTS_DEFAULT_LIMIT,
+    RECOMMENDED_EVENTS_MAX_LIMIT,
     SPEAKER_CREATE_VALIDATION_ERROR,
     SPEAKER_PATCH_NO_NAME_ERROR,
 )
-from api.services.image_decoder import Base64ImageField
-from applications.models import Application
+from api.cache import EVENTS_VERSION_KEY, bump_version
+from api.services.image_decoder import Base64ImageField, close_decoded_files
+from api.services.image_variants import ImageVariantsField, get_variant_urls
+from api.services.reference_cache import ReferencePrimaryKeyRelatedField
+from applications.serializers import SourceSerializer
 from users.models import Specialization
 
 
+def set_changed_fields(instance, data: dict[str, Any]) -> set[str]:
+    """
+    Sets the values of the instance fields which differ from the data and
+    returns their names; the time of the update is set for the changed instance.
+    """
+    fields: set[str] = {
+        field for field, value in data.items() if getattr(instance, field) != value
+    }
+    for field in fields:
+        setattr(instance, field, data[field])
+    if fields:
+        instance.updated = timezone.now()
+    return fields
+
+
+def load_first_speakers(speaker_ids: Iterable[int | None]) -> dict[int, Speaker]:
+    """
+    Loads the first speakers of the events (annotated by with_first_speaker)
+    with one query, only with the represented fields.
+    """
+    return Speaker.objects.only(*FIRST_SPEAKER_FIELDS).in_bulk(
+        {speaker_id for speaker_id in speaker_ids if speaker_id is not None}
+    )
+
+
 class EventTypeSerializer(serializers.ModelSerializer):
     """Serializer for handling event types."""
 
@@ -78,6 +118,15 @@ class SpecializationSerializer(serializers.ModelSerializer):
         ref_name = "UserSpecialization"
 
 
+class BootstrapSerializer(serializers.Serializer):
+    """Serializer for handling all the reference data in one response."""
+
+    cities = CitySerializer(many=True, read_only=True)
+    event_types = EventTypeSerializer(many=True, read_only=True)
+    specializations = SpecializationSerializer(many=True, read_only=True)
+    sources = SourceSerializer(many=True, read_only=True)
+
+
 class SpeakerSerializer(serializers.ModelSerializer):
     """Serializer for handling speakers."""
 
@@ -92,6 +141,9 @@ class SpeakerSerializer(serializers.ModelSerializer):
         required=False,
     )
     photo = Base64ImageField(required=False)
+    photo_variants = ImageVariantsField(
+        "photo", label=Speaker._meta.get_field("photo_variants").verbose_name
+    )
 
     class Meta:
         model = Speaker
@@ -102,6 +154,7 @@ class SpeakerSerializer(serializers.ModelSerializer):
             "position",
             "speaker_description",
             "photo",
+            "photo_variants",
         ]
 
 
@@ -142,6 +195,15 @@ class EventPartSerializer(serializers.ModelSerializer):
         ordering_fields = ["id"]
 
 
+class EventPartUpsertSerializer(EventPartSerializer):
+    """
+    Serializer for handling event parts of an edited event: the parts with id
+    are updated, the parts without id are created.
+    """
+
+    id = serializers.IntegerField(label="ID", required=False)
+
+
 class EventListSerializer(serializers.ModelSerializer):
     """Serializer for handling a list of events."""
 
@@ -149,9 +211,26 @@ class EventListSerializer(serializers.ModelSerializer):
     city = CitySerializer(allow_null=True)
     specializations = SpecializationSerializer(read_only=True)
     is_registrated = serializers.SerializerMethodField()
-    submitted_applications = serializers.SerializerMethodField()
+    submitted_applications = serializers.IntegerField(
+        read_only=True,
+        label="Заявки",
+        help_text="Number of applications submitted to participate in the event",
+    )
+    submitted_applications_offline = serializers.IntegerField(
+        read_only=True,
+        label="Офлайн-заявки",
+        help_text="Number of applications submitted to participate offline",
+    )
+    submitted_applications_online = serializers.IntegerField(
+        read_only=True,
+        label="Онлайн-заявки",
+        help_text="Number of applications submitted to participate online",
+    )
     first_speaker = serializers.SerializerMethodField()
     image = Base64ImageField()
+    image_variants = ImageVariantsField(
+        "image", label=Event._meta.get_field("image_variants").verbose_name
+    )
     format = serializers.CharField(source="get_format_display")
 
     class Meta:
@@ -162,6 +241,8 @@ class EventListSerializer(serializers.ModelSerializer):
             "is_deleted",
             "is_registrated",
             "submitted_applications",
+            "submitted_applications_offline",
+            "submitted_applications_online",
             "first_speaker",
             "organization",
             "description",
@@ -179,34 +260,57 @@ class EventListSerializer(serializers.ModelSerializer):
             "livestream_link",
             "additional_materials_link",
             "image",
+            "image_variants",
             "is_featured",
             "is_featured_on_yandex_afisha",
             "event_type",
             "specializations",
         ]
 
+    def __init__(self, *args, fields: list[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     @classmethod
-    def setup_eager_loading(cls, queryset, user):
-        """Performs necessary joins and annotations for eager loading of event list."""
-        if user.is_anonymous:
-            return queryset.select_related(
-                "event_type", "specializations", "city"
-            ).prefetch_related(
-                "applications",
-                Prefetch("parts", queryset=EventPart.objects.select_related("speaker")),
-            )
-        return (
-            queryset.select_related("event_type", "specializations", "city")
-            .prefetch_related(
-                "applications",
-                Prefetch("parts", queryset=EventPart.objects.select_related("speaker")),
-            )
-            .annotate(
-                is_registrated=Exists(
-                    Application.objects.filter(user=user, event=OuterRef("id"))
+    def setup_eager_loading(cls, queryset, user, fields: list[str] | None = None):
+        """
+        Performs necessary joins and annotations for eager loading of the fields
+        declared in the serializer. If only some of the fields are requested,
+        the columns, joins and subqueries needed only by the others are skipped.
+        """
+        if fields is None:
+            fields = cls.Meta.fields
+        else:
+            queryset = queryset.only(
+                *(
+                    field.name
+                    for field in Event._meta.concrete_fields
+                    if field.primary_key or field.name in fields
                 )
             )
-        )
+        related: list[str] = [
+            field
+            for field in ("event_type", "specializations", "city")
+            if field in fields
+        ]
+        if related:
+            queryset = queryset.select_related(*related)
+        application_counts: list[str] = [
+            field for field in fields if field.startswith("submitted_applications")
+        ]
+        if application_counts:
+            queryset = queryset.with_application_counts(*application_counts)
+        if "first_speaker" in fields:
+            queryset = queryset.with_first_speaker()
+        if "event_parts" in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch("parts", queryset=EventPart.objects.select_related("speaker"))
+            )
+        if user.is_anonymous or "is_registrated" not in fields:
+            return queryset
+        return queryset.with_registration_status(user)
 
     def get_is_registrated(self, obj) -> bool:
         """
@@ -215,20 +319,29 @@ class EventListSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if not request or request.user.is_anonymous:
             return False
-        return obj.is_registrated
-
-    def get_submitted_applications(self, obj) -> int:
-        """Shows the number of applications submitted to participate in the event."""
-        return obj.applications.count()
+        return getattr(obj, "is_registrated", False)
 
     @swagger_serializer_method(SpeakerSerializer)
     def get_first_speaker(self, obj):
-        """Shows the speaker of the first presentation of the event."""
-        if obj.parts:
-            speakers = [part.speaker for part in obj.parts.all() if part.speaker]
-            if speakers:
-                return SpeakerSerializer(speakers[0]).data
-        return None
+        """Shows the speaker of the earliest presentation of the event."""
+        speaker: Speaker | None = self.get_first_speakers().get(obj.first_speaker_id)
+        return None if speaker is None else SpeakerSerializer(speaker).data
+
+    def get_first_speakers(self) -> dict[int, Speaker]:
+        """
+        Returns the first speakers of all the serialized events, loaded with
+        one query on the first use.
+        """
+        if not hasattr(self, "_first_speakers"):
+            events = (
+                self.parent.instance
+                if isinstance(self.parent, serializers.ListSerializer)
+                else [self.instance]
+            )
+            self._first_speakers = load_first_speakers(
+                event.first_speaker_id for event in events
+            )
+        return self._first_speakers
 
 
 class EventDetailSerializer(EventListSerializer):
@@ -246,6 +359,8 @@ class EventDetailSerializer(EventListSerializer):
             "is_deleted",
             "is_registrated",
             "submitted_applications",
+            "submitted_applications_offline",
+            "submitted_applications_online",
             "organization",
             "description",
             "status",
@@ -262,6 +377,7 @@ class EventDetailSerializer(EventListSerializer):
             "livestream_link",
             "additional_materials_link",
             "image",
+            "image_variants",
             "is_featured",
             "is_featured_on_yandex_afisha",
             "event_type",
@@ -270,14 +386,187 @@ class EventDetailSerializer(EventListSerializer):
         ]
 
 
+def _datetime_representation(value: datetime | None) -> str | None:
+    """Represents a datetime the way serializers.DateTimeField does."""
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    if value.endswith("+00:00"):
+        return value[:-6] + "Z"
+    return value
+
+
+class EventListFastSerializer:
+    """
+    Read-only serializer building the same output as EventListSerializer from
+    a .values() projection of events (see project), without DRF fields machinery:
+    the values are converted directly and the choice labels are precomputed.
+    """
+
+    Meta = EventListSerializer.Meta
+
+    FORMAT_DISPLAY: dict[str, str] = dict(Event.FORMAT_CHOISES)
+    # Столбцы проекции для полей-связей, остальные поля берутся из одноимённых
+    # столбцов модели или аннотаций setup_eager_loading
+    RELATED_COLUMNS: dict[str, tuple[str]] = {
+        "city": ("city_id", "city__name", "city__slug"),
+        "event_type": ("event_type_id", "event_type__name", "event_type__slug"),
+        "specializations": (
+            "specializations_id",
+            "specializations__name",
+            "specializations__slug",
+        ),
+    }
+    DATETIME_FIELDS: tuple[str] = (
+        "created",
+        "start_time",
+        "end_time",
+        "registration_deadline",
+    )
+
+    def __init__(
+        self,
+        instance=None,
+        many: bool = False,
+        context=None,
+        fields: list[str] | None = None,
+        **kwargs,
+    ):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+        self.fields: list[str] = [
+            field for field in self.Meta.fields if fields is None or field in fields
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, user, fields: list[str] | None = None):
+        return EventListSerializer.setup_eager_loading(queryset, user, fields)
+
+    @classmethod
+    def project(cls, queryset, fields: list[str] | None = None):
+        """
+        Returns the projection of the events with the columns of the fields (all
+        by default), the ordering columns and the annotations.
+        """
+        model_fields: set[str] = {field.name for field in Event._meta.concrete_fields}
+        ordering: list[str] = [
+            name.lstrip("-")
+            for name in queryset.query.order_by
+            if isinstance(name, str)
+        ]
+        columns: list[str] = ["id"]
+        for field in [*(cls.Meta.fields if fields is None else fields), *ordering]:
+            field_columns = cls.RELATED_COLUMNS.get(field, (field,))
+            if field in model_fields and field_columns[0] not in columns:
+                columns += field_columns
+        return queryset.values(*columns, *queryset.query.annotation_select)
+
+    @property
+    def data(self) -> list[dict] | dict:
+        request = self.context.get("request")
+        self.is_authenticated: bool = bool(request and request.user.is_authenticated)
+        self.image_storage = Event._meta.get_field("image").storage
+        self.photo_storage = Speaker._meta.get_field("photo").storage
+        self.build_absolute_uri = request.build_absolute_uri if request else str
+        self.getters: list[tuple[str, Callable]] = [
+            (field, self.get_field_getter(field)) for field in self.fields
+        ]
+        rows: list[dict[str, Any]] = (
+            list(self.instance) if self.many else [self.instance]
+        )
+        if "first_speaker" in self.fields:
+            self.first_speakers: dict[int, Speaker] = load_first_speakers(
+                row["first_speaker_id"] for row in rows
+            )
+        if not self.many:
+            return self.to_representation(self.instance)
+        return [self.to_representation(row) for row in rows]
+
+    def get_field_getter(self, field: str) -> Callable[[dict[str, Any]], Any]:
+        """
+        Returns the function representing the field of a row: the represent_<field>
+        method, or taking the row value as is.
+        """
+        if field in self.DATETIME_FIELDS:
+            return lambda row: _datetime_representation(row[field])
+        return getattr(self, f"represent_{field}", itemgetter(field))
+
+    def to_representation(self, row: dict[str, Any]) -> dict[str, Any]:
+        return {field: getter(row) for field, getter in self.getters}
+
+    def represent_is_registrated(self, row: dict[str, Any]) -> bool:
+        return self.is_authenticated and row.get("is_registrated", False)
+
+    def represent_first_speaker(self, row: dict[str, Any]) -> dict | None:
+        """Represents the first speaker like SpeakerSerializer without a request."""
+        speaker: Speaker | None = self.first_speakers.get(row["first_speaker_id"])
+        if speaker is None:
+            return None
+        photo: str = speaker.photo.name
+        return {
+            "id": speaker.pk,
+            "speaker_name": speaker.name,
+            "company": speaker.company,
+            "position": speaker.position,
+            "speaker_description": speaker.description,
+            "photo": self.photo_storage.url(photo) if photo else None,
+            "photo_variants": get_variant_urls(
+                speaker.photo_variants, self.photo_storage
+            ),
+        }
+
+    def represent_format(self, row: dict[str, Any]) -> str:
+        return self.FORMAT_DISPLAY.get(row["format"], row["format"])
+
+    def represent_cost(self, row: dict[str, Any]) -> float | None:
+        cost = row["cost"]
+        return None if cost is None else float(cost)
+
+    def represent_image(self, row: dict[str, Any]) -> str | None:
+        image: str = row["image"]
+        if not image:
+            return None
+        return self.build_absolute_uri(self.image_storage.url(image))
+
+    def represent_image_variants(self, row: dict[str, Any]) -> dict:
+        return get_variant_urls(
+            row["image_variants"], self.image_storage, self.context.get("request")
+        )
+
+    def represent_city(self, row: dict[str, Any]) -> dict | None:
+        if row["city_id"] is None:
+            return None
+        return {
+            "id": row["city_id"],
+            "city_name": row["city__name"],
+            "city_slug": row["city__slug"],
+        }
+
+    def represent_event_type(self, row: dict[str, Any]) -> dict:
+        return {
+            "id": row["event_type_id"],
+            "event_type_name": row["event_type__name"],
+            "event_type_slug": row["event_type__slug"],
+        }
+
+    def represent_specializations(self, row: dict[str, Any]) -> dict:
+        return {
+            "id": row["specializations_id"],
+            "specialization_name": row["specializations__name"],
+            "specialization_slug": row["specializations__slug"],
+        }
+
+
 class EventCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating an event."""
 
+    serializer_related_field = ReferencePrimaryKeyRelatedField
     image = Base64ImageField(required=False)
     format = serializers.ChoiceField(
         choices=Event.FORMAT_CHOISES, label=Event._meta.get_field("format").verbose_name
     )
-    event_parts = EventPartSerializer(many=True, source="parts")
+    event_parts = EventPartUpsertSerializer(many=True, source="parts")
 
     class Meta:
         model = Event
@@ -317,61 +606,170 @@ class EventCreateSerializer(serializers.ModelSerializer):
         ):
             raise serializers.ValidationError(EVENT_PART_STARTTIME_ERROR)
 
-    def _get_event_part_speaker(self, part: dict[Any]) -> Speaker | None:
+    def _get_speakers_data(self, parts: list[dict[Any]]) -> dict[str, dict[Any]]:
+        """Returns the data of the speakers of the event parts by speaker name."""
+        speakers_data: dict[str, dict[Any]] = {}
+        for part in parts:
+            speaker_data = part.get("speaker")
+            if speaker_data is None:
+                continue
+            if "name" not in speaker_data:
+                raise serializers.ValidationError(SPEAKER_PATCH_NO_NAME_ERROR)
+            speakers_data.setdefault(speaker_data["name"], {}).update(speaker_data)
+        return speakers_data
+
+    def _get_event_part_speakers(self, parts: list[dict[Any]]) -> list[Speaker | None]:
         """
-        Creates or retrieves a speaker if one is expected for the event part;
-        otherwise, returns None.
+        Creates or updates the speakers of the event parts, matched by name,
+        with one query for the existing speakers and bulk writes. Returns the
+        speaker of every part (None for the parts without a speaker).
         """
-        if part.get("speaker") is None:
-            return None
-
-        speaker_data = part.pop("speaker")
-        if "name" not in speaker_data:
-            raise serializers.ValidationError(SPEAKER_PATCH_NO_NAME_ERROR)
-
-        if Speaker.objects.filter(name=speaker_data["name"]):
-            speaker = Speaker.objects.get(name=speaker_data["name"])
-            for field, value in speaker_data.items():
-                setattr(speaker, field, value)
-            speaker.save()
-
-        elif not Speaker.objects.filter(name=speaker_data["name"]):
-            if speaker_data.get("company") and speaker_data.get("position"):
-                speaker = Speaker.objects.create(**speaker_data)
-            else:
-                raise serializers.ValidationError(SPEAKER_CREATE_VALIDATION_ERROR)
+        speakers_data: dict[str, dict[Any]] = self._get_speakers_data(parts)
+        speakers: dict[str, Speaker] = Speaker.objects.in_bulk(
+            speakers_data, field_name="name"
+        )
+        new_speakers: list[Speaker] = []
+        changed_speakers: list[Speaker] = []
+        changed_fields: set[str] = set()
+        for name, speaker_data in speakers_data.items():
+            speaker = speakers.get(name)
+            if speaker is None:
+                if not speaker_data.get("company") or not speaker_data.get("position"):
+                    raise serializers.ValidationError(SPEAKER_CREATE_VALIDATION_ERROR)
+                speaker = speakers[name] = Speaker(**speaker_data)
+            fields: set[str] = set_changed_fields(speaker, speaker_data)
+            if "photo" in speaker_data:
+                # Файл фото сохраняется в хранилище и получает уменьшенные
+                # варианты только при обычном сохранении спикера
+                speaker.save()
+            elif speaker.pk is None:
+                new_speakers.append(speaker)
+            elif fields:
+                changed_speakers.append(speaker)
+                changed_fields |= fields
+
+        Speaker.objects.bulk_create(new_speakers)
+        if changed_speakers:
+            Speaker.objects.bulk_update(changed_speakers, [*changed_fields, "updated"])
+            refresh_search_documents(
+                EventPart.objects.filter(speaker__in=changed_speakers)
+                .values_list("event_id", flat=True)
+                .distinct()
+            )
+        return [
+            part.get("speaker") and speakers[part["speaker"]["name"]] for part in parts
+        ]
 
-        return speaker
+    def _update_event_parts(self, event: Event, parts: list[dict[Any]]) -> None:
+        """
+        Updates the changed parts of the event matched by id and creates the parts
+        without id with a fixed number of queries. The missing parts are deleted
+        with the delete signals, which invalidate the events cache.
+        """
+        existing_parts: dict[int, EventPart] = {
+            part.pk: part for part in EventPart.objects.filter(event=event)
+        }
+        for part in parts:
+            self._validate_event_part(part, event)
+        speakers: list[Speaker | None] = self._get_event_part_speakers(parts)
+
+        new_parts: list[EventPart] = []
+        changed_parts: list[EventPart] = []
+        changed_fields: set[str] = set()
+        for part, speaker in zip(parts, speakers):
+            part.pop("speaker", None)
+            part_id: int | None = part.pop("id", None)
+            if part_id is None:
+                new_parts.append(EventPart(event=event, speaker=speaker, **part))
+                continue
+            event_part = existing_parts.pop(part_id, None)
+            if event_part is None:
+                raise serializers.ValidationError(
+                    EVENT_PART_NOT_FOUND_ERROR.format(id=part_id)
+                )
+            fields: set[str] = set_changed_fields(
+                event_part, {**part, "speaker_id": speaker and speaker.pk}
+            )
+            if fields:
+                changed_parts.append(event_part)
+                changed_fields |= fields
+
+        if existing_parts:
+            # Удаление отправляет сигналы: сбрасывает кэш мероприятий
+            # и обрабатывает связанные объекты
+            EventPart.objects.filter(pk__in=existing_parts).delete()
+        if changed_parts:
+            EventPart.objects.bulk_update(changed_parts, [*changed_fields, "updated"])
+        EventPart.objects.bulk_create(new_parts)
+
+    def _create_event_parts(
+        self, events: list[Event], events_parts: list[list[dict[Any]]]
+    ) -> None:
+        """
+        Creates the parts of the new events and their speakers with a fixed
+        number of queries: the speakers are matched by name, the parts are
+        inserted in bulk. The ids of the parts are ignored, the parts are new.
+        """
+        parts: list[dict[Any]] = [part for parts in events_parts for part in parts]
+        speakers: list[Speaker | None] = self._get_event_part_speakers(parts)
+        part_events: list[Event] = [
+            event for event, parts in zip(events, events_parts) for _ in parts
+        ]
+        for part in parts:
+            part.pop("speaker", None)
+            part.pop("id", None)
+        EventPart.objects.bulk_create(
+            EventPart(event=event, speaker=speaker, **part)
+            for event, part, speaker in zip(part_events, parts, speakers)
+        )
+        # Части созданы без сигналов: поисковые документы и кэш обновляются явно,
+        # версия повышается и после коммита, как в сигнале invalidate_events_cache
+        refresh_search_documents([event.pk for event in events])
+        bump_version(EVENTS_VERSION_KEY)
+        transaction.on_commit(partial(bump_version, EVENTS_VERSION_KEY))
+
+    def save(self, **kwargs):
+        try:
+            return super().save(**kwargs)
+        finally:
+            close_decoded_files(self.context)
 
     @transaction.atomic
     def create(self, validated_data):
+        """Creates the event with its parts and their speakers."""
         event_parts = validated_data.pop("parts")
         event = Event.objects.create(**validated_data)
-        for part in event_parts:
-            speaker_data = part.pop("speaker")
-            speaker, _ = Speaker.objects.get_or_create(**speaker_data)
-            EventPart.objects.create(event=event, speaker=speaker, **part)
+        self._create_event_parts([event], [event_parts])
         return event
 
+    @transaction.atomic
+    def bulk_create(self, events_data: list[dict[Any]]) -> list[Event]:
+        """
+        Creates the events with their parts and speakers with a fixed number of
+        queries for the whole batch. The events are inserted without signals,
+        their image variants are scheduled explicitly.
+        """
+        events_parts: list[list[dict[Any]]] = [
+            event_data.pop("parts") for event_data in events_data
+        ]
+        events: list[Event] = Event.objects.bulk_create(
+            [Event(**event_data) for event_data in events_data]
+        )
+        for event in events:
+            schedule_image_variants(Event, event)
+        self._create_event_parts(events, events_parts)
+        return events
+
     @transaction.atomic
     def update(self, instance: Event, validated_data):
         """
         Updates fields of the event as a whole, as well as its nested objects -
         event parts and their speakers.
         """
-        # перезаписываем event parts этого мероприятия
-        if validated_data.get("parts") is not None:
-
-            # удаляем старые event parts этого мероприятия
-            for instance_part in instance.parts.all():
-                instance_part.delete()
-
-            # создаем новые event parts этого мероприятия
-            event_parts = validated_data.pop("parts")
-            for part in event_parts:
-                self._validate_event_part(part, instance)
-                speaker = self._get_event_part_speaker(part)
-                EventPart.objects.create(event=instance, speaker=speaker, **part)
+        # сверяем event parts этого мероприятия с присланными
+        event_parts = validated_data.pop("parts", None)
+        if event_parts is not None:
+            self._update_event_parts(instance, event_parts)
 
         # обновляем поля самого мероприятия
         for field, value in validated_data.items():
@@ -379,6 +777,15 @@ class EventCreateSerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
+    def to_representation(self, instance):
+        """Loads the parts of the event with their speakers in one query."""
+        if "parts" not in getattr(instance, "_prefetched_objects_cache", {}):
+            prefetch_related_objects(
+                [instance],
+                Prefetch("parts", queryset=EventPart.objects.select_related("speaker")),
+            )
+        return super().to_representation(instance)
+
     def validate(self, attrs):
         """
         Validates the data for creating or updating an event.
@@ -395,9 +802,83 @@ class EventCreateSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class EventBulkItemSerializer(EventCreateSerializer):
+    """
+    Serializer for validating an event of an imported batch, the uniqueness
+    of the names is checked for the whole batch with one query.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields["name"].validators = [
+            validator
+            for validator in fields["name"].validators
+            if not isinstance(validator, UniqueValidator)
+        ]
+        return fields
+
+    def validate(self, attrs):
+        """
+        Validates the parts of the event like the event editing does, so that
+        their errors are reported for the event of the batch.
+        """
+        attrs = super().validate(attrs)
+        event = Event(start_time=attrs.get("start_time"))
+        try:
+            for part in attrs.get("parts", []):
+                self._validate_event_part(part, event)
+        except serializers.ValidationError as error:
+            raise serializers.ValidationError({"event_parts": error.detail})
+        return attrs
+
+
 class EventDeactivationSerializer(serializers.ModelSerializer):
     """Serializer for event deactivation."""
 
     class Meta:
         model = Event
         fields = ["id"]
+
+
+class RecommendedEventsQuerySerializer(serializers.Serializer):
+    """Serializer for query parameters of the recommended events endpoint."""
+
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=RECOMMENDED_EVENTS_MAX_LIMIT,
+        default=RECOMMENDED_EVENTS_DEFAULT_LIMIT,
+        help_text="Number of recommended events",
+    )
+
+
+class EventExportQuerySerializer(serializers.Serializer):
+    """Serializer for query parameters of the events export endpoint."""
+
+    output = serializers.ChoiceField(
+        choices=["ndjson", "csv"],
+        default="ndjson",
+        help_text="Export format: NDJSON (one event per line) or CSV",
+    )
+
+
+class EventBulkQuerySerializer(serializers.Serializer):
+    """Serializer for query parameters of the events import endpoint."""
+
+    atomic = serializers.BooleanField(
+        default=True,
+        help_text=(
+            "Create the events only if all of them are valid (default), "
+            "otherwise create the valid ones and report the errors of the others"
+        ),
+    )
+
+
+class EventBulkResultSerializer(serializers.Serializer):
+    """Serializer for the result of importing an event of a batch."""
+
+    index = serializers.IntegerField(help_text="Position of the event in the batch")
+    id = serializers.IntegerField(allow_null=True, help_text="Id of the created event")
+    errors = serializers.DictField(
+        allow_null=True,
+        help_text="Validation errors of the event in the format of the API errors",
+    )
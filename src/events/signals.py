@@ -0,0 +1,139 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .models import City, Event, EventPart, EventType, Speaker
+from .search import delete_search_documents, refresh_search_documents
+from .tasks import create_image_variants
+from api.cache import EVENTS_VERSION_KEY, bump_version
+from api.services.image_variants import get_variants_field_name
+from applications.models import Application
+from users.models import Specialization
+
+EVENTS_CACHE_DEPENDENCIES: tuple = (
+    Event,
+    EventPart,
+    Speaker,
+    Application,
+    City,
+    EventType,
+    Specialization,
+)
+
+# Изображения, для которых в фоне создаются уменьшенные варианты
+IMAGE_VARIANT_FIELDS: dict = {Event: "image", Speaker: "photo"}
+
+
+def invalidate_events_cache(sender, **kwargs) -> None:
+    """
+    Invalidates cached event responses when the data they include changes.
+    The version is bumped again after the commit: a concurrent request could
+    cache the old rows under the new version before the transaction commits.
+    """
+    bump_version(EVENTS_VERSION_KEY)
+    transaction.on_commit(partial(bump_version, EVENTS_VERSION_KEY))
+
+
+for model in EVENTS_CACHE_DEPENDENCIES:
+    post_save.connect(
+        invalidate_events_cache,
+        sender=model,
+        dispatch_uid=f"invalidate_events_cache_on_save_{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_events_cache,
+        sender=model,
+        dispatch_uid=f"invalidate_events_cache_on_delete_{model.__name__}",
+    )
+
+
+def refresh_event_search_document(sender, instance, update_fields=None, **kwargs):
+    """
+    Rebuilds the search document of a saved event, unless only the fields
+    not included in the document (e.g. the status) were saved.
+    """
+    if update_fields is not None and not {"name", "description"} & set(update_fields):
+        return
+    refresh_search_documents([instance.pk])
+
+
+def refresh_event_part_search_document(sender, instance, **kwargs):
+    """Rebuilds the search document of the event of a saved or deleted part."""
+    refresh_search_documents([instance.event_id])
+
+
+def refresh_speaker_search_documents(sender, instance, **kwargs):
+    """Rebuilds the search documents of the events with the saved speaker."""
+    refresh_search_documents(
+        instance.presentations.values_list("event_id", flat=True).distinct()
+    )
+
+
+def delete_event_search_document(sender, instance, **kwargs):
+    """Removes a deleted event from the search index."""
+    delete_search_documents([instance.pk])
+
+
+post_save.connect(
+    refresh_event_search_document,
+    sender=Event,
+    dispatch_uid="refresh_event_search_document",
+)
+post_delete.connect(
+    delete_event_search_document,
+    sender=Event,
+    dispatch_uid="delete_event_search_document",
+)
+post_save.connect(
+    refresh_event_part_search_document,
+    sender=EventPart,
+    dispatch_uid="refresh_event_part_search_document_on_save",
+)
+post_delete.connect(
+    refresh_event_part_search_document,
+    sender=EventPart,
+    dispatch_uid="refresh_event_part_search_document_on_delete",
+)
+post_save.connect(
+    refresh_speaker_search_documents,
+    sender=Speaker,
+    dispatch_uid="refresh_speaker_search_documents",
+)
+
+
+def schedule_image_variants(sender, instance, update_fields=None, **kwargs):
+    """
+    Schedules the generation of the image variants after the transaction commits
+    if the image has been uploaded or replaced, the save itself does not wait
+    for the resizing. Clears the variants of a removed image.
+    """
+    field_name: str = IMAGE_VARIANT_FIELDS[sender]
+    if update_fields is not None and field_name not in update_fields:
+        return
+    name: str = getattr(instance, field_name).name
+    variants_field: str = get_variants_field_name(field_name)
+    variants: dict = getattr(instance, variants_field)
+    if name and name != variants.get("source"):
+        transaction.on_commit(
+            partial(
+                create_image_variants.delay, sender._meta.label, instance.pk, field_name
+            )
+        )
+    elif not name and variants:
+        # Время изменения входит в ETag и Last-Modified условных GET-запросов
+        updated = timezone.now()
+        sender.objects.filter(pk=instance.pk).update(
+            **{variants_field: {}, "updated": updated}
+        )
+        setattr(instance, variants_field, {})
+        instance.updated = updated
+
+
+for model in IMAGE_VARIANT_FIELDS:
+    post_save.connect(
+        schedule_image_variants,
+        sender=model,
+        dispatch_uid=f"schedule_image_variants_{model.__name__}",
+    )
@@ -0,0 +1,31 @@
+from celery import shared_task
+from django.apps import apps
+from django.utils import timezone
+from PIL import UnidentifiedImageError
+
+from api.cache import EVENTS_VERSION_KEY, bump_version
+from api.loggers import logger
+from api.services.image_variants import generate_image_variants, get_variants_field_name
+
+
+@shared_task
+def create_image_variants(model_label: str, pk: int, field_name: str) -> None:
+    """
+    Generates the resized variants of the image of the object and stores them,
+    unless the image has been replaced or removed in the meantime.
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).only(field_name).first()
+    field_file = getattr(instance, field_name, None)
+    if not field_file:
+        return
+    try:
+        variants = generate_image_variants(field_file)
+    except (FileNotFoundError, UnidentifiedImageError) as error:
+        logger.warning(f"No variants for {model_label} {pk} {field_name}: {error}")
+        return
+    updated: int = model.objects.filter(pk=pk, **{field_name: field_file.name}).update(
+        **{get_variants_field_name(field_name): variants, "updated": timezone.now()}
+    )
+    if updated:
+        bump_version(EVENTS_VERSION_KEY)
@@ -1,3 +1,7 @@
+RECOMMENDED_EVENTS_DEFAULT_LIMIT: int = 3
+RECOMMENDED_EVENTS_MAX_LIMIT: int = 20
+EVENTS_BULK_MAX_SIZE: int = 200
+
 EVENT_ENDTIME_ERROR: str = "Мероприятие не может окончиться раньше времени его начала."
 EVENT_PART_STARTTIME_ERROR: str = (
     "Часть мероприятия не может начинаться раньше самого мероприятия."
@@ -15,7 +19,16 @@ SPEAKER_CREATE_VALIDATION_ERROR: str = (
     "место работы и должность."
 )
 SPEAKER_PATCH_NO_NAME_ERROR: str = "Укажите имя спикера."
+EVENT_PART_NOT_FOUND_ERROR: str = "У мероприятия нет части с id {id}."
 EVENT_PART_NO_NAME_ERROR: str = "Укажите название этой части мероприятия."
 EVENT_PART_NO_START_TIME_ERROR: str = (
     "Укажите дату и время начала этой части мероприятия."
 )
+EVENTS_BULK_NOT_LIST_ERROR: str = "Ожидается список мероприятий."
+EVENTS_BULK_SIZE_ERROR: str = (
+    "За один запрос можно загрузить от 1 до {max_size} мероприятий."
+)
+EVENTS_BULK_NAME_EXISTS_ERROR: str = "Мероприятие с таким названием уже существует."
+EVENTS_BULK_NAME_DUPLICATE_ERROR: str = (
+    "Мероприятие с таким названием уже есть в загружаемом списке."
+)
@@ -1,31 +1,81 @@
-from django.utils import timezone
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db.models import Count, Max, Value
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from django_filters import rest_framework as rf_filters
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter
-from rest_framework.mixins import ListModelMixin
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import FormParser, JSONParser
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
-from rest_framework.viewsets import GenericViewSet, ModelViewSet
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_207_MULTI_STATUS,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+)
+from rest_framework.viewsets import GenericViewSet, ModelViewSet, ViewSet
 
-from .models import City, Event, EventType
-from .schemas import EVENT_LIST_DESCRIPTION, EVENT_LIST_FILTERS
+from .bulk import import_events
+from .export import EXPORT_CONTENT_TYPES, stream_csv, stream_ndjson
+from .facets import count_facets
+from .models import City, Event, EventPart, EventType, Speaker
+from .schemas import (
+    EVENT_EXPORT_FILTERS,
+    EVENT_FACETS_FILTERS,
+    EVENT_FIELDSET_PARAMS,
+    EVENT_LIST_DESCRIPTION,
+    EVENT_LIST_FILTERS,
+)
 from .serializers import (
+    BootstrapSerializer,
     CitySerializer,
+    EventBulkQuerySerializer,
+    EventBulkResultSerializer,
     EventCreateSerializer,
     EventDeactivationSerializer,
     EventDetailSerializer,
+    EventExportQuerySerializer,
+    EventListFastSerializer,
     EventListSerializer,
     EventTypeSerializer,
+    RecommendedEventsQuerySerializer,
     SpecializationSerializer,
 )
-from api.filters import EventsFilter
+from .utils import (
+    EVENTS_BULK_MAX_SIZE,
+    EVENTS_BULK_NOT_LIST_ERROR,
+    EVENTS_BULK_SIZE_ERROR,
+)
+from api.cache import EVENTS_VERSION_KEY, get_version, make_response_cache_key
+from api.filters import EventsFilter, EventsOrderingFilter
+from api.mixins import ConditionalGetMixin, ReferenceCacheMixin, SparseFieldsetMixin
 from api.pagination import CustomPageNumberPagination
+from api.parsers import ImageJSONParser, NestedMultiPartParser
 from api.permissions import IsAdminOrReadOnly
+from api.services.reference_cache import REFERENCES_VERSION_KEY, reference_cache
+from applications.models import Application, Source
 from users.models import Specialization
 
+# Таблицы, данные которых входят в ответы о мероприятиях, и их поля времени изменения
+EVENTS_DATA_TABLES: tuple[tuple] = (
+    (Event, "updated"),
+    (EventPart, "updated"),
+    (Speaker, "updated"),
+    (Application, "created"),
+    (City, "updated"),
+    (EventType, "updated"),
+    (Specialization, "updated"),
+)
+
 
 @method_decorator(
     name="list",
@@ -34,18 +84,24 @@ from users.models import Specialization
         manual_parameters=EVENT_LIST_FILTERS,
     ),
 )
-class EventViewSet(ModelViewSet):
+@method_decorator(
+    name="retrieve",
+    decorator=swagger_auto_schema(manual_parameters=EVENT_FIELDSET_PARAMS),
+)
+class EventViewSet(ConditionalGetMixin, SparseFieldsetMixin, ModelViewSet):
     """
     ViewSet provides endpoints for listing, creating, retrieving, partially updating,
     activating and deactivating events.
     """
 
     http_method_names = ["get", "post", "patch"]
-    filter_backends = [rf_filters.DjangoFilterBackend, OrderingFilter]
+    conditional_actions: tuple[str] = ("list", "retrieve", "facets")
+    filter_backends = [rf_filters.DjangoFilterBackend, EventsOrderingFilter]
     filterset_class = EventsFilter
     ordering_fields = ["start_time", "name"]
     ordering = ["pk"]
     pagination_class = CustomPageNumberPagination
+    parser_classes = [ImageJSONParser, FormParser, NestedMultiPartParser]
     permission_classes = [IsAdminOrReadOnly]
 
     def get_serializer_class(self):
@@ -57,13 +113,132 @@ class EventViewSet(ModelViewSet):
             return EventCreateSerializer
         if self.action == "activate" or self.action == "deactivate":
             return EventDeactivationSerializer
+        if self.action == "list" and not getattr(self, "swagger_fake_view", False):
+            return EventListFastSerializer
         return EventListSerializer
 
+    # Признак того, что ответ собирается для общего кэша, без данных пользователя
+    shared_response: bool = False
+
     def get_queryset(self):
-        return EventListSerializer.setup_eager_loading(
-            Event.objects.all(), user=self.request.user
+        serializer_class = (
+            EventDetailSerializer
+            if self.detail or self.action == "export"
+            else EventListSerializer
+        )
+        user = AnonymousUser() if self.shared_response else self.request.user
+        return serializer_class.setup_eager_loading(
+            Event.objects.all(),
+            user=user,
+            fields=self.get_requested_fields(serializer_class.Meta.fields),
+        )
+
+    def paginate_queryset(self, queryset):
+        serializer_class = self.get_serializer_class()
+        if serializer_class is EventListFastSerializer:
+            queryset = EventListFastSerializer.project(
+                queryset, self.get_requested_fields(serializer_class.Meta.fields)
+            )
+        return super().paginate_queryset(queryset)
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, method, request, *args, **kwargs) -> Response:
+        """
+        Serves the response body from the cache shared by all visitors, the key
+        combines normalized query parameters with the global events version.
+        Per-user fields are overlaid after the cache lookup.
+        """
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        user = request.user
+        if user.is_authenticated and "is_registrated" in request.query_params:
+            return method(request, *args, **kwargs)
+        cache_key: str = make_response_cache_key(
+            request,
+            prefix=f"events:{self.action}",
+            version=get_version(EVENTS_VERSION_KEY),
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            self.shared_response = True
+            data = method(request, *args, **kwargs).data
+            self.shared_response = False
+            cache.set(cache_key, data, settings.EVENTS_CACHE_TIMEOUT)
+        if self.action == "facets":
+            return Response(data, status=HTTP_200_OK)
+        fields = self.get_requested_fields(self.get_serializer_class().Meta.fields)
+        if user.is_authenticated and (fields is None or "is_registrated" in fields):
+            data = self._overlay_registration_status(data, user)
+        return Response(data, status=HTTP_200_OK)
+
+    def get_data_state(self) -> dict[str, Any]:
+        """
+        Returns the number of rows and the time of the last change of every table
+        included in event responses, computed with a single query once per
+        version of the events cache. Like the cached responses, the state is
+        only refreshed when the version is bumped: writes that skip signals
+        (bulk inserts, raw SQL) must call bump_version(EVENTS_VERSION_KEY).
+        """
+        if hasattr(self, "_data_state"):
+            return self._data_state
+        cache_key: str = f"events:state:{get_version(EVENTS_VERSION_KEY)}"
+        self._data_state = cache.get(cache_key)
+        if self._data_state is None:
+            tables = [
+                model.objects.order_by()
+                .values(table=Value(model._meta.label))
+                .annotate(
+                    count=Count("pk"), last_pk=Max("pk"), last_modified=Max(field)
+                )
+                for model, field in EVENTS_DATA_TABLES
+            ]
+            self._data_state = {
+                row.pop("table"): row for row in tables[0].union(*tables[1:], all=True)
+            }
+            cache.set(cache_key, self._data_state, settings.EVENTS_CACHE_TIMEOUT)
+        return self._data_state
+
+    def get_etag_fingerprint(self) -> Any:
+        return [self.request.user.pk, self.get_data_state()]
+
+    def get_last_modified(self) -> datetime | None:
+        return max(
+            (
+                state["last_modified"]
+                for state in self.get_data_state().values()
+                if state["last_modified"] is not None
+            ),
+            default=None,
         )
 
+    @staticmethod
+    def _overlay_registration_status(data: Any, user) -> Any:
+        """Fills in the is_registrated field of cached events for the user."""
+        if "results" in data:
+            return {
+                **data,
+                "results": EventViewSet._overlay_registration_status(
+                    data["results"], user
+                ),
+            }
+        events: list[dict] = data if isinstance(data, list) else [data]
+        registered_event_ids: set[int] = set(
+            Application.objects.filter(
+                user=user, event_id__in=[event["id"] for event in events]
+            ).values_list("event_id", flat=True)
+        )
+        events = [
+            {**event, "is_registrated": event["id"] in registered_event_ids}
+            for event in events
+        ]
+        return events if isinstance(data, list) else events[0]
+
     @staticmethod
     def _change_event_status(request, instance, is_deleted):
         """Change the status of a specific event."""
@@ -88,6 +263,7 @@ class EventViewSet(ModelViewSet):
         instance = self.get_object()
         return self._change_event_status(request, instance, is_deleted=False)
 
+    @swagger_auto_schema(query_serializer=RecommendedEventsQuerySerializer)
     @action(
         detail=False,
         methods=["get"],
@@ -101,66 +277,194 @@ class EventViewSet(ModelViewSet):
     )
     def three_recommended_events(self, request):
         """
-        Shows three recommended events for authorized user according to
-        the user's specializations.
+        Shows recommended future events (three by default, the number can be changed
+        with the limit query parameter): events matching the authorized user's
+        specializations go first, then the soonest ones.
+        """
+        query_serializer = RecommendedEventsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        limit: int = query_serializer.validated_data["limit"]
+        recommended_events = self.get_queryset().recommended_for(request.user)
+        serializer = self.get_serializer(recommended_events[:limit], many=True)
+        return Response(serializer.data, status=HTTP_200_OK)
+
+    @swagger_auto_schema(
+        query_serializer=EventExportQuerySerializer,
+        manual_parameters=EVENT_EXPORT_FILTERS,
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[IsAdminUser],
+        pagination_class=None,
+    )
+    def export(self, request):
+        """
+        Streams all the events matching the filters of the events list, with
+        the agendas and speakers, as NDJSON (one event per line) or as CSV
+        (one row per event part). Available to staff only.
         """
-        now = timezone.now()
-        all_future_events = list(
-            self.get_queryset().filter(start_time__gt=now).order_by("start_time")
+        query_serializer = EventExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        output: str = query_serializer.validated_data["output"]
+        queryset = self.filter_queryset(self.get_queryset())
+        stream = stream_csv if output == "csv" else stream_ndjson
+        response = StreamingHttpResponse(
+            stream(queryset, self.get_serializer_context()),
+            content_type=EXPORT_CONTENT_TYPES[output],
         )
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="events.{output}"'
+        )
+        return response
 
-        # TODO: убрать весь этот блок, когда будет снова IsAuthenticated
-        if request.user.is_anonymous:
-            serializer = self.get_serializer_class()(
-                all_future_events[:3],
-                many=True,
-                context={"request": request, "format": self.format_kwarg, "view": self},
+    @swagger_auto_schema(
+        query_serializer=EventBulkQuerySerializer,
+        request_body=EventCreateSerializer(many=True),
+        responses={
+            HTTP_201_CREATED: EventBulkResultSerializer(many=True),
+            HTTP_207_MULTI_STATUS: EventBulkResultSerializer(many=True),
+            HTTP_400_BAD_REQUEST: EventBulkResultSerializer(many=True),
+        },
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        permission_classes=[IsAdminUser],
+        parser_classes=[JSONParser],
+    )
+    def bulk(self, request):
+        """
+        Creates a batch of events (a list of the event creation payloads) in one
+        transaction. With atomic=true (default) the events are created only if
+        all of them are valid, with atomic=false the valid events are created
+        and the others are reported. Returns the id or the errors of every
+        event in the order of the batch. Available to staff only.
+        """
+        query_serializer = EventBulkQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        if not isinstance(request.data, list):
+            raise ValidationError(EVENTS_BULK_NOT_LIST_ERROR)
+        if not 0 < len(request.data) <= EVENTS_BULK_MAX_SIZE:
+            raise ValidationError(
+                EVENTS_BULK_SIZE_ERROR.format(max_size=EVENTS_BULK_MAX_SIZE)
             )
-            return Response(serializer.data, status=HTTP_200_OK)
-        # TODO: конец блока, который надо убрать
-
-        specializations = request.user.specializations.all()
-        recommended_future_events = [
-            event
-            for event in all_future_events
-            if event.specializations in specializations
-        ]
-        if len(recommended_future_events) >= 3:
-            result = recommended_future_events[:3]
+        results = import_events(
+            request.data,
+            self.get_serializer_context(),
+            atomic=query_serializer.validated_data["atomic"],
+        )
+        created: int = sum(result["id"] is not None for result in results)
+        if created == len(results):
+            status = HTTP_201_CREATED
+        elif created:
+            status = HTTP_207_MULTI_STATUS
         else:
-            result = recommended_future_events
-            additional_events_number: int = 3 - len(result)
-            for event in all_future_events:
-                if not additional_events_number:
-                    break
-                if event not in result:
-                    result.append(event)
-                    additional_events_number -= 1
-
-        serializer = self.get_serializer_class()(
-            result,
-            many=True,
-            context={"request": request, "format": self.format_kwarg, "view": self},
+            status = HTTP_400_BAD_REQUEST
+        return Response(results, status=status)
+
+    @swagger_auto_schema(manual_parameters=EVENT_FACETS_FILTERS)
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def facets(self, request):
+        """
+        Returns the numbers of the events matching the filters of the events list
+        by every city, event type, specialization, format and status slug.
+        The counts of a facet ignore its own filter: they show how many events
+        each of its values would match with the other filters.
+        """
+        return self._cached_response(self._facets_response, request)
+
+    def _facets_response(self, request) -> Response:
+        """Counts the events by the facets, for the cached response."""
+        return Response(
+            count_facets(
+                self.filterset_class, request.query_params, Event.objects.all(), request
+            )
         )
-        return Response(serializer.data, status=HTTP_200_OK)
 
 
-class CityViewSet(ListModelMixin, GenericViewSet):
+class CityViewSet(ReferenceCacheMixin, GenericViewSet):
     """ViewSet for city list"""
 
     queryset = City.objects.all()
     serializer_class = CitySerializer
 
 
-class EventTypeViewSet(ListModelMixin, GenericViewSet):
+class EventTypeViewSet(ReferenceCacheMixin, GenericViewSet):
     """ViewSet for event type list"""
 
     queryset = EventType.objects.all()
     serializer_class = EventTypeSerializer
 
 
-class SpecializationViewSet(ListModelMixin, GenericViewSet):
+class SpecializationViewSet(ReferenceCacheMixin, GenericViewSet):
     """ViewSet for specialization list"""
 
     queryset = Specialization.objects.all()
     serializer_class = SpecializationSerializer
+
+
+class BootstrapViewSet(ConditionalGetMixin, ViewSet):
+    """
+    ViewSet for all the reference data (cities, event types, specializations
+    and sources) in one response, built once per version of the references.
+    """
+
+    reference_models: dict[str, type] = {
+        "cities": City,
+        "event_types": EventType,
+        "specializations": Specialization,
+        "sources": Source,
+    }
+
+    def get_reference_states(self) -> list[dict[str, Any]]:
+        """Returns the data states of the references, without queries."""
+        return [
+            reference_cache.get_state(model, self.last_modified_field)
+            for model in self.reference_models.values()
+        ]
+
+    def get_etag_fingerprint(self) -> Any:
+        # Не у всех справочников есть время изменения (например, у источников),
+        # поэтому в ETag входит и версия справочников
+        return [get_version(REFERENCES_VERSION_KEY), self.get_reference_states()]
+
+    def get_last_modified(self) -> datetime | None:
+        return max(
+            (
+                state["last_modified"]
+                for state in self.get_reference_states()
+                if state["last_modified"] is not None
+            ),
+            default=None,
+        )
+
+    def get_payload(self) -> dict[str, Any]:
+        """
+        Returns the serialized reference data, as a plain dict not to keep the
+        serializer and the request it was built for.
+        """
+        serializer = BootstrapSerializer(
+            {
+                name: reference_cache.all(model)
+                for name, model in self.reference_models.items()
+            },
+            context={"request": self.request},
+        )
+        return dict(serializer.data)
+
+    @swagger_auto_schema(responses={HTTP_200_OK: BootstrapSerializer})
+    def list(self, request, *args, **kwargs):
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        return Response(reference_cache.get_computed("bootstrap", self.get_payload))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code in (HTTP_200_OK, HTTP_304_NOT_MODIFIED):
+            patch_cache_control(
+                response, public=True, max_age=settings.BOOTSTRAP_CACHE_MAX_AGE
+            )
+        return response
@@ -1,6 +1,9 @@
+import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 
 from tests.api_tests.factories import (
+    ApplicationFactory,
     CityFactory,
     EventFactory,
     EventPartFactory,
@@ -10,6 +13,7 @@ from tests.api_tests.factories import (
     UserFactory,
 )
 
+register(ApplicationFactory)
 register(UserFactory)
 register(EventFactory)
 register(EventPartFactory)
@@ -17,3 +21,10 @@ register(EventTypeFactory)
 register(SpeakerFactory)
 register(SpecializationFactory)
 register(CityFactory)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
@@ -1,7 +1,11 @@
+from datetime import timedelta
+
 import factory
+from django.utils import timezone
 from faker import Faker
 from faker.providers import DynamicProvider, profile
 
+from applications.models import Application
 from events.models import City, Event, EventPart, EventType, Speaker
 from users.models import Specialization, User
 
@@ -40,6 +44,7 @@ class UserWithWrongEmailAndPhoneFactory(UserFactory):
 class CityFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = City
+        django_get_or_create = ("slug",)
 
     name = "Москва"
     slug = "moscow"
@@ -48,6 +53,7 @@ class CityFactory(factory.django.DjangoModelFactory):
 class SpecializationFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Specialization
+        django_get_or_create = ("slug",)
 
     name = "бэкенд"
     slug = "backend"
@@ -56,6 +62,7 @@ class SpecializationFactory(factory.django.DjangoModelFactory):
 class EventTypeFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = EventType
+        django_get_or_create = ("slug",)
 
     name = "конференция"
     slug = "conference"
@@ -65,31 +72,48 @@ class SpeakerFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Speaker
 
-    name = fake.unique.name()
+    name = factory.Sequence(lambda n: f"{fake.name()} {n}")
     company = "Яндекс"
     position = "главный разработчик"
     description = fake.text()
 
 
+class EventFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Event
+
+    name = factory.Sequence(lambda n: f"Мероприятие {n}")
+    description = fake.text()
+    is_deleted = False
+    event_type = factory.SubFactory(EventTypeFactory)
+    specializations = factory.SubFactory(SpecializationFactory)
+    format = Event.FORMAT_ONLINE
+    start_time = factory.LazyFunction(lambda: timezone.now() + timedelta(days=7))
+    event_parts = factory.RelatedFactory(
+        "tests.api_tests.factories.EventPartFactory", factory_related_name="event"
+    )
+
+
 class EventPartFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = EventPart
 
+    event = factory.SubFactory(EventFactory, event_parts=None)
     speaker = factory.SubFactory(SpeakerFactory)
-    name = fake.unique.name()
+    name = factory.Sequence(lambda n: f"Доклад {n}")
     description = fake.text()
     created = "2024-04-03 11:39:06+03:00"
-    start_time = fake.date_time()
+    start_time = factory.SelfAttribute("event.start_time")
 
 
-class EventFactory(factory.django.DjangoModelFactory):
+class ApplicationFactory(factory.django.DjangoModelFactory):
     class Meta:
-        model = Event
+        model = Application
 
-    name = fake.unique.name()
-    description = fake.text()
-    event_type = factory.SubFactory(EventTypeFactory)
-    specializations = factory.SubFactory(SpecializationFactory)
+    event = factory.SubFactory(EventFactory)
     format = Event.FORMAT_ONLINE
-    start_time = fake.date_time()
-    event_parts = factory.SubFactory(EventPartFactory)
+    first_name = fake.first_name()
+    last_name = fake.last_name()
+    email = factory.Sequence(lambda n: f"participant{n}@example.com")
+    phone = factory.Sequence(lambda n: f"+7{n:010d}")
+    activity = User.ACTIVITY_STUDY
@@ -0,0 +1,151 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+
+from tests.api_tests import factories
+
+from events.models import Event
+
+
+@pytest.mark.django_db
+class Test00EventList:
+    URL_EVENTS = "/api/v1/events/"
+
+    def test_00_submitted_applications_counts(self, anonymous_client):
+        event = factories.EventFactory(format=Event.FORMAT_HYBRID)
+        factories.ApplicationFactory.create_batch(
+            3, event=event, format=Event.FORMAT_OFFLINE
+        )
+        factories.ApplicationFactory.create_batch(
+            2, event=event, format=Event.FORMAT_ONLINE
+        )
+        factories.EventFactory()
+
+        response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+        results = {item["id"]: item for item in response.json()["results"]}
+        expected = {
+            "submitted_applications": 5,
+            "submitted_applications_offline": 3,
+            "submitted_applications_online": 2,
+        }
+        for field, value in expected.items():
+            assert results[event.id][field] == value, (
+                f"Поле {field} в ответе на GET-запрос к {self.URL_EVENTS} должно "
+                "содержать количество поданных на мероприятие заявок."
+            )
+
+    def test_00_detail_submitted_applications_counts(self, anonymous_client):
+        event = factories.EventFactory(format=Event.FORMAT_HYBRID)
+        factories.ApplicationFactory(event=event, format=Event.FORMAT_OFFLINE)
+
+        response = anonymous_client.get(f"{self.URL_EVENTS}{event.id}/")
+
+        assert response.status_code == HTTPStatus.OK
+        response_json = response.json()
+        assert response_json["submitted_applications"] == 1
+        assert response_json["submitted_applications_offline"] == 1
+        assert response_json["submitted_applications_online"] == 0
+
+    def test_00_list_does_not_load_applications(
+        self, anonymous_client, django_assert_max_num_queries
+    ):
+        event = factories.EventFactory()
+        factories.ApplicationFactory.create_batch(10, event=event)
+
+        with django_assert_max_num_queries(4):
+            response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+
+    @pytest.mark.parametrize("value, expected_registrated", [(1, True), (0, False)])
+    def test_00_is_registrated_filter(
+        self, user, user_client, value, expected_registrated
+    ):
+        registrated_event, other_event = factories.EventFactory.create_batch(2)
+        factories.ApplicationFactory(event=registrated_event, user=user)
+
+        response = user_client.get(self.URL_EVENTS, {"is_registrated": value})
+
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()["results"]
+        expected_event = registrated_event if expected_registrated else other_event
+        assert [item["id"] for item in results] == [expected_event.id], (
+            f"GET-запрос к {self.URL_EVENTS}?is_registrated={value} должен "
+            "возвращать только мероприятия, на которые пользователь "
+            f"{'' if expected_registrated else 'не '}зарегистрирован."
+        )
+        assert results[0]["is_registrated"] is expected_registrated
+
+    def test_00_is_registrated_filter_ignored_for_anonymous(self, anonymous_client):
+        factories.EventFactory.create_batch(2)
+
+        response = anonymous_client.get(self.URL_EVENTS, {"is_registrated": 1})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["count"] == 2
+
+    def test_00_first_speaker_of_earliest_part(self, anonymous_client):
+        event = factories.EventFactory(event_parts=None)
+        earliest_speaker = factories.SpeakerFactory()
+        factories.EventPartFactory(
+            event=event, start_time=event.start_time + timedelta(hours=2)
+        )
+        factories.EventPartFactory(event=event, speaker=None)
+        factories.EventPartFactory(
+            event=event,
+            speaker=earliest_speaker,
+            start_time=event.start_time + timedelta(hours=1),
+        )
+
+        response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+        first_speaker = response.json()["results"][0]["first_speaker"]
+        assert first_speaker == {
+            "id": earliest_speaker.id,
+            "speaker_name": earliest_speaker.name,
+            "company": earliest_speaker.company,
+            "position": earliest_speaker.position,
+            "speaker_description": earliest_speaker.description,
+            "photo": None,
+            "photo_variants": {},
+        }, (
+            f"Поле first_speaker в ответе на GET-запрос к {self.URL_EVENTS} должно "
+            "содержать спикера самой ранней части мероприятия."
+        )
+
+    def test_00_first_speaker_without_speakers(self, anonymous_client):
+        event = factories.EventFactory(event_parts=None)
+        factories.EventPartFactory(event=event, speaker=None)
+
+        response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["results"][0]["first_speaker"] is None
+
+    def test_00_list_does_not_load_agendas(
+        self, anonymous_client, django_assert_num_queries
+    ):
+        for event in factories.EventFactory.create_batch(3):
+            factories.EventPartFactory.create_batch(5, event=event)
+
+        # Состояние таблиц для ETag, количество мероприятий, страница мероприятий
+        # и первые спикеры всех мероприятий страницы
+        with django_assert_num_queries(4):
+            response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_00_detail_contains_agenda(self, anonymous_client):
+        event = factories.EventFactory(event_parts=None)
+        parts = factories.EventPartFactory.create_batch(3, event=event)
+
+        response = anonymous_client.get(f"{self.URL_EVENTS}{event.id}/")
+
+        assert response.status_code == HTTPStatus.OK
+        assert {part["id"] for part in response.json()["event_parts"]} == {
+            part.id for part in parts
+        }
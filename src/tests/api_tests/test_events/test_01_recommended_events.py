@@ -0,0 +1,79 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from events.utils import RECOMMENDED_EVENTS_MAX_LIMIT
+
+
+@pytest.mark.django_db
+class Test01RecommendedEvents:
+    URL_RECOMMENDED = "/api/v1/events/three-recommended-events/"
+
+    @staticmethod
+    def _create_event(days: int, specialization=None):
+        extra = {"specializations": specialization} if specialization else {}
+        return factories.EventFactory(
+            start_time=timezone.now() + timedelta(days=days), **extra
+        )
+
+    def test_01_anonymous_gets_soonest_future_events(self, anonymous_client):
+        self._create_event(days=-1)
+        later = self._create_event(days=3)
+        soonest = self._create_event(days=1)
+        middle = self._create_event(days=2)
+        self._create_event(days=4)
+
+        response = anonymous_client.get(self.URL_RECOMMENDED)
+
+        assert response.status_code == HTTPStatus.OK
+        assert [item["id"] for item in response.json()] == [
+            soonest.id,
+            middle.id,
+            later.id,
+        ], (
+            f"GET-запрос к {self.URL_RECOMMENDED} анонимного пользователя должен "
+            "возвращать три ближайших будущих мероприятия."
+        )
+
+    def test_01_matching_specializations_go_first(self, user, user_client):
+        backend = factories.SpecializationFactory()
+        frontend = factories.SpecializationFactory(name="фронтенд", slug="frontend")
+        user.specializations.set([frontend])
+        soonest = self._create_event(days=1, specialization=backend)
+        matching_late = self._create_event(days=5, specialization=frontend)
+        matching_early = self._create_event(days=4, specialization=frontend)
+        self._create_event(days=2, specialization=backend)
+
+        response = user_client.get(self.URL_RECOMMENDED)
+
+        assert response.status_code == HTTPStatus.OK
+        assert [item["id"] for item in response.json()] == [
+            matching_early.id,
+            matching_late.id,
+            soonest.id,
+        ], (
+            f"GET-запрос к {self.URL_RECOMMENDED} должен возвращать сначала "
+            "мероприятия направлений пользователя, затем ближайшие мероприятия."
+        )
+
+    def test_01_limit(self, anonymous_client, django_assert_num_queries):
+        for days in range(1, 8):
+            self._create_event(days=days)
+
+        # Мероприятия и первые спикеры всех мероприятий
+        with django_assert_num_queries(2):
+            response = anonymous_client.get(self.URL_RECOMMENDED, {"limit": 5})
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) == 5
+
+    @pytest.mark.parametrize("limit", [0, RECOMMENDED_EVENTS_MAX_LIMIT + 1, "abc"])
+    def test_01_invalid_limit(self, anonymous_client, limit):
+        response = anonymous_client.get(self.URL_RECOMMENDED, {"limit": limit})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json()["errors"][0]["attr"] == "limit"
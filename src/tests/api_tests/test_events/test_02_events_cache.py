@@ -0,0 +1,114 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from tests.api_tests import factories
+
+from applications.helpers import EventClosureController
+from events.models import Event
+
+
+@pytest.mark.django_db
+class Test02EventsCache:
+    URL_EVENTS = "/api/v1/events/"
+
+    def test_02_list_is_served_from_cache(
+        self, anonymous_client, django_assert_num_queries
+    ):
+        factories.EventFactory.create_batch(2)
+        first_response = anonymous_client.get(self.URL_EVENTS, {"ordering": "name"})
+
+        with django_assert_num_queries(0):
+            second_response = anonymous_client.get(
+                self.URL_EVENTS, {"ordering": "name"}
+            )
+
+        assert second_response.status_code == HTTPStatus.OK
+        assert second_response.json() == first_response.json()
+
+    def test_02_detail_is_served_from_cache(
+        self, anonymous_client, django_assert_num_queries
+    ):
+        event = factories.EventFactory()
+        url = f"{self.URL_EVENTS}{event.id}/"
+        anonymous_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(url)
+
+        assert response.json()["id"] == event.id
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda event: factories.ApplicationFactory(event=event),
+            lambda event: factories.EventPartFactory(event=event),
+            lambda event: Event.objects.get(pk=event.pk).delete(),
+            lambda event: event.event_type.save(),
+        ],
+        ids=["application", "event_part", "event_deletion", "event_type"],
+    )
+    def test_02_cache_is_invalidated(self, anonymous_client, change):
+        event = factories.EventFactory()
+        anonymous_client.get(self.URL_EVENTS)
+
+        change(event)
+
+        with CaptureQueriesContext(connection) as context:
+            anonymous_client.get(self.URL_EVENTS)
+        assert (
+            context.captured_queries
+        ), f"Изменение данных мероприятия должно сбрасывать кэш {self.URL_EVENTS}."
+
+    def test_02_cache_is_invalidated_after_commit(
+        self, anonymous_client, django_capture_on_commit_callbacks
+    ):
+        event = factories.EventFactory()
+        url = f"{self.URL_EVENTS}{event.id}/"
+        anonymous_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                event.name = "Новое название"
+                event.save()
+                # Чтение до коммита кэширует ответ под новой версией
+                anonymous_client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = anonymous_client.get(url)
+        assert context.captured_queries, (
+            "Ответ, закэшированный до коммита изменения, не должен отдаваться "
+            "после коммита."
+        )
+        assert response.json()["name"] == "Новое название"
+
+    def test_02_cache_is_invalidated_on_registration_closure(self, anonymous_client):
+        event = factories.EventFactory(participant_online_limit=1)
+        factories.ApplicationFactory(event=event)
+        url = f"{self.URL_EVENTS}{event.id}/"
+        first_status = anonymous_client.get(url).json()["status"]
+
+        EventClosureController.check_event_limits_and_close_registration(event)
+
+        assert event.status == Event.STATUS_CLOSED
+        assert anonymous_client.get(url).json()["status"] != first_status
+
+    def test_02_registration_status_is_overlaid(
+        self, anonymous_client, user, user_client
+    ):
+        registrated_event, other_event = factories.EventFactory.create_batch(2)
+        factories.ApplicationFactory(event=registrated_event, user=user)
+        anonymous_client.get(self.URL_EVENTS)
+
+        response = user_client.get(self.URL_EVENTS)
+
+        results = {item["id"]: item for item in response.json()["results"]}
+        assert results[registrated_event.id]["is_registrated"] is True, (
+            f"Ответ на GET-запрос к {self.URL_EVENTS} из кэша должен содержать "
+            "статус регистрации авторизованного пользователя."
+        )
+        assert results[other_event.id]["is_registrated"] is False
+        anonymous_results = anonymous_client.get(self.URL_EVENTS).json()["results"]
+        assert not any(item["is_registrated"] for item in anonymous_results)
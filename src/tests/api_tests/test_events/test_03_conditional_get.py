@@ -0,0 +1,109 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.api_tests import factories
+
+from events.models import Event
+
+
+@pytest.mark.django_db
+class Test03ConditionalGet:
+    URL_EVENTS = "/api/v1/events/"
+    URL_CITIES = "/api/v1/cities/"
+
+    def test_03_list_returns_validators(self, anonymous_client):
+        factories.EventFactory()
+
+        response = anonymous_client.get(self.URL_EVENTS)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"].startswith(
+            '"'
+        ), f"Ответ на GET-запрос к {self.URL_EVENTS} должен содержать сильный ETag."
+        assert "Last-Modified" in response.headers
+
+    def test_03_list_is_not_modified(self, anonymous_client, django_assert_num_queries):
+        factories.EventFactory()
+        etag = anonymous_client.get(self.URL_EVENTS).headers["ETag"]
+
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(self.URL_EVENTS, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f"GET-запрос к {self.URL_EVENTS} с актуальным ETag должен возвращать "
+            "ответ со статусом 304."
+        )
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+    def test_03_detail_is_not_modified_since(self, anonymous_client):
+        event = factories.EventFactory()
+        url = f"{self.URL_EVENTS}{event.id}/"
+        last_modified = anonymous_client.get(url).headers["Last-Modified"]
+
+        response = anonymous_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_03_etag_depends_on_request(self, anonymous_client, user_client):
+        factories.EventFactory.create_batch(2)
+        etag = anonymous_client.get(self.URL_EVENTS).headers["ETag"]
+
+        assert (
+            anonymous_client.get(self.URL_EVENTS, {"ordering": "name"}).headers["ETag"]
+            != etag
+        )
+        assert user_client.get(self.URL_EVENTS).headers["ETag"] != etag
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda event: Event.objects.get(pk=event.pk).save(),
+            lambda event: factories.EventPartFactory(event=event),
+            lambda event: factories.ApplicationFactory(event=event),
+            lambda event: event.event_type.save(),
+        ],
+        ids=["event", "event_part", "application", "event_type"],
+    )
+    def test_03_etag_changes_with_data(self, anonymous_client, change):
+        event = factories.EventFactory()
+        etag = anonymous_client.get(self.URL_EVENTS).headers["ETag"]
+
+        change(event)
+        response = anonymous_client.get(self.URL_EVENTS, HTTP_IF_NONE_MATCH=etag)
+
+        assert (
+            response.status_code == HTTPStatus.OK
+        ), f"Изменение данных мероприятия должно менять ETag {self.URL_EVENTS}."
+        assert response.headers["ETag"] != etag
+
+    def test_03_reference_list_is_not_modified(
+        self, anonymous_client, django_assert_num_queries
+    ):
+        city = factories.CityFactory()
+        etag = anonymous_client.get(self.URL_CITIES).headers["ETag"]
+
+        # Справочник берётся из кэша процесса, запросов к базе нет
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(self.URL_CITIES, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        city.name = "Новый город"
+        city.save()
+        response = anonymous_client.get(self.URL_CITIES, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()[0]["city_name"] == "Новый город"
+
+    @pytest.mark.parametrize(
+        "url", ["cities", "event_types", "specializations", "bootstrap"]
+    )
+    def test_03_lists_have_no_detail_route(self, anonymous_client, url):
+        factories.CityFactory()
+
+        response = anonymous_client.get(f"/api/v1/{url}/1/")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            f"У /api/v1/{url}/ нет объектов по id: роутер не должен "
+            "маршрутизировать запросы к ним."
+        )
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from events.models import Event
+
+
+@pytest.mark.django_db
+class Test04CursorPagination:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture
+    def events(self):
+        start_time = timezone.now() + timedelta(days=1)
+        # Мероприятия с одинаковым временем начала проверяют тайбрейкер по pk
+        return [
+            factories.EventFactory(start_time=start_time + timedelta(hours=index // 2))
+            for index in range(7)
+        ]
+
+    def walk(self, client, params, link_name="next"):
+        """Returns the ids of events on all the pages following the links."""
+        response = client.get(self.URL_EVENTS, {"cursor": "", "limit": 3, **params})
+        assert response.status_code == HTTPStatus.OK
+        ids = [event["id"] for event in response.json()["results"]]
+        while response.json()[link_name]:
+            response = client.get(response.json()[link_name])
+            assert response.status_code == HTTPStatus.OK
+            ids += [event["id"] for event in response.json()["results"]]
+        return ids
+
+    @pytest.mark.parametrize(
+        "ordering, expected_ordering",
+        [
+            ("", ["pk"]),
+            ("start_time", ["start_time", "pk"]),
+            ("-start_time", ["-start_time", "-pk"]),
+            ("name", ["name", "pk"]),
+            ("-name", ["-name", "-pk"]),
+        ],
+    )
+    def test_04_pages_cover_all_events(
+        self, anonymous_client, events, ordering, expected_ordering
+    ):
+        expected = list(
+            Event.objects.order_by(*expected_ordering).values_list("id", flat=True)
+        )
+
+        ids = self.walk(anonymous_client, {"ordering": ordering})
+
+        assert ids == expected, (
+            f"Страницы {self.URL_EVENTS}?cursor= должны содержать все мероприятия "
+            "в порядке сортировки без пропусков и повторов."
+        )
+
+    def test_04_previous_links(self, anonymous_client, events):
+        response = anonymous_client.get(
+            self.URL_EVENTS, {"cursor": "", "limit": 3, "ordering": "start_time"}
+        )
+        first_page = response.json()
+        assert first_page["previous"] is None
+        third_page = anonymous_client.get(
+            anonymous_client.get(first_page["next"]).json()["next"]
+        ).json()
+        assert third_page["next"] is None
+
+        second_page = anonymous_client.get(third_page["previous"]).json()
+        first_page_again = anonymous_client.get(second_page["previous"]).json()
+
+        assert [event["id"] for event in second_page["results"]] == [
+            event.id for event in events[3:6]
+        ]
+        assert first_page_again["results"] == first_page["results"]
+        assert first_page_again["previous"] is None
+
+    def test_04_no_count_query(self, anonymous_client, events):
+        with CaptureQueriesContext(connection) as context:
+            response = anonymous_client.get(self.URL_EVENTS, {"cursor": ""})
+
+        assert response.status_code == HTTPStatus.OK
+        assert "count" not in response.json()
+        assert not any(
+            "COUNT(*)" in query["sql"] for query in context.captured_queries
+        ), f"GET-запрос к {self.URL_EVENTS}?cursor= не должен считать мероприятия."
+
+    @pytest.mark.parametrize("cursor", ["invalid", "e30=", "bnVsbA=="])
+    def test_04_invalid_cursor(self, anonymous_client, cursor):
+        response = anonymous_client.get(self.URL_EVENTS, {"cursor": cursor})
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_cursor_is_bound_to_ordering(self, anonymous_client, events):
+        next_link = anonymous_client.get(
+            self.URL_EVENTS, {"cursor": "", "limit": 3, "ordering": "name"}
+        ).json()["next"]
+
+        response = anonymous_client.get(
+            next_link.replace("ordering=name", "ordering=start_time")
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
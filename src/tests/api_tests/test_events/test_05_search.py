@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.api_tests import factories
+
+from events.models import Event
+
+
+@pytest.mark.django_db
+class Test05Search:
+    URL_EVENTS = "/api/v1/events/"
+
+    def search(self, client, query, **params):
+        response = client.get(self.URL_EVENTS, {"search": query, **params})
+        assert response.status_code == HTTPStatus.OK
+        return [event["id"] for event in response.json()["results"]]
+
+    @pytest.fixture
+    def event(self):
+        event = factories.EventFactory(
+            name="Митап по Питону",
+            description="Разбираем асинхронность и профилирование",
+            event_parts=None,
+        )
+        factories.EventPartFactory(
+            event=event,
+            speaker=factories.SpeakerFactory(
+                name="Аполлинария Скрипкина", company="Квантовый бублик"
+            ),
+        )
+        return event
+
+    @pytest.mark.parametrize(
+        "query",
+        ["митап", "ПРОФИЛИРОВАНИЕ", "Скрипкина", "бублик", "асинхр", "питону митап"],
+        ids=["name", "description", "speaker", "company", "prefix", "several_words"],
+    )
+    def test_05_search_finds_event(self, anonymous_client, event, query):
+        factories.EventFactory(name="Другое мероприятие", description="Ничего")
+
+        assert self.search(anonymous_client, query) == [event.id], (
+            f"Поиск по {self.URL_EVENTS}?search= должен находить мероприятия "
+            "по названию, описанию, именам и местам работы спикеров "
+            "без учёта регистра."
+        )
+
+    def test_05_search_ranks_name_matches_first(self, anonymous_client, event):
+        description_match = factories.EventFactory(
+            name="Вечер докладов", description="Митап для всех"
+        )
+
+        assert self.search(anonymous_client, "митап") == [
+            event.id,
+            description_match.id,
+        ]
+
+    def test_05_ordering_parameter_overrides_rank(self, anonymous_client, event):
+        description_match = factories.EventFactory(
+            name="Вечер докладов", description="Митап для всех"
+        )
+
+        assert self.search(anonymous_client, "митап", ordering="name") == [
+            description_match.id,
+            event.id,
+        ]
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda event: event.parts.all().delete(),
+            lambda event: event.parts.first().speaker.delete(),
+        ],
+        ids=["event_part_deletion", "speaker_deletion"],
+    )
+    def test_05_index_follows_agenda_changes(self, anonymous_client, event, change):
+        change(event)
+
+        assert self.search(anonymous_client, "бублик") == []
+
+    def test_05_index_follows_speaker_changes(self, anonymous_client, event):
+        speaker = event.parts.first().speaker
+        speaker.company = "Облачный пончик"
+        speaker.save()
+
+        assert self.search(anonymous_client, "пончик") == [event.id]
+        assert self.search(anonymous_client, "бублик") == []
+
+    def test_05_index_follows_event_changes(self, anonymous_client, event):
+        event.name = "Конференция по Го"
+        event.save()
+        deleted_event = factories.EventFactory(name="Митап по Расту")
+        Event.objects.get(pk=deleted_event.pk).delete()
+
+        assert self.search(anonymous_client, "конференция") == [event.id]
+        assert self.search(anonymous_client, "митап") == []
+
+    def test_05_search_with_cursor_pagination(self, anonymous_client):
+        events = factories.EventFactory.create_batch(
+            5, description="Митап", event_parts=None
+        )
+        response = anonymous_client.get(
+            self.URL_EVENTS, {"search": "митап", "cursor": "", "limit": 2}
+        )
+        ids = [item["id"] for item in response.json()["results"]]
+        while response.json()["next"]:
+            response = anonymous_client.get(response.json()["next"])
+            ids += [item["id"] for item in response.json()["results"]]
+
+        assert sorted(ids) == sorted(event.id for event in events)
+
+    def test_05_name_filter_keeps_working(self, anonymous_client, event):
+        response = anonymous_client.get(self.URL_EVENTS, {"name": "Питону"})
+
+        assert [item["id"] for item in response.json()["results"]] == [event.id]
@@ -0,0 +1,21 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.api_tests import factories
+
+
+@pytest.mark.django_db
+class Test06ExplainEventQueries:
+    def test_06_filtered_queries_use_indexes(self):
+        factories.EventFactory.create_batch(3, city=factories.CityFactory())
+        stdout = StringIO()
+
+        call_command("explain_event_queries", "--fail-on-full-scan", stdout=stdout)
+
+        output = stdout.getvalue()
+        assert (
+            "list [upcoming active]: index" in output
+        ), "Список будущих активных мероприятий должен использовать индекс."
+        assert "application duplicate email: index" in output
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from tests.api_tests import factories
+
+from events.models import Event
+from events.serializers import EventListFastSerializer, EventListSerializer
+
+
+@pytest.mark.django_db
+class Test07FastListSerializer:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture
+    def events(self, user):
+        city_event = factories.EventFactory(
+            city=factories.CityFactory(),
+            image="events/poster.png",
+            format=Event.FORMAT_HYBRID,
+            status=Event.STATUS_ONLINE_CLOSED,
+            livestream_link="https://example.com/live",
+            participant_offline_limit=10,
+            cost=1500,
+        )
+        city_event.parts.update(
+            speaker=factories.SpeakerFactory(photo="speakers/photo.png")
+        )
+        factories.ApplicationFactory(event=city_event, user=user)
+        factories.ApplicationFactory(event=city_event, format=Event.FORMAT_OFFLINE)
+        no_speaker_event = factories.EventFactory(event_parts=None)
+        return [city_event, no_speaker_event]
+
+    @staticmethod
+    def render(data):
+        return json.loads(JSONRenderer().render(data))
+
+    @pytest.mark.parametrize("is_authenticated", [False, True])
+    def test_07_output_matches_model_serializer(self, user, events, is_authenticated):
+        request = Request(APIRequestFactory().get(self.URL_EVENTS))
+        request.user = user if is_authenticated else AnonymousUser()
+        queryset = EventListSerializer.setup_eager_loading(
+            Event.objects.order_by("pk"), user=request.user
+        )
+        context = {"request": request}
+
+        expected = EventListSerializer(queryset, many=True, context=context).data
+        data = EventListFastSerializer(
+            EventListFastSerializer.project(queryset), many=True, context=context
+        ).data
+
+        assert self.render(data) == self.render(expected), (
+            "Быстрый сериализатор списка мероприятий должен возвращать те же "
+            "данные, что и EventListSerializer."
+        )
+        assert [list(item) for item in data] == [list(item) for item in expected]
+
+    def test_07_list_endpoint_uses_fast_serializer(
+        self, anonymous_client, events, monkeypatch
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("Список не должен использовать EventListSerializer.")
+
+        monkeypatch.setattr(EventListSerializer, "to_representation", fail)
+
+        response = anonymous_client.get(self.URL_EVENTS)
+
+        first_speaker = response.json()["results"][0]["first_speaker"]
+        assert first_speaker["photo"] == "/media/speakers/photo.png"
+        assert response.json()["results"][0]["image"] == (
+            "http://testserver/media/events/poster.png"
+        )
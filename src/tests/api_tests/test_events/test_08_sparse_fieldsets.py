@@ -0,0 +1,97 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.api_tests import factories
+
+
+@pytest.mark.django_db
+class Test08SparseFieldsets:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture
+    def event(self, user):
+        event = factories.EventFactory(city=factories.CityFactory())
+        factories.ApplicationFactory(event=event, user=user)
+        return event
+
+    @staticmethod
+    def get_with_queries(client, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, params)
+        assert response.status_code == HTTPStatus.OK
+        # Запрос страницы мероприятий, без запросов пользователя и состояния данных
+        return response.json(), " ".join(
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('SELECT "events_event"')
+        )
+
+    def test_08_fields_limit_output_and_query(self, user_client, event):
+        data, sql = self.get_with_queries(
+            user_client, self.URL_EVENTS, {"fields": "name,start_time,image"}
+        )
+
+        assert list(data["results"][0]) == ["id", "name", "start_time", "image"], (
+            f"Параметр fields у {self.URL_EVENTS} должен оставлять в ответе "
+            "только перечисленные поля и id."
+        )
+        for table_or_column in (
+            "applications_application",
+            "events_city",
+            "events_eventpart",
+            '"events_event"."description"',
+        ):
+            assert (
+                table_or_column not in sql
+            ), "Данные полей, не запрошенных в fields, не должны загружаться."
+
+    def test_08_omit_drops_fields(self, user_client, event):
+        data, sql = self.get_with_queries(
+            user_client,
+            self.URL_EVENTS,
+            {
+                "omit": "description,is_registrated,submitted_applications,"
+                "submitted_applications_offline,submitted_applications_online"
+            },
+        )
+
+        result = data["results"][0]
+        assert "description" not in result
+        assert "is_registrated" not in result
+        assert "submitted_applications" not in result
+        assert result["city"]["id"] == event.city_id
+        assert "applications_application" not in sql
+
+    def test_08_retrieve_with_fields(self, anonymous_client, event):
+        data, _ = self.get_with_queries(
+            anonymous_client,
+            f"{self.URL_EVENTS}{event.id}/",
+            {"fields": "name,event_parts"},
+        )
+
+        assert list(data) == ["id", "name", "event_parts"]
+        assert len(data["event_parts"]) == event.parts.count()
+
+    def test_08_fields_with_cursor_pagination(self, anonymous_client):
+        events = factories.EventFactory.create_batch(3, event_parts=None)
+        params = {"fields": "name", "cursor": "", "ordering": "start_time", "limit": 2}
+        response = anonymous_client.get(self.URL_EVENTS, params)
+        ids = [item["id"] for item in response.json()["results"]]
+        ids += [
+            item["id"]
+            for item in anonymous_client.get(response.json()["next"]).json()["results"]
+        ]
+
+        assert ids == [
+            event.id for event in sorted(events, key=lambda event: event.start_time)
+        ]
+
+    @pytest.mark.parametrize("param", ["fields", "omit"])
+    def test_08_unknown_field(self, anonymous_client, param):
+        response = anonymous_client.get(self.URL_EVENTS, {param: "name,password"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert "password" in response.json()["errors"][0]["detail"]
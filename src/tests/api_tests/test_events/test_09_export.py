@@ -0,0 +1,71 @@
+import csv
+import json
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+
+from tests.api_tests import factories
+
+
+@pytest.mark.django_db
+class Test09Export:
+    URL_EXPORT = "/api/v1/events/export/"
+
+    @pytest.fixture
+    def events(self):
+        event = factories.EventFactory(name="Конференция", event_parts=None)
+        factories.EventPartFactory.create_batch(2, event=event)
+        return [event, factories.EventFactory(name="Митап", event_parts=None)]
+
+    @staticmethod
+    def read(response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_09_export_ndjson(self, admin_client, events):
+        response = admin_client.get(self.URL_EXPORT)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming, "Экспорт мероприятий должен отдаваться потоком."
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        assert [event["id"] for event in lines] == [event.id for event in events]
+        assert len(lines[0]["event_parts"]) == 2
+        assert "speaker_name" in lines[0]["event_parts"][0]["speaker"]
+
+    def test_09_export_csv(self, admin_client, events):
+        response = admin_client.get(self.URL_EXPORT, {"output": "csv"})
+
+        assert response["Content-Type"] == "text/csv"
+        rows = list(csv.DictReader(StringIO(self.read(response))))
+        assert [int(row["id"]) for row in rows] == [
+            events[0].id,
+            events[0].id,
+            events[1].id,
+        ], "CSV должен содержать по строке на каждую часть мероприятия."
+        assert rows[0]["event_parts.speaker.speaker_name"]
+        assert rows[0]["city.city_name"] == ""
+        assert rows[2]["event_parts.event_part_name"] == ""
+
+    def test_09_export_applies_filters(self, admin_client, events):
+        response = admin_client.get(self.URL_EXPORT, {"name": "Митап"})
+
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        assert [event["id"] for event in lines] == [events[1].id]
+
+    def test_09_export_unknown_output(self, admin_client):
+        response = admin_client.get(self.URL_EXPORT, {"output": "xml"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    @pytest.mark.parametrize(
+        "client_name, status",
+        [
+            ("anonymous_client", HTTPStatus.UNAUTHORIZED),
+            ("user_client", HTTPStatus.FORBIDDEN),
+        ],
+    )
+    def test_09_export_is_staff_only(self, request, client_name, status):
+        response = request.getfixturevalue(client_name).get(self.URL_EXPORT)
+
+        assert response.status_code == status, "Экспорт доступен только персоналу."
@@ -0,0 +1,123 @@
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from PIL import Image
+
+from tests.api_tests import factories
+
+from config import celery_app
+from events.models import Event
+from events.tasks import create_image_variants
+
+
+def make_image(size: tuple[int, int], mode: str = "RGB") -> ContentFile:
+    buffer = BytesIO()
+    Image.new(mode, size, "red").save(buffer, "PNG")
+    return ContentFile(buffer.getvalue())
+
+
+@pytest.mark.django_db
+class Test10ImageVariants:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path, monkeypatch):
+        settings.MEDIA_ROOT = tmp_path
+        monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+
+    def test_10_upload_does_not_wait_for_variants(
+        self, django_capture_on_commit_callbacks
+    ):
+        event = factories.EventFactory(event_parts=None)
+        with django_capture_on_commit_callbacks() as callbacks:
+            event.image.save("poster.png", make_image((1200, 800)))
+
+        scheduled = [
+            callback
+            for callback in callbacks
+            if callback.func == create_image_variants.delay
+        ]
+        assert (
+            len(scheduled) == 1
+        ), "Создание вариантов афиши должно ставиться в очередь после сохранения."
+        event.refresh_from_db()
+        assert event.image_variants == {}
+
+    def test_10_variants_are_generated(
+        self, anonymous_client, django_capture_on_commit_callbacks
+    ):
+        event = factories.EventFactory(event_parts=None)
+        with django_capture_on_commit_callbacks(execute=True):
+            event.image.save("poster.png", make_image((1200, 800)))
+
+        event.refresh_from_db()
+        variants = event.image_variants["variants"]
+        assert event.image_variants["source"] == event.image.name
+        assert (variants["thumbnail"]["width"], variants["thumbnail"]["height"]) == (
+            320,
+            213,
+        )
+        assert variants["full"]["width"] == 1200, "Варианты не должны увеличиваться."
+        storage = Event._meta.get_field("image").storage
+        with storage.open(variants["card"]["webp"]) as file:
+            assert Image.open(file).format == "WEBP"
+        assert variants["card"]["fallback"].endswith(".jpg")
+
+        response = anonymous_client.get(self.URL_EVENTS)
+        image_variants = response.json()["results"][0]["image_variants"]
+        assert image_variants["thumbnail"]["webp"] == (
+            f"http://testserver/media/{variants['thumbnail']['webp']}"
+        )
+
+    def test_10_transparent_photo_falls_back_to_png(
+        self, django_capture_on_commit_callbacks
+    ):
+        speaker = factories.SpeakerFactory()
+        with django_capture_on_commit_callbacks(execute=True):
+            speaker.photo.save("photo.png", make_image((400, 400), mode="RGBA"))
+
+        speaker.refresh_from_db()
+        fallback = speaker.photo_variants["variants"]["thumbnail"]["fallback"]
+        assert fallback.endswith(".png")
+
+    def test_10_removed_image_clears_variants(self, django_capture_on_commit_callbacks):
+        event = factories.EventFactory(event_parts=None)
+        with django_capture_on_commit_callbacks(execute=True):
+            event.image.save("poster.png", make_image((100, 100)))
+        event.refresh_from_db()
+
+        event.image = ""
+        event.save()
+
+        event.refresh_from_db()
+        assert event.image_variants == {}
+
+    def test_10_cleared_variants_update_modification_time(
+        self, django_capture_on_commit_callbacks
+    ):
+        event = factories.EventFactory(event_parts=None)
+        with django_capture_on_commit_callbacks(execute=True):
+            event.image.save("poster.png", make_image((100, 100)))
+        event.refresh_from_db()
+        updated = event.updated
+
+        event.image = ""
+        event.save(update_fields=["image"])
+
+        event.refresh_from_db()
+        assert event.image_variants == {}
+        assert event.updated > updated, (
+            "Очистка вариантов изображения должна обновлять время изменения, "
+            "по которому вычисляются ETag и Last-Modified."
+        )
+
+    def test_10_command_generates_missing_variants(self):
+        event = factories.EventFactory(event_parts=None)
+        event.image.save("poster.png", make_image((100, 100)))
+
+        call_command("generate_image_variants", "--sync", stdout=StringIO())
+
+        event.refresh_from_db()
+        assert event.image_variants["source"] == event.image.name
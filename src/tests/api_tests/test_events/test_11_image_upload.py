@@ -0,0 +1,196 @@
+import base64
+import os
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.utils import timezone
+from PIL import Image
+from rest_framework.exceptions import ValidationError
+
+from tests.api_tests import factories
+
+from api.services.image_decoder import Base64ImageField
+from events.models import Event
+
+
+def make_png(size: tuple[int, int] = (60, 40)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, "blue").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_data_url(content: bytes, image_format: str = "png") -> str:
+    return f"data:image/{image_format};base64,{base64.b64encode(content).decode()}"
+
+
+@pytest.mark.django_db
+class Test11ImageUpload:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+
+    @pytest.fixture
+    def event_form(self):
+        start_time = (timezone.now() + timezone.timedelta(days=3)).isoformat()
+        return {
+            "name": "Митап с афишей",
+            "description": "Описание",
+            "event_type": factories.EventTypeFactory().id,
+            "specializations": factories.SpecializationFactory().id,
+            "format": Event.FORMAT_ONLINE,
+            "start_time": start_time,
+            "event_parts[0][event_part_name]": "Доклад",
+            "event_parts[0][event_part_description]": "О докладе",
+            "event_parts[0][event_part_created]": start_time,
+            "event_parts[0][event_part_start_time]": start_time,
+            "event_parts[0][speaker][speaker_name]": "Спикер с фото",
+            "event_parts[0][speaker][company]": "Компания",
+            "event_parts[0][speaker][position]": "Должность",
+            "event_parts[0][speaker][speaker_description]": "Регалии",
+        }
+
+    def test_11_multipart_create_with_images(self, admin_client, event_form):
+        response = admin_client.post(
+            self.URL_EVENTS,
+            {
+                **event_form,
+                "image": SimpleUploadedFile("poster.png", make_png()),
+                "event_parts[0][speaker][photo]": SimpleUploadedFile(
+                    "photo.png", make_png()
+                ),
+            },
+            format="multipart",
+        )
+
+        assert response.status_code == HTTPStatus.CREATED, (
+            f"POST-запрос к {self.URL_EVENTS} должен принимать афишу и фото "
+            "спикеров файлами multipart/form-data."
+        )
+        event = Event.objects.get(pk=response.json()["id"])
+        assert event.image.name.startswith("events/")
+        assert event.parts.get().speaker.photo.name.startswith("speakers/")
+
+    def test_11_base64_patch(self, admin_client):
+        event = factories.EventFactory(event_parts=None)
+
+        response = admin_client.patch(
+            f"{self.URL_EVENTS}{event.id}/",
+            {"image": make_data_url(make_png())},
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        event.refresh_from_db()
+        with event.image.open("rb") as file:
+            assert file.read() == make_png()
+
+    def test_11_decoded_files_are_closed_after_save(self, admin_client, monkeypatch):
+        event = factories.EventFactory(event_parts=None)
+        closed = []
+        close = TemporaryUploadedFile.close
+
+        def track_close(file):
+            closed.append(file)
+            return close(file)
+
+        monkeypatch.setattr(TemporaryUploadedFile, "close", track_close)
+
+        response = admin_client.patch(
+            f"{self.URL_EVENTS}{event.id}/",
+            {"image": make_data_url(make_png())},
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(closed) == 1, (
+            "Временный файл декодированного изображения должен закрываться "
+            "после сохранения, а не сборщиком мусора."
+        )
+        assert closed[0].file.closed
+        assert not os.path.exists(closed[0].file.name)
+
+    def test_11_json_request_size_limit(self, admin_client, settings):
+        event = factories.EventFactory(event_parts=None)
+        settings.IMAGE_REQUEST_MAX_SIZE = 1024
+
+        response = admin_client.patch(
+            f"{self.URL_EVENTS}{event.id}/",
+            {"image": make_data_url(make_png((300, 300)))},
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            "JSON-запрос с изображением больше IMAGE_REQUEST_MAX_SIZE должен "
+            "отклоняться до разбора."
+        )
+        assert response.json()["errors"][0]["detail"].startswith("Размер запроса")
+
+    @pytest.mark.parametrize(
+        "data, setting, message",
+        [
+            (make_data_url(make_png()), {"IMAGE_UPLOAD_MAX_SIZE": 100}, "МБ"),
+            (make_data_url(make_png()), {"IMAGE_UPLOAD_MAX_PIXELS": 100}, "мегапикс"),
+            (make_data_url(b"GIF89a" + make_png()), {}, "формату"),
+            ("data:image/png;base64,#" + "A" * 100, {}, "base64"),
+        ],
+        ids=["max_size", "max_pixels", "signature", "invalid_base64"],
+    )
+    def test_11_base64_rejected(self, settings, data, setting, message):
+        for name, value in setting.items():
+            setattr(settings, name, value)
+
+        with pytest.raises(ValidationError) as error:
+            Base64ImageField().run_validation(data)
+
+        assert message in str(error.value.detail[0])
+
+    def test_11_base64_size_checked_before_decoding(self, settings, monkeypatch):
+        settings.IMAGE_UPLOAD_MAX_SIZE = 100
+
+        def fail(*args, **kwargs):
+            raise AssertionError(
+                "Слишком большое изображение не должно декодироваться."
+            )
+
+        monkeypatch.setattr(base64, "b64decode", fail)
+
+        with pytest.raises(ValidationError):
+            Base64ImageField().run_validation(make_data_url(make_png()))
+
+    def test_11_base64_is_decoded_to_file_on_disk(self):
+        image = Base64ImageField().decode_base64(make_data_url(make_png()))
+
+        with open(image.temporary_file_path(), "rb") as file:
+            assert file.read() == make_png(), (
+                "Изображение base64 должно декодироваться во временный файл на "
+                "диске, который проверка изображения открывает по пути."
+            )
+        assert image.size == len(make_png())
+
+    def test_11_base64_with_line_breaks(self, settings):
+        # Шум не сжимается: base64 занимает несколько частей декодирования
+        buffer = BytesIO()
+        Image.frombytes("RGB", (200, 200), os.urandom(200 * 200 * 3)).save(
+            buffer, "PNG"
+        )
+        content: bytes = buffer.getvalue()
+        wrapped: str = base64.encodebytes(content).decode().replace("\n", "\r\n ")
+        settings.IMAGE_UPLOAD_MAX_SIZE = len(content)
+
+        image = Base64ImageField().run_validation(f"data:image/png;base64,{wrapped}")
+
+        assert (
+            image.read() == content
+        ), "Строка base64, разбитая на строки, должна приниматься."
+
+    def test_11_multipart_file_size_limit(self, settings):
+        settings.IMAGE_UPLOAD_MAX_SIZE = 100
+
+        with pytest.raises(ValidationError):
+            Base64ImageField().run_validation(
+                SimpleUploadedFile("poster.png", make_png())
+            )
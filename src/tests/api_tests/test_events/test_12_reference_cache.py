@@ -0,0 +1,71 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+
+from tests.api_tests import factories
+
+from api.services.reference_cache import ReferenceCache, ReferencePrimaryKeyRelatedField
+from events.models import City
+
+
+@pytest.mark.django_db
+class Test12ReferenceCache:
+    URL_CITIES = "/api/v1/cities/"
+    URL_EVENTS = "/api/v1/events/"
+
+    def test_12_reference_list_from_memory(
+        self, anonymous_client, django_assert_num_queries
+    ):
+        factories.CityFactory()
+        anonymous_client.get(self.URL_CITIES)
+
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(self.URL_CITIES)
+
+        assert response.status_code == HTTPStatus.OK
+        assert [city["city_slug"] for city in response.json()] == ["moscow"], (
+            f"Повторный запрос к {self.URL_CITIES} должен обслуживаться "
+            "из кэша справочников без запросов к базе."
+        )
+
+    def test_12_changes_invalidate_cache(self, anonymous_client):
+        city = factories.CityFactory()
+        reference_cache = ReferenceCache()
+        assert reference_cache.all(City) == [city]
+        anonymous_client.get(self.URL_CITIES)
+
+        kazan = City.objects.create(name="Казань", slug="kazan")
+        city.delete()
+
+        assert reference_cache.all(City) == [kazan]
+        response = anonymous_client.get(self.URL_CITIES)
+        assert [city["city_slug"] for city in response.json()] == ["kazan"]
+
+    def test_12_slug_filter_without_join(self, anonymous_client):
+        city = factories.CityFactory()
+        event = factories.EventFactory(city=city)
+        factories.EventFactory(city=City.objects.create(name="Казань", slug="kazan"))
+        anonymous_client.get(self.URL_CITIES)
+
+        with CaptureQueriesContext(connection) as context:
+            response = anonymous_client.get(
+                self.URL_EVENTS, {"city": "moscow,unknown", "fields": "name"}
+            )
+
+        assert [item["id"] for item in response.json()["results"]] == [event.id]
+        assert not any(
+            '"events_city"."slug"' in query["sql"] for query in context.captured_queries
+        ), "Слаги справочников должны превращаться в id без запросов к базе."
+
+    def test_12_related_field_from_memory(self, django_assert_num_queries):
+        city = factories.CityFactory()
+        field = ReferencePrimaryKeyRelatedField(queryset=City.objects.all())
+        field.to_internal_value(city.id)
+
+        with django_assert_num_queries(0):
+            assert field.to_internal_value(str(city.id)) == city
+        with pytest.raises(ValidationError):
+            field.to_internal_value(city.id + 1)
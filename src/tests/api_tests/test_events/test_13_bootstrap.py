@@ -0,0 +1,103 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.api_tests import factories
+
+from applications.models import Source
+
+
+@pytest.mark.django_db
+class Test13Bootstrap:
+    URL_BOOTSTRAP = "/api/v1/bootstrap/"
+
+    @pytest.fixture
+    def references(self):
+        return {
+            "city": factories.CityFactory(),
+            "event_type": factories.EventTypeFactory(),
+            "specialization": factories.SpecializationFactory(),
+            "source": Source.objects.create(name="Телеграм", slug="telegram"),
+        }
+
+    def test_13_bootstrap_returns_all_references(
+        self, anonymous_client, references, django_assert_max_num_queries
+    ):
+        with django_assert_max_num_queries(len(references)):
+            response = anonymous_client.get(self.URL_BOOTSTRAP)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "cities": [
+                {
+                    "id": references["city"].id,
+                    "city_name": references["city"].name,
+                    "city_slug": "moscow",
+                }
+            ],
+            "event_types": [
+                {
+                    "id": references["event_type"].id,
+                    "event_type_name": references["event_type"].name,
+                    "event_type_slug": "conference",
+                }
+            ],
+            "specializations": [
+                {
+                    "id": references["specialization"].id,
+                    "specialization_name": references["specialization"].name,
+                    "specialization_slug": "backend",
+                }
+            ],
+            "sources": [
+                {
+                    "id": references["source"].id,
+                    "source_name": "Телеграм",
+                    "source_slug": "telegram",
+                }
+            ],
+        }, f"{self.URL_BOOTSTRAP} должен возвращать все справочники одним ответом."
+        assert "public" in response.headers["Cache-Control"]
+        assert "Last-Modified" in response.headers
+
+    def test_13_bootstrap_is_not_modified(
+        self, anonymous_client, references, django_assert_num_queries
+    ):
+        etag = anonymous_client.get(self.URL_BOOTSTRAP).headers["ETag"]
+
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(self.URL_BOOTSTRAP, HTTP_IF_NONE_MATCH=etag)
+            repeated = anonymous_client.get(self.URL_BOOTSTRAP)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f"GET-запрос к {self.URL_BOOTSTRAP} с актуальным ETag должен "
+            "возвращать ответ со статусом 304 без запросов к базе."
+        )
+        assert repeated.status_code == HTTPStatus.OK
+        assert repeated.headers["ETag"] == etag
+
+    def test_13_reference_change_updates_bootstrap(self, anonymous_client, references):
+        etag = anonymous_client.get(self.URL_BOOTSTRAP).headers["ETag"]
+
+        Source.objects.create(name="Друзья", slug="friends")
+        response = anonymous_client.get(self.URL_BOOTSTRAP, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+        assert [source["source_slug"] for source in response.json()["sources"]] == [
+            "telegram",
+            "friends",
+        ], "Изменение справочника должно сразу отражаться в ответе."
+
+    def test_13_source_rename_updates_bootstrap(self, anonymous_client, references):
+        etag = anonymous_client.get(self.URL_BOOTSTRAP).headers["ETag"]
+
+        references["source"].name = "Телеграм-канал"
+        references["source"].save()
+        response = anonymous_client.get(self.URL_BOOTSTRAP, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK, (
+            "Изменение справочника без времени изменения должно менять ETag "
+            f"ответа {self.URL_BOOTSTRAP}."
+        )
+        assert response.json()["sources"][0]["source_name"] == "Телеграм-канал"
@@ -0,0 +1,88 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.api_tests import factories
+
+from events.models import City, Event
+
+
+@pytest.mark.django_db
+class Test14Facets:
+    URL_FACETS = "/api/v1/events/facets/"
+
+    @pytest.fixture
+    def events(self):
+        moscow = factories.CityFactory()
+        kazan = City.objects.create(name="Казань", slug="kazan")
+        factories.EventFactory(city=moscow, status=Event.STATUS_CLOSED)
+        factories.EventFactory(city=moscow)
+        factories.EventFactory(city=kazan, format=Event.FORMAT_OFFLINE)
+        factories.EventFactory(format=Event.FORMAT_HYBRID, is_deleted=True)
+
+    def test_14_facets_count_all_values(self, anonymous_client, events):
+        response = anonymous_client.get(self.URL_FACETS)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "city": {"moscow": 2, "kazan": 1},
+            "event_type": {"conference": 4},
+            "specializations": {"backend": 4},
+            "format": {
+                Event.FORMAT_OFFLINE: 1,
+                Event.FORMAT_ONLINE: 2,
+                Event.FORMAT_HYBRID: 1,
+            },
+            "status": {
+                Event.STATUS_OPEN: 3,
+                Event.STATUS_OFFLINE_CLOSED: 0,
+                Event.STATUS_ONLINE_CLOSED: 0,
+                Event.STATUS_CLOSED: 1,
+            },
+        }, (
+            f"{self.URL_FACETS} должен возвращать число мероприятий "
+            "по каждому значению каждого фильтра."
+        )
+
+    def test_14_facet_ignores_own_filter(
+        self, anonymous_client, events, django_assert_max_num_queries
+    ):
+        # Состояние таблиц, три справочника и по запросу на фасет
+        with django_assert_max_num_queries(9):
+            response = anonymous_client.get(
+                self.URL_FACETS,
+                {"city": "moscow", "status": Event.STATUS_OPEN, "is_deleted": False},
+            )
+
+        facets = response.json()
+        assert facets["city"] == {
+            "moscow": 1,
+            "kazan": 1,
+        }, "Счетчики фасета должны учитывать все фильтры, кроме его собственного."
+        assert facets["status"][Event.STATUS_OPEN] == 1
+        assert facets["status"][Event.STATUS_CLOSED] == 1
+        assert facets["format"] == {
+            Event.FORMAT_OFFLINE: 0,
+            Event.FORMAT_ONLINE: 1,
+            Event.FORMAT_HYBRID: 0,
+        }
+
+    def test_14_facets_are_cached(
+        self, anonymous_client, events, django_assert_num_queries
+    ):
+        etag = anonymous_client.get(self.URL_FACETS).headers["ETag"]
+
+        with django_assert_num_queries(0):
+            response = anonymous_client.get(self.URL_FACETS, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        factories.EventFactory(city=City.objects.get(slug="kazan"))
+        response = anonymous_client.get(self.URL_FACETS)
+        assert (
+            response.json()["city"]["kazan"] == 2
+        ), "Изменение мероприятий должно сбрасывать кэш счетчиков."
+
+    def test_14_invalid_filter(self, anonymous_client, events):
+        response = anonymous_client.get(self.URL_FACETS, {"start_date": "вчера"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,164 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from api.cache import EVENTS_VERSION_KEY, get_version
+from events.models import EventPart, Speaker
+from events.serializers import EventCreateSerializer
+
+
+@pytest.mark.django_db
+class Test15EventPartsUpsert:
+    URL_EVENTS = "/api/v1/events/"
+
+    @pytest.fixture
+    def event(self):
+        event = factories.EventFactory(event_parts=None)
+        for number in range(3):
+            factories.EventPartFactory(event=event, name=f"Доклад {number}")
+        return event
+
+    @staticmethod
+    def part_data(part=None, **kwargs):
+        start_time = (timezone.now() + timezone.timedelta(days=8)).isoformat()
+        data = {
+            "event_part_name": "Новый доклад",
+            "event_part_description": "О докладе",
+            "event_part_created": start_time,
+            "event_part_start_time": start_time,
+            "speaker": None,
+        }
+        if part is not None:
+            data.update(
+                id=part.id,
+                event_part_name=part.name,
+                event_part_description=part.description,
+                event_part_created=part.created.isoformat(),
+                event_part_start_time=part.start_time.isoformat(),
+                speaker={"speaker_name": part.speaker.name},
+            )
+        return {**data, **kwargs}
+
+    def patch_parts(self, client, event, parts):
+        return client.patch(
+            f"{self.URL_EVENTS}{event.id}/", {"event_parts": parts}, format="json"
+        )
+
+    def test_15_parts_matched_by_id(self, admin_client, event):
+        kept, changed, removed = event.parts.order_by("pk")
+        speaker = factories.SpeakerFactory()
+
+        response = self.patch_parts(
+            admin_client,
+            event,
+            [
+                self.part_data(kept),
+                self.part_data(
+                    changed,
+                    event_part_name="Измененный доклад",
+                    speaker={"speaker_name": speaker.name, "position": "CTO"},
+                ),
+                self.part_data(
+                    speaker={
+                        "speaker_name": "Новый спикер",
+                        "company": "Компания",
+                        "position": "Должность",
+                    }
+                ),
+            ],
+        )
+
+        assert response.status_code == HTTPStatus.OK, response.json()
+        parts = list(event.parts.order_by("pk"))
+        assert [part.id for part in parts[:2]] == [
+            kept.id,
+            changed.id,
+        ], "Части мероприятия с id должны обновляться, а не пересоздаваться."
+        assert not EventPart.objects.filter(pk=removed.pk).exists()
+        assert parts[0].updated == kept.updated
+        assert parts[1].name == "Измененный доклад"
+        assert parts[1].speaker == speaker
+        assert Speaker.objects.get(pk=speaker.pk).position == "CTO"
+        assert parts[2].speaker.name == "Новый спикер"
+        assert [part["id"] for part in response.json()["event_parts"]] == [
+            part.id for part in parts
+        ]
+
+    def test_15_removed_parts_invalidate_cache(
+        self, admin_client, anonymous_client, event
+    ):
+        kept, *removed = event.parts.order_by("pk")
+        url = f"{self.URL_EVENTS}{event.id}/"
+        anonymous_client.get(url)
+
+        response = self.patch_parts(admin_client, event, [self.part_data(kept)])
+
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert not EventPart.objects.filter(pk__in=[part.pk for part in removed])
+        assert [
+            part["id"] for part in anonymous_client.get(url).json()["event_parts"]
+        ] == [kept.id], "Удаленные части мероприятия не должны отдаваться из кэша."
+
+    def test_15_parts_deletion_bumps_cache_version(self, event):
+        version = get_version(EVENTS_VERSION_KEY)
+
+        EventCreateSerializer()._update_event_parts(event, [])
+
+        assert not event.parts.exists()
+        assert get_version(EVENTS_VERSION_KEY) != version, (
+            "Удаление частей мероприятия должно сбрасывать кэш мероприятий "
+            "независимо от сохранения самого мероприятия."
+        )
+
+    def test_15_unknown_part_id(self, admin_client, event):
+        other_part = factories.EventPartFactory()
+
+        response = self.patch_parts(
+            admin_client, event, [self.part_data(id=other_part.id)]
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert event.parts.count() == 3
+        assert other_part.event.parts.exists()
+
+    def test_15_constant_number_of_queries(self, admin_client):
+        def count_queries(new_parts_count):
+            event = factories.EventFactory(event_parts=None)
+            for _ in range(3):
+                factories.EventPartFactory(event=event)
+            kept, changed, _ = event.parts.order_by("pk")
+            data = [
+                self.part_data(kept),
+                self.part_data(
+                    changed,
+                    event_part_name="Измененный доклад",
+                    speaker={"speaker_name": changed.speaker.name, "position": "CTO"},
+                ),
+                *(
+                    self.part_data(
+                        speaker={
+                            "speaker_name": f"Спикер {new_parts_count} {number}",
+                            "company": "Компания",
+                            "position": "Должность",
+                        }
+                    )
+                    for number in range(new_parts_count)
+                ),
+            ]
+            with CaptureQueriesContext(connection) as context:
+                response = self.patch_parts(admin_client, event, data)
+            assert response.status_code == HTTPStatus.OK, response.json()
+            assert event.parts.count() == new_parts_count + 2
+            return len(context.captured_queries)
+
+        count_queries(1)
+
+        assert count_queries(5) == count_queries(60), (
+            "Число запросов при изменении программы мероприятия не должно "
+            "зависеть от числа ее частей."
+        )
@@ -0,0 +1,99 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from events.models import Event, Speaker
+
+
+@pytest.mark.django_db
+class Test16EventCreate:
+    URL_EVENTS = "/api/v1/events/"
+
+    @staticmethod
+    def event_data(name, speakers):
+        start_time = (timezone.now() + timezone.timedelta(days=3)).isoformat()
+        return {
+            "name": name,
+            "description": "Описание",
+            "event_type": factories.EventTypeFactory().id,
+            "specializations": factories.SpecializationFactory().id,
+            "format": Event.FORMAT_ONLINE,
+            "start_time": start_time,
+            "event_parts": [
+                {
+                    "event_part_name": f"Доклад {number}",
+                    "event_part_description": "О докладе",
+                    "event_part_created": start_time,
+                    "event_part_start_time": start_time,
+                    "speaker": speaker,
+                }
+                for number, speaker in enumerate(speakers)
+            ],
+        }
+
+    @staticmethod
+    def speaker_data(name, position="Должность"):
+        return {"speaker_name": name, "company": "Компания", "position": position}
+
+    def test_16_existing_speaker_not_duplicated(self, admin_client):
+        speaker = factories.SpeakerFactory()
+
+        response = admin_client.post(
+            self.URL_EVENTS,
+            self.event_data(
+                "Митап",
+                [
+                    self.speaker_data(speaker.name, position="Новая должность"),
+                    self.speaker_data("Новый спикер"),
+                    self.speaker_data(speaker.name, position="Новая должность"),
+                    None,
+                ],
+            ),
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        event = Event.objects.get(pk=response.json()["id"])
+        parts = list(event.parts.order_by("name"))
+        assert [part.speaker_id for part in parts] == [
+            speaker.id,
+            Speaker.objects.get(name="Новый спикер").id,
+            speaker.id,
+            None,
+        ], "Существующий спикер должен находиться по имени, а не дублироваться."
+        assert Speaker.objects.get(pk=speaker.pk).position == "Новая должность"
+        assert "Новый спикер" in event.search_document
+        assert len(response.json()["event_parts"]) == 4
+
+    def test_16_constant_number_of_queries(self, admin_client):
+        speaker = factories.SpeakerFactory()
+
+        def count_queries(parts_count):
+            data = self.event_data(
+                f"Мероприятие на {parts_count} частей",
+                [
+                    self.speaker_data(
+                        speaker.name, position=f"Должность {parts_count}"
+                    ),
+                    *(
+                        self.speaker_data(f"Спикер {parts_count} {number}")
+                        for number in range(parts_count - 1)
+                    ),
+                ],
+            )
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.post(self.URL_EVENTS, data, format="json")
+            assert response.status_code == HTTPStatus.CREATED, response.json()
+            return len(context.captured_queries)
+
+        count_queries(2)
+
+        assert count_queries(3) == count_queries(60), (
+            "Число запросов при создании мероприятия не должно зависеть "
+            "от числа частей его программы."
+        )
@@ -0,0 +1,165 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from api.cache import EVENTS_VERSION_KEY, get_version
+from events.models import Event, EventPart, Speaker
+
+
+@pytest.mark.django_db
+class Test17BulkImport:
+    URL_BULK = "/api/v1/events/bulk/"
+
+    @staticmethod
+    def event_data(name, parts_count=2):
+        start_time = (timezone.now() + timezone.timedelta(days=3)).isoformat()
+        return {
+            "name": name,
+            "description": "Описание",
+            "event_type": factories.EventTypeFactory().id,
+            "specializations": factories.SpecializationFactory().id,
+            "format": Event.FORMAT_ONLINE,
+            "start_time": start_time,
+            "event_parts": [
+                {
+                    "event_part_name": f"Доклад {number}",
+                    "event_part_description": "О докладе",
+                    "event_part_created": start_time,
+                    "event_part_start_time": start_time,
+                    "speaker": {
+                        "speaker_name": f"Спикер {number}",
+                        "company": "Компания",
+                        "position": "Должность",
+                    },
+                }
+                for number in range(parts_count)
+            ],
+        }
+
+    def post(self, client, items, **params):
+        url = self.URL_BULK
+        if params:
+            url += "?" + "&".join(f"{key}={value}" for key, value in params.items())
+        return client.post(url, items, format="json")
+
+    def test_17_bulk_creates_events(self, admin_client):
+        response = self.post(
+            admin_client, [self.event_data("Первое"), self.event_data("Второе")]
+        )
+
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        results = response.json()
+        assert [result["errors"] for result in results] == [None, None]
+        events = Event.objects.filter(pk__in=[result["id"] for result in results])
+        assert sorted(events.values_list("name", flat=True)) == ["Второе", "Первое"]
+        assert EventPart.objects.filter(event__in=events).count() == 4
+        assert (
+            Speaker.objects.count() == 2
+        ), "Спикеры с одинаковыми именами должны создаваться один раз."
+        assert "Спикер 1" in events.get(name="Первое").search_document
+
+    @pytest.mark.parametrize(
+        "atomic, status, created",
+        [("true", HTTPStatus.BAD_REQUEST, 0), ("false", HTTPStatus.MULTI_STATUS, 1)],
+    )
+    def test_17_invalid_items(self, admin_client, atomic, status, created):
+        factories.EventFactory(name="Существующее")
+        items = [
+            self.event_data("Новое"),
+            self.event_data("Существующее"),
+            self.event_data("Повтор"),
+            self.event_data("Повтор"),
+            {**self.event_data("Без даты"), "start_time": None},
+        ]
+
+        response = self.post(admin_client, items, atomic=atomic)
+
+        assert response.status_code == status, response.json()
+        results = response.json()
+        assert [result["index"] for result in results] == list(range(len(items)))
+        assert [result["errors"] is None for result in results] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+        ], "Ответ должен содержать ошибки каждого мероприятия пакета."
+        for index, attr in ((1, "name"), (3, "name"), (4, "start_time")):
+            errors = results[index]["errors"]
+            assert errors["type"] == "validation_error", (
+                "Ошибки мероприятия пакета должны быть в формате ошибок "
+                "остальных эндпойнтов API."
+            )
+            assert attr in [error["attr"] for error in errors["errors"]]
+            assert all(
+                set(error) == {"code", "detail", "attr"} for error in errors["errors"]
+            )
+        assert Event.objects.filter(name="Новое").count() == created
+        assert (results[0]["id"] is not None) == bool(created)
+
+    def test_17_parts_before_event_are_rejected(self, admin_client):
+        item = self.event_data("Доклад до начала")
+        item["event_parts"][1]["event_part_start_time"] = (
+            timezone.now() + timezone.timedelta(days=1)
+        ).isoformat()
+
+        response = self.post(
+            admin_client, [self.event_data("Верное"), item], atomic="false"
+        )
+
+        assert response.status_code == HTTPStatus.MULTI_STATUS, response.json()
+        valid, invalid = response.json()
+        assert valid["errors"] is None
+        assert [error["attr"] for error in invalid["errors"]["errors"]] == [
+            "event_parts"
+        ], "Части, начинающиеся до мероприятия, должны отклоняться для этого пункта."
+        assert not Event.objects.filter(name="Доклад до начала").exists()
+
+    def test_17_cache_is_invalidated_after_commit(
+        self, admin_client, django_capture_on_commit_callbacks
+    ):
+        items = [self.event_data("Первое")]
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            with transaction.atomic():
+                response = self.post(admin_client, items)
+                version = get_version(EVENTS_VERSION_KEY)
+
+        assert response.status_code == HTTPStatus.CREATED, response.json()
+        for callback in callbacks:
+            callback()
+        assert get_version(EVENTS_VERSION_KEY) != version, (
+            "Версия кэша мероприятий должна повышаться и после коммита "
+            "загрузки пакета."
+        )
+
+    @pytest.mark.parametrize("items", [{}, []], ids=["not_list", "empty"])
+    def test_17_wrong_payload(self, admin_client, items):
+        assert self.post(admin_client, items).status_code == HTTPStatus.BAD_REQUEST
+
+    def test_17_staff_only(self, user_client):
+        response = self.post(user_client, [self.event_data("Мероприятие")])
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_17_constant_number_of_queries(self, admin_client):
+        def count_queries(events_count):
+            items = [
+                self.event_data(f"Пакет {events_count} {number}", parts_count=3)
+                for number in range(events_count)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                response = self.post(admin_client, items)
+            assert response.status_code == HTTPStatus.CREATED, response.json()
+            return len(context.captured_queries)
+
+        count_queries(1)
+
+        assert count_queries(2) == count_queries(
+            30
+        ), "Число запросов при загрузке пакета не должно зависеть от его размера."
@@ -0,0 +1,47 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from events.models import City, Event, EventPart, Speaker
+
+
+@pytest.mark.django_db
+class Test18LoadCsv:
+    def test_18_load_and_upsert(self):
+        moscow = City.objects.create(name="Старое название", slug="moscow", id=50)
+
+        call_command("load_csv")
+        call_command("load_csv")
+
+        assert City.objects.count() == 3
+        assert Event.objects.count() == 32
+        assert Speaker.objects.count() == 25
+        assert (
+            EventPart.objects.count() == 160
+        ), "Повторная загрузка в режиме upsert не должна дублировать строки."
+        moscow.refresh_from_db()
+        assert moscow.name == "Москва"
+        assert Event.objects.filter(
+            city=moscow
+        ).exists(), "Ссылки на справочники должны сопоставляться по слагу."
+        event = Event.objects.get(pk=1)
+        assert event.city is None
+        assert "Сергей Петров" in event.search_document
+
+    def test_18_replace_mode(self):
+        call_command("load_csv")
+        Event.objects.filter(pk=1).update(name="Измененное название")
+
+        call_command("load_csv", mode="replace")
+
+        assert Event.objects.get(pk=1).name == "TensorFlow для начинающих"
+        assert EventPart.objects.count() == 160
+
+    def test_18_queries_do_not_depend_on_rows(self):
+        with CaptureQueriesContext(connection) as context:
+            call_command("load_csv", batch_size=10_000)
+
+        assert (
+            len(context.captured_queries) < 60
+        ), "Загрузка не должна выполнять запросы для каждой строки."
@@ -0,0 +1,77 @@
+import pytest
+from django.core.management import call_command
+from django.db.models import Count
+
+from applications.models import Application, NotificationSettings
+from events.models import Event, EventPart, Speaker
+from users.models import User
+
+
+def get_snapshot() -> dict[str, list]:
+    return {
+        "events": list(
+            Event.objects.order_by("pk").values_list("pk", "name", "format", "city")
+        ),
+        "parts": list(
+            EventPart.objects.order_by("pk").values_list("event", "name", "speaker")
+        ),
+        "users": list(
+            User.objects.order_by("pk").values_list("pk", "first_name", "city")
+        ),
+        "applications": list(
+            Application.objects.order_by("pk").values_list(
+                "event", "user", "email", "format", "status"
+            )
+        ),
+    }
+
+
+@pytest.mark.django_db
+class Test19GenerateLoadData:
+    def test_19_generates_consistent_graph(self):
+        call_command(
+            "generate_load_data",
+            events=6,
+            users=5,
+            applications_per_event=4,
+            parts_per_event=2,
+        )
+
+        assert Event.objects.count() == 6
+        assert EventPart.objects.count() == 12
+        assert User.objects.count() == 5
+        assert Application.objects.count() == 24
+        assert Speaker.objects.exists()
+        for application in Application.objects.select_related("event", "user"):
+            assert application.event.format in (
+                Event.FORMAT_HYBRID,
+                application.format,
+            ), "Формат заявки должен соответствовать формату мероприятия."
+            if application.user:
+                assert application.email == application.user.email
+            else:
+                assert application.notification_settings is not None
+        assert NotificationSettings.objects.filter(user__isnull=False).count() == 5
+        assert not (
+            Application.objects.filter(user__isnull=False)
+            .values("event", "user")
+            .annotate(count=Count("pk"))
+            .filter(count__gt=1)
+            .exists()
+        ), "Пользователь не должен подавать две заявки на одно мероприятие."
+        user = User.objects.first()
+        assert user.specializations.exists()
+        assert user.check_password("load-data-password")
+        assert Event.objects.exclude(search_document="").count() == 6
+
+    def test_19_is_deterministic_for_seed(self):
+        options = {"events": 4, "users": 3, "applications_per_event": 3, "seed": 7}
+        call_command("generate_load_data", **options)
+        snapshot = get_snapshot()
+        Event.objects.all().delete()
+        User.objects.all().delete()
+        Speaker.objects.all().delete()
+
+        call_command("generate_load_data", **options)
+
+        assert get_snapshot() == snapshot, "Данные должны зависеть только от seed."
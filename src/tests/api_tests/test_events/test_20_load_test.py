@@ -0,0 +1,121 @@
+import json
+import uuid
+
+import pytest
+from django.core.management import call_command
+
+from api.services.load_testing import get_application
+from applications.models import Application
+from config import celery_app
+from events.models import Event
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20LoadTest:
+    def test_20_reports_all_scenarios(self, tmp_path):
+        call_command(
+            "generate_load_data",
+            events=5,
+            users=3,
+            applications_per_event=1,
+            parts_per_event=1,
+        )
+        Event.objects.update(status=Event.STATUS_OPEN)
+        applications: int = Application.objects.count()
+        output = tmp_path / "report.json"
+
+        # Общая in-memory база SQLite блокирует таблицу при одновременной записи,
+        # поэтому заявки отправляет один обработчик
+        call_command(
+            "load_test",
+            iterations=6,
+            concurrency=1,
+            mix="anonymous_browse=1,authenticated_browse=1,registration_stampede=1",
+            allow_writes=True,
+            output=str(output),
+        )
+
+        report: dict = json.loads(output.read_text(encoding="utf-8"))
+        assert report["base_url"] == "in-process"
+        assert report["total"]["requests"] > 0
+        assert report["total"]["error_rate"] == 0, report["total"]["statuses"]
+        assert set(report["total"]["latency_ms"]) >= {"p50", "p95", "p99"}
+        assert set(report["scenarios"]) <= {
+            "anonymous_browse",
+            "authenticated_browse",
+            "registration_stampede",
+        }
+        registrations: int = (
+            report["steps"]
+            .get("registration_stampede.application", {})
+            .get("requests", 0)
+        )
+        assert (
+            Application.objects.count() == applications + registrations
+        ), "Каждая заявка сценария регистрации должна быть создана."
+        assert (
+            not celery_app.conf.task_always_eager
+        ), "Настройка Celery должна быть восстановлена после теста."
+
+    def test_20_excludes_scenarios_without_data(self, caplog):
+        call_command("generate_load_data", events=2, users=0, applications_per_event=0)
+        Event.objects.update(status=Event.STATUS_CLOSED)
+
+        call_command("load_test", iterations=1, concurrency=1)
+
+        assert "registration_stampede scenario is excluded" in caplog.text
+        assert "authenticated_browse scenario is excluded" in caplog.text
+
+    def test_20_writes_need_explicit_permission(self, caplog):
+        call_command("generate_load_data", events=2, users=0, applications_per_event=0)
+        Event.objects.update(status=Event.STATUS_OPEN)
+
+        call_command(
+            "load_test",
+            iterations=2,
+            concurrency=1,
+            mix="anonymous_browse=1,registration_stampede=1",
+        )
+
+        assert "registration_stampede scenario is excluded" in caplog.text
+        assert (
+            not Application.objects.exists()
+        ), "Без --allow-writes нагрузочный тест не должен создавать заявки."
+
+    def test_20_application_contacts_are_unique(self):
+        run = uuid.uuid4().hex
+        plans = [
+            {"run": run, "hot_event": 1, "workers": 300, "worker": worker}
+            for worker in (0, 100, 200, 299)
+        ]
+
+        applications = [
+            get_application(plan, counter)
+            for plan in plans
+            for counter in (1, 2, 100_001, 200_001)
+        ]
+
+        for field in ("email", "phone"):
+            values = [application[field] for application in applications]
+            assert len(set(values)) == len(values), (
+                f"Поле {field} заявок нагрузочного теста должно быть уникальным "
+                "при большом числе обработчиков и запросов."
+            )
+        assert all(len(application["phone"]) == 11 for application in applications)
+
+    def test_20_runs_concurrent_workers(self, tmp_path):
+        call_command("generate_load_data", events=3, users=0, applications_per_event=0)
+        output = tmp_path / "report.json"
+
+        call_command(
+            "load_test",
+            iterations=2,
+            concurrency=3,
+            mix="anonymous_browse=1",
+            output=str(output),
+        )
+
+        report: dict = json.loads(output.read_text(encoding="utf-8"))
+        assert report["concurrency"] == 3
+        assert report["total"]["requests"] == 3 * 2 * 3
+        assert report["total"]["error_rate"] == 0, report["total"]["statuses"]
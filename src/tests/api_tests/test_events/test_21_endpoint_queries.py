@@ -0,0 +1,504 @@
+import json
+import os
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pytest
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.api_tests import factories
+
+from api.urls import router
+from applications.models import NotificationSettings
+from config import celery_app
+from events.models import City, Event, EventType
+from events.utils import RECOMMENDED_EVENTS_MAX_LIMIT
+from users.models import Specialization, User
+
+URL_API = "/api/v1/"
+SIZES: tuple[int] = (1, 10, 100)
+# Время ответа на наибольшем размере - лучшее из нескольких повторов
+REPEATS: int = 3
+BASELINE_PATH: Path = Path(__file__).with_name("endpoint_baseline.json")
+UPDATE_BASELINE: bool = os.getenv("UPDATE_ENDPOINT_BASELINE", default="no") == "yes"
+# Время ответа зависит от машины, поэтому сверяется с базовой линией только
+# вместе с бенчмарками; число запросов проверяется всегда
+CHECK_TIMES: bool = os.getenv("RUN_BENCHMARKS", default="no") == "yes"
+# Допустимое превышение времени ответа из базовой линии, в разах
+TIME_TOLERANCE: float = float(os.getenv("ENDPOINT_TIME_TOLERANCE", default="3"))
+# Меньшие времена ответа не сравниваются: в них больше шума, чем работы
+TIME_FLOOR_MS: float = 25.0
+
+Prepare = Callable[[int, User | None], tuple[str, Any]]
+
+
+class Endpoint(NamedTuple):
+    """Request to an endpoint of the router with the data of the given size."""
+
+    action: str
+    client: str
+    method: str
+    prepare: Prepare
+    status: int = HTTPStatus.OK
+    sizes: tuple[int] = SIZES
+
+
+def create_references(model: type[Model], size: int) -> list[int]:
+    prefix: str = model._meta.model_name
+    return [
+        instance.pk
+        for instance in model.objects.bulk_create(
+            model(name=f"{prefix} {number}", slug=f"{prefix}-{number}")
+            for number in range(size)
+        )
+    ]
+
+
+def create_events(size: int, **kwargs) -> list[Event]:
+    """Creates the events with a part and an application each."""
+    events: list[Event] = factories.EventFactory.create_batch(size, **kwargs)
+    for event in events:
+        factories.ApplicationFactory(event=event)
+    return events
+
+
+def create_event(size: int) -> Event:
+    """Creates an event with the given number of parts and applications."""
+    event: Event = factories.EventFactory(event_parts=None)
+    factories.EventPartFactory.create_batch(size, event=event)
+    factories.ApplicationFactory.create_batch(size, event=event)
+    return event
+
+
+def event_parts_data(name: str, size: int, start_time: str) -> list[dict]:
+    return [
+        {
+            "event_part_name": f"Доклад {number}",
+            "event_part_description": "О докладе",
+            "event_part_created": start_time,
+            "event_part_start_time": start_time,
+            "speaker": {
+                "speaker_name": f"Спикер {name} {number}",
+                "company": "Компания",
+                "position": "Должность",
+            },
+        }
+        for number in range(size)
+    ]
+
+
+def event_data(name: str, parts: int) -> dict:
+    start_time = (timezone.now() + timezone.timedelta(days=3)).isoformat()
+    return {
+        "name": name,
+        "description": "Описание",
+        "event_type": factories.EventTypeFactory().id,
+        "specializations": factories.SpecializationFactory().id,
+        "format": Event.FORMAT_ONLINE,
+        "start_time": start_time,
+        "event_parts": event_parts_data(name, parts, start_time),
+    }
+
+
+def application_data(event: Event, number: int) -> dict:
+    return {
+        "event": event.id,
+        "format": Event.FORMAT_ONLINE,
+        "first_name": "Иван",
+        "last_name": "Иванов",
+        "email": f"applicant{number}@example.com",
+        "phone": f"8{number:010d}",
+        "activity": User.ACTIVITY_STUDY,
+    }
+
+
+def prepare_user_create(size: int, user: User | None) -> tuple[str, Any]:
+    User.objects.bulk_create(
+        User(
+            email=f"user{number}@example.com",
+            phone=f"8{number:010d}",
+            first_name="Иван",
+            last_name="Иванов",
+        )
+        for number in range(size)
+    )
+    return "users/", {
+        "email": "new-user@example.com",
+        "phone": "89990000000",
+        "first_name": "Пётр",
+        "last_name": "Петров",
+        "password": "Nagruzka-2024",
+    }
+
+
+def prepare_user_me(size: int, user: User | None) -> tuple[str, Any]:
+    user.specializations.set(create_references(Specialization, size))
+    NotificationSettings.objects.create(user=user)
+    return "users/me/", None
+
+
+def prepare_user_patch_me(size: int, user: User | None) -> tuple[str, Any]:
+    NotificationSettings.objects.create(user=user)
+    return "users/me/", {
+        "company": "Компания",
+        "specializations": create_references(Specialization, size),
+    }
+
+
+def prepare_event_list(size: int, user: User | None) -> tuple[str, Any]:
+    create_events(size)
+    return f"events/?limit={size}", None
+
+
+def prepare_registrated_event_list(size: int, user: User | None) -> tuple[str, Any]:
+    for event in create_events(size):
+        factories.ApplicationFactory(event=event, user=user)
+    return f"events/?limit={size}&is_registrated=1", None
+
+
+def prepare_event_create(size: int, user: User | None) -> tuple[str, Any]:
+    return "events/", event_data(f"Новое мероприятие {size}", size)
+
+
+def prepare_event_bulk(size: int, user: User | None) -> tuple[str, Any]:
+    return "events/bulk/", [
+        event_data(f"Новое мероприятие {number}", 1) for number in range(size)
+    ]
+
+
+def prepare_event_export(size: int, user: User | None) -> tuple[str, Any]:
+    create_events(size)
+    return "events/export/", None
+
+
+def prepare_event_facets(size: int, user: User | None) -> tuple[str, Any]:
+    create_events(size, city=factories.CityFactory())
+    return "events/facets/", None
+
+
+def prepare_recommended_events(size: int, user: User | None) -> tuple[str, Any]:
+    user.specializations.set([factories.SpecializationFactory()])
+    create_events(size)
+    limit: int = min(size, RECOMMENDED_EVENTS_MAX_LIMIT)
+    return f"events/three-recommended-events/?limit={limit}", None
+
+
+def prepare_event_retrieve(size: int, user: User | None) -> tuple[str, Any]:
+    return f"events/{create_event(size).id}/", None
+
+
+def prepare_event_partial_update(size: int, user: User | None) -> tuple[str, Any]:
+    event: Event = create_event(1)
+    return f"events/{event.id}/", {
+        "event_parts": event_parts_data(
+            f"изменение {size}", size, event.start_time.isoformat()
+        )
+    }
+
+
+def prepare_event_activate(size: int, user: User | None) -> tuple[str, Any]:
+    event: Event = create_event(size)
+    Event.objects.filter(pk=event.pk).update(is_deleted=True)
+    return f"events/{event.id}/activate/", None
+
+
+def prepare_event_deactivate(size: int, user: User | None) -> tuple[str, Any]:
+    return f"events/{create_event(size).id}/deactivate/", None
+
+
+def prepare_reference_list(model: type[Model], path: str) -> Prepare:
+    def prepare(size: int, user: User | None) -> tuple[str, Any]:
+        create_references(model, size)
+        return path, None
+
+    return prepare
+
+
+def prepare_bootstrap(size: int, user: User | None) -> tuple[str, Any]:
+    for model in (City, EventType, Specialization):
+        create_references(model, size)
+    return "bootstrap/", None
+
+
+def prepare_application_create(size: int, user: User | None) -> tuple[str, Any]:
+    event: Event = create_event(size)
+    return "applications/", application_data(event, size + 1)
+
+
+def prepare_authorized_application_create(
+    size: int, user: User | None
+) -> tuple[str, Any]:
+    event: Event = create_event(size)
+    NotificationSettings.objects.create(user=user)
+    return "applications/", {
+        **application_data(event, size + 1),
+        "email": user.email,
+        "phone": user.phone,
+        "specializations": create_references(Specialization, size),
+    }
+
+
+def prepare_application_destroy(size: int, user: User | None) -> tuple[str, Any]:
+    application = factories.ApplicationFactory(event=create_event(size), user=user)
+    return f"applications/{application.id}/", None
+
+
+def prepare_notification_settings(size: int, user: User | None) -> tuple[str, Any]:
+    event: Event = create_event(size)
+    settings = NotificationSettings.objects.create(
+        application=event.applications.first()
+    )
+    return f"notification-settings/{settings.id}/", {
+        "sms_notifications": NotificationSettings.NOTIFY_DAY_BEFORE
+    }
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    "users-create": Endpoint(
+        "users.create",
+        "anonymous_client",
+        "post",
+        prepare_user_create,
+        HTTPStatus.CREATED,
+    ),
+    "users-me": Endpoint("users.me", "user_client", "get", prepare_user_me),
+    "users-patch-me": Endpoint(
+        "users.patch_me", "user_client", "patch", prepare_user_patch_me
+    ),
+    "events-list": Endpoint(
+        "events.list", "anonymous_client", "get", prepare_event_list
+    ),
+    "events-list-registrated": Endpoint(
+        "events.list", "user_client", "get", prepare_registrated_event_list
+    ),
+    "events-create": Endpoint(
+        "events.create",
+        "admin_client",
+        "post",
+        prepare_event_create,
+        HTTPStatus.CREATED,
+    ),
+    # SQLite делит INSERT большего числа мероприятий на несколько запросов по
+    # лимиту параметров: их число растёт с числом пачек, а не строк
+    "events-bulk": Endpoint(
+        "events.bulk",
+        "admin_client",
+        "post",
+        prepare_event_bulk,
+        HTTPStatus.CREATED,
+        sizes=(1, 10, 30),
+    ),
+    "events-export": Endpoint(
+        "events.export", "admin_client", "get", prepare_event_export
+    ),
+    "events-facets": Endpoint(
+        "events.facets", "anonymous_client", "get", prepare_event_facets
+    ),
+    "events-recommended": Endpoint(
+        "events.three_recommended_events",
+        "user_client",
+        "get",
+        prepare_recommended_events,
+    ),
+    "events-retrieve": Endpoint(
+        "events.retrieve", "anonymous_client", "get", prepare_event_retrieve
+    ),
+    "events-partial-update": Endpoint(
+        "events.partial_update", "admin_client", "patch", prepare_event_partial_update
+    ),
+    "events-activate": Endpoint(
+        "events.activate", "admin_client", "patch", prepare_event_activate
+    ),
+    "events-deactivate": Endpoint(
+        "events.deactivate", "admin_client", "patch", prepare_event_deactivate
+    ),
+    "cities-list": Endpoint(
+        "city.list",
+        "anonymous_client",
+        "get",
+        prepare_reference_list(City, "cities/"),
+    ),
+    "event-types-list": Endpoint(
+        "eventtype.list",
+        "anonymous_client",
+        "get",
+        prepare_reference_list(EventType, "event_types/"),
+    ),
+    "specializations-list": Endpoint(
+        "specialization.list",
+        "anonymous_client",
+        "get",
+        prepare_reference_list(Specialization, "specializations/"),
+    ),
+    "bootstrap-list": Endpoint(
+        "bootstrap.list", "anonymous_client", "get", prepare_bootstrap
+    ),
+    "applications-create": Endpoint(
+        "application.create",
+        "anonymous_client",
+        "post",
+        prepare_application_create,
+        HTTPStatus.CREATED,
+    ),
+    "applications-create-authorized": Endpoint(
+        "application.create",
+        "user_client",
+        "post",
+        prepare_authorized_application_create,
+        HTTPStatus.CREATED,
+    ),
+    "applications-destroy": Endpoint(
+        "application.destroy", "user_client", "delete", prepare_application_destroy
+    ),
+    "notification-settings-retrieve": Endpoint(
+        "notificationsettings.retrieve",
+        "anonymous_client",
+        "get",
+        prepare_notification_settings,
+    ),
+    "notification-settings-partial-update": Endpoint(
+        "notificationsettings.partial_update",
+        "anonymous_client",
+        "patch",
+        prepare_notification_settings,
+    ),
+}
+# Пользователь, от имени которого отправляет запросы клиент
+CLIENT_USERS: dict[str, str] = {"user_client": "user", "admin_client": "admin_user"}
+measured: dict[str, dict[str, float]] = {}
+
+
+def get_router_actions() -> set[str]:
+    """Returns the basename.action of every endpoint routed by the API router."""
+    actions: set[str] = set()
+    for _, viewset, basename in router.registry:
+        for route in router.get_routes(viewset):
+            method_map = router.get_method_map(viewset, route.mapping)
+            for method, action in method_map.items():
+                if method in viewset.http_method_names:
+                    actions.add(f"{basename}.{action}")
+    return actions
+
+
+def load_baseline() -> dict[str, dict[str, float]]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+
+def send(client, endpoint: Endpoint, path: str, data: Any) -> tuple[int, float]:
+    """
+    Returns the number of queries and the wall time of the request. The changes
+    made by the request are rolled back and the cache is cleared before it,
+    so the request is cold and can be repeated on the same data.
+    """
+    with transaction.atomic():
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            if endpoint.method == "get":
+                response = client.get(URL_API + path)
+            else:
+                response = getattr(client, endpoint.method)(
+                    URL_API + path, data, format="json"
+                )
+            if response.streaming:
+                b"".join(response.streaming_content)
+            elapsed = time.perf_counter() - started
+        assert (
+            response.status_code == endpoint.status
+        ), f"{endpoint.method.upper()} {path}: {getattr(response, 'data', None)}"
+        transaction.set_rollback(True)
+    return len(context.captured_queries), elapsed
+
+
+def measure(
+    client, endpoint: Endpoint, size: int, user: User | None, repeats: int = 1
+) -> tuple[int, float]:
+    """
+    Returns the number of queries and the best wall time of the requests to
+    the endpoint with the data of the size, the data are rolled back after.
+    """
+    with transaction.atomic():
+        path, data = endpoint.prepare(size, user)
+        results = [send(client, endpoint, path, data) for _ in range(repeats)]
+        transaction.set_rollback(True)
+    return results[0][0], min(elapsed for _, elapsed in results)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_baseline():
+    """Writes the measured values to the baseline with UPDATE_ENDPOINT_BASELINE=yes."""
+    yield
+    if UPDATE_BASELINE and measured:
+        baseline = {**load_baseline(), **measured}
+        BASELINE_PATH.write_text(
+            json.dumps(dict(sorted(baseline.items())), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.mark.django_db
+class Test21EndpointQueries:
+    @pytest.fixture(autouse=True)
+    def eager_tasks(self, monkeypatch):
+        monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+
+    def test_21_every_endpoint_is_measured(self):
+        missing = get_router_actions() - {
+            endpoint.action for endpoint in ENDPOINTS.values()
+        }
+
+        assert not missing, (
+            "Для каждого эндпойнта роутера должен быть замер числа запросов, "
+            f"нет замеров для: {', '.join(sorted(missing))}."
+        )
+
+    @pytest.mark.parametrize("name", ENDPOINTS)
+    def test_21_queries_do_not_depend_on_size(self, request, name):
+        endpoint: Endpoint = ENDPOINTS[name]
+        client = request.getfixturevalue(endpoint.client)
+        user: User | None = (
+            request.getfixturevalue(CLIENT_USERS[endpoint.client])
+            if endpoint.client in CLIENT_USERS
+            else None
+        )
+
+        largest: int = endpoint.sizes[-1]
+        repeats: int = REPEATS if CHECK_TIMES or UPDATE_BASELINE else 1
+        queries: dict[int, int] = {}
+        for size in endpoint.sizes:
+            queries[size], elapsed = measure(
+                client, endpoint, size, user, repeats if size == largest else 1
+            )
+
+        assert len(set(queries.values())) == 1, (
+            f"Число запросов к БД эндпойнта {name} не должно зависеть от числа "
+            f"объектов (N+1): {queries}."
+        )
+        time_ms: float = round(elapsed * 1000, 1)
+        measured[name] = {"queries": queries[largest], "time_ms": time_ms}
+        if UPDATE_BASELINE:
+            return
+        baseline: dict[str, float] | None = load_baseline().get(name)
+        assert baseline is not None, (
+            f"Нет базовой линии эндпойнта {name}, запишите её с "
+            "UPDATE_ENDPOINT_BASELINE=yes."
+        )
+        assert queries[largest] <= baseline["queries"], (
+            f"Эндпойнт {name} выполняет {queries[largest]} запросов к БД "
+            f"вместо {baseline['queries']} по базовой линии."
+        )
+        if not CHECK_TIMES:
+            return
+        assert time_ms <= max(baseline["time_ms"], TIME_FLOOR_MS) * TIME_TOLERANCE, (
+            f"Эндпойнт {name} отвечает на {largest} объектах за {time_ms} мс, "
+            f"базовая линия {baseline['time_ms']} мс."
+        )
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+from rest_framework.test import APIClient
+
+BENCHMARKS_ENABLED: bool = os.getenv("RUN_BENCHMARKS", default="no") == "yes"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skips benchmarks unless they are enabled with RUN_BENCHMARKS=yes."""
+    if BENCHMARKS_ENABLED:
+        return
+    skip_benchmark = pytest.mark.skip(reason="Run with RUN_BENCHMARKS=yes")
+    for item in items:
+        if "tests/benchmarks" in item.nodeid:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True)
+def disable_silk(settings):
+    """Keeps django-silk from adding its own work to the measured requests."""
+    settings.MIDDLEWARE = [
+        middleware
+        for middleware in settings.MIDDLEWARE
+        if not middleware.startswith("silk.")
+    ]
+
+
+@pytest.fixture
+def anonymous_client():
+    return APIClient()
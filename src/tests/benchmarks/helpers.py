@@ -0,0 +1,61 @@
+import time
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.cache import EVENTS_VERSION_KEY, bump_version
+from events.models import Event, EventType
+from users.models import Specialization
+
+BATCH_SIZE: int = 5000
+
+
+def populate_events(total: int) -> list[int]:
+    """
+    Tops the events table up to the total number of rows. The bulk insert does
+    not send signals, so the events cache version is bumped explicitly, like
+    load_csv does: the cached responses and validators are per version.
+    """
+    event_type, _ = EventType.objects.get_or_create(
+        slug="benchmark", defaults={"name": "benchmark"}
+    )
+    specialization, _ = Specialization.objects.get_or_create(
+        slug="benchmark", defaults={"name": "benchmark"}
+    )
+    existing: int = Event.objects.count()
+    now = timezone.now()
+    Event.objects.bulk_create(
+        (
+            Event(
+                name=f"Benchmark event {number}",
+                description="Benchmark event",
+                is_deleted=False,
+                start_time=now + timedelta(hours=number),
+                event_type=event_type,
+                specializations=specialization,
+            )
+            for number in range(existing, total)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    bump_version(EVENTS_VERSION_KEY)
+    return list(Event.objects.order_by("pk").values_list("pk", flat=True)[existing:])
+
+
+def measure(client, url: str, params: dict | None = None) -> tuple[float, int]:
+    """Returns the wall time of a GET request and the number of queries it ran."""
+    with CaptureQueriesContext(connection) as context:
+        started = time.perf_counter()
+        response = client.get(url, params or {})
+        elapsed = time.perf_counter() - started
+    assert response.status_code == 200, response.content
+    return elapsed, len(context.captured_queries)
+
+
+def print_report(title: str, rows: list[tuple]) -> None:
+    """Prints benchmark results as a plain text table."""
+    print(f"\n{title}")
+    for row in rows:
+        print("  ".join(f"{value:>12}" for value in row))
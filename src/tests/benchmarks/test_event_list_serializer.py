@@ -0,0 +1,60 @@
+import time
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from tests.benchmarks.helpers import populate_events, print_report
+
+from events.models import Event
+from events.serializers import EventListFastSerializer, EventListSerializer
+
+SIZES: list[int] = [100, 1_000]
+REPEATS: int = 5
+
+
+def best_time(serialize) -> float:
+    """Returns the best wall time of several runs of the serialization."""
+    timings: list[float] = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        serialize()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.django_db
+def test_fast_list_serializer_is_faster():
+    request = Request(APIRequestFactory().get("/api/v1/events/"))
+    request.user = AnonymousUser()
+    context = {"request": request}
+
+    rows: list[tuple] = [("events", "drf, s", "fast, s", "speedup")]
+    for size in SIZES:
+        populate_events(size)
+        queryset = EventListSerializer.setup_eager_loading(
+            Event.objects.order_by("pk")[:size], user=request.user
+        )
+        # Данные загружаются заранее: измеряется только сериализация
+        events = list(queryset)
+        projection = list(EventListFastSerializer.project(queryset))
+
+        drf_time = best_time(
+            lambda: EventListSerializer(events, many=True, context=context).data
+        )
+        fast_time = best_time(
+            lambda: EventListFastSerializer(projection, many=True, context=context).data
+        )
+        rows.append(
+            (
+                size,
+                f"{drf_time:.4f}",
+                f"{fast_time:.4f}",
+                f"{drf_time / fast_time:.1f}x",
+            )
+        )
+        assert (
+            fast_time < drf_time
+        ), f"Быстрый сериализатор медленнее EventListSerializer на {size} строках."
+    print_report("Event list serialization", rows)
@@ -0,0 +1,49 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tests.api_tests import factories
+from tests.benchmarks.helpers import measure, populate_events, print_report
+
+from applications.models import Application
+
+SIZES: list[int] = [100, 1_000, 10_000, 100_000]
+REGISTRATION_STEP: int = 10
+FLATNESS_FACTOR: int = 5
+FLATNESS_SLACK: float = 0.25
+
+
+@pytest.mark.django_db
+def test_is_registrated_filter_stays_flat():
+    user = factories.UserFactory()
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+    measure(client, "/api/v1/events/")  # прогрев: url resolver, сериализаторы
+
+    rows: list[tuple] = [("events", "value", "seconds", "queries")]
+    timings: dict[int, dict[int, tuple[float, int]]] = {}
+    for size in SIZES:
+        new_event_ids = populate_events(size)
+        Application.objects.bulk_create(
+            Application(event_id=event_id, user=user)
+            for event_id in new_event_ids[::REGISTRATION_STEP]
+        )
+        timings[size] = {}
+        for value in (0, 1):
+            elapsed, queries = measure(
+                client, "/api/v1/events/", {"is_registrated": value}
+            )
+            timings[size][value] = elapsed, queries
+            rows.append((size, value, f"{elapsed:.4f}", queries))
+    print_report("GET /api/v1/events/?is_registrated=", rows)
+
+    smallest, largest = timings[SIZES[0]], timings[SIZES[-1]]
+    for value in (0, 1):
+        assert smallest[value][1] == largest[value][1], (
+            "Количество SQL-запросов при фильтрации по is_registrated "
+            "не должно зависеть от количества мероприятий."
+        )
+        assert (
+            largest[value][0] <= smallest[value][0] * FLATNESS_FACTOR + FLATNESS_SLACK
+        ), "Фильтрация по is_registrated должна выполняться в базе данных."
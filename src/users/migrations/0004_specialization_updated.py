@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_alter_user_activity"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="specialization",
+            name="updated",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="Обновлено"
+            ),
+        ),
+    ]
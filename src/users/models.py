@@ -20,6 +20,7 @@ class Specialization(models.Model):
 
     name = models.CharField("Название", max_length=40, unique=True)
     slug = models.SlugField("Слаг", max_length=40, unique=True)
+    updated = models.DateTimeField("Обновлено", auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Направление"
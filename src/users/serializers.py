@@ -3,6 +3,7 @@ from rest_framework import serializers
 
 from .models import Specialization, User
 from .utils import check_birth_date
+from api.services.reference_cache import ReferencePrimaryKeyRelatedField
 from applications.serializers import NotificationSettingsSerializer
 
 
@@ -46,7 +47,7 @@ class UserSerializer(serializers.ModelSerializer):
 class UserUpdateSerializer(UserSerializer):
     """Serializer to update data in the user's personal account."""
 
-    specializations = serializers.PrimaryKeyRelatedField(
+    specializations = ReferencePrimaryKeyRelatedField(
         queryset=Specialization.objects.all(), many=True, required=False
     )
 